@@ -65,6 +65,8 @@ run_ci () {
   # Check production settings for gunicorn:
   gunicorn --check-config --config python:docker.django.gunicorn_config \
     server.wsgi
+  gunicorn --check-config --config python:docker.django.gunicorn_asgi_config \
+    server.asgi
 
   # Checking if all the dependencies are secure and do not have any
   # known vulnerabilities:
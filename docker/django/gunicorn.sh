@@ -33,9 +33,23 @@ find /var/www/django/static -type f \
   -exec brotli --force --best {} \+ \
   -exec gzip --force --keep --best {} \+
 
+# Metrics of all workers are stored in shared memory,
+# see `server/common/metrics.py`:
+export PROMETHEUS_MULTIPROC_DIR='/dev/shm/prometheus'
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 # Start gunicorn:
 # Docs: http://docs.gunicorn.org/en/stable/settings.html
-# Make sure it is in sync with `django/ci.sh` check:
-/usr/local/bin/gunicorn \
-  --config python:docker.django.gunicorn_config \
-  server.wsgi
+# Make sure it is in sync with `django/ci.sh` check.
+# Set `DJANGO_SERVER_MODE=asgi` to run async views with `uvicorn` workers:
+: "${DJANGO_SERVER_MODE:=wsgi}"
+if [ "$DJANGO_SERVER_MODE" = 'asgi' ]; then
+  /usr/local/bin/gunicorn \
+    --config python:docker.django.gunicorn_asgi_config \
+    server.asgi
+else
+  /usr/local/bin/gunicorn \
+    --config python:docker.django.gunicorn_config \
+    server.wsgi
+fi
@@ -0,0 +1,21 @@
+# Gunicorn configuration file for ASGI mode with `uvicorn` workers
+# https://www.uvicorn.org/deployment/#gunicorn
+# It shares all the other settings with the default WSGI one.
+
+from docker.django.gunicorn_config import (  # noqa: F401, WPS235
+    bind,
+    chdir,
+    child_exit,
+    log_file,
+    max_requests,
+    max_requests_jitter,
+    on_starting,
+    post_worker_init,
+    pre_fork,
+    worker_tmp_dir,
+    workers,
+)
+
+# Each worker runs an event loop and serves many concurrent requests,
+# while our async views are waiting for Placeholder API:
+worker_class = 'uvicorn.workers.UvicornWorker'
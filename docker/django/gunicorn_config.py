@@ -3,6 +3,8 @@
 # https://docs.gunicorn.org/en/stable/settings.html
 
 import multiprocessing
+import os
+import threading
 
 bind = '0.0.0.0:8000'
 # Concerning `workers` setting see:
@@ -15,3 +17,53 @@ max_requests_jitter = 400
 log_file = '-'
 chdir = '/code'
 worker_tmp_dir = '/dev/shm'  # noqa: S108
+
+
+def pre_fork(server, worker) -> None:
+    """Each worker counts its password hashing slots, see `hashers.py`."""
+    from server.apps.identity.intrastructure.django import (  # noqa: WPS433
+        hashers,
+    )
+
+    hashers.held_slots.cache_clear()
+    worker.held_hashing_slots = hashers.held_slots()
+
+
+def child_exit(server, worker) -> None:
+    """Metrics and hashing slots of dead workers must be freed."""
+    from prometheus_client import multiprocess  # noqa: WPS433
+
+    from server.apps.identity.intrastructure.django import (  # noqa: WPS433
+        hashers,
+    )
+
+    multiprocess.mark_process_dead(worker.pid)  # see `gunicorn.sh`
+    # Killed workers, like ones after `timeout`, cannot free them:
+    for _ in range(worker.held_hashing_slots.value):
+        hashers.hashing_slots().release()
+
+
+def on_starting(server) -> None:
+    """Password hashing slots are shared by all workers, see `hashers.py`."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    from server.apps.identity.intrastructure.django import (  # noqa: WPS433
+        hashers,
+    )
+
+    hashers.hashing_slots()
+
+
+def post_worker_init(worker) -> None:
+    """Picture feed is cached in background, so it does not delay the boot."""
+    from server.apps.pictures.container import container  # noqa: WPS433
+    from server.apps.pictures.logic.usecases import (  # noqa: WPS433
+        pictures_fetch,
+    )
+
+    # Requests that come first fetch the feed themselves, like on cache miss:
+    threading.Thread(
+        target=container.resolve(pictures_fetch.PicturesWarmUp),
+        kwargs={'force': False},
+        name='pictures-warm-up',
+        daemon=True,
+    ).start()
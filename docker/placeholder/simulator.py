@@ -0,0 +1,189 @@
+"""
+Local stand-in for :term:`Placeholder API`.
+
+It serves the same endpoints we use, with configurable latency,
+error rate and payload size. So we can run load tests
+without hammering the real API. Run it with:
+
+.. code:: bash
+
+  python docker/placeholder/simulator.py --latency 50 --error-rate 0.01
+
+Options can also be set with ``PLACEHOLDER_SIMULATOR_*`` env variables.
+"""
+
+import argparse
+import itertools
+import logging
+import os
+import random
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+
+_USER_PATH = re.compile(r'^/users/(?P<lead_id>\d+)$')
+_ALBUM_SIZE = 50
+_FIRST_LEAD_ID = 11  # the real API has 10 users
+_lead_ids = itertools.count(_FIRST_LEAD_ID)
+_lead_ids_lock = threading.Lock()
+
+_logger = logging.getLogger(__name__)
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    """Serves ``/photos`` and ``/users`` like the real API does."""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real API
+    disable_nagle_algorithm = True
+
+    #: Configuration, see :func:`create_server`:
+    latency: float = 0
+    error_rate: float = 0
+    photos: int = 5000
+
+    def do_GET(self) -> None:  # noqa: N802
+        """List photos, ``_limit`` query parameter is supported."""
+        self._read_body()
+        url = urlsplit(self.path)
+        if url.path != '/photos':
+            return self._respond(HTTPStatus.NOT_FOUND, {})
+        limits = parse_qs(url.query).get('_limit', [str(self.photos)])
+        return self._respond(
+            HTTPStatus.OK,
+            _photos(min(int(limits[0]), self.photos)),
+        )
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Create user, new ``id`` is returned."""
+        if self.path != '/users':
+            return self._respond(HTTPStatus.NOT_FOUND, {})
+        with _lead_ids_lock:
+            lead_id = next(_lead_ids)
+        return self._respond(HTTPStatus.CREATED, {
+            **self._read_json(),
+            'id': lead_id,
+        })
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        """Update user, nothing is stored."""
+        match = _USER_PATH.match(self.path)
+        if not match:
+            return self._respond(HTTPStatus.NOT_FOUND, {})
+        return self._respond(HTTPStatus.OK, {
+            **self._read_json(),
+            'id': int(match.group('lead_id')),
+        })
+
+    def log_message(self, *args: Any) -> None:
+        """Requests are not logged, there are too many of them."""
+
+    def _read_body(self) -> bytes:
+        # Request body must be read, so the connection can be reused:
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _read_json(self) -> Dict[str, Any]:
+        body = self._read_body()
+        return orjson.loads(body) if body else {}
+
+    def _respond(self, status: HTTPStatus, payload: Any) -> None:
+        time.sleep(self.latency)
+        if random.random() < self.error_rate:  # noqa: S311
+            status, payload = HTTPStatus.SERVICE_UNAVAILABLE, {}
+        body = orjson.dumps(payload)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(
+    *,
+    host: str = '127.0.0.1',
+    port: int = 0,
+    latency: float = 0,
+    error_rate: float = 0,
+    photos: int = 5000,
+) -> ThreadingHTTPServer:
+    """
+    Create the simulator, call ``serve_forever()`` to start it.
+
+    ``latency`` is in seconds, ``error_rate`` is a share
+    of ``503`` responses, ``photos`` is the max number of listed photos.
+    Port ``0`` means any free one, see ``server_port``.
+    """
+    handler_class = type('SimulatorHandler', (SimulatorHandler,), {
+        'latency': latency,
+        'error_rate': error_rate,
+        'photos': photos,
+    })
+    server = ThreadingHTTPServer((host, port), handler_class)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--host', default=_env('HOST', '0.0.0.0'),  # noqa: S104
+    )
+    parser.add_argument('--port', type=int, default=_env('PORT', '8080'))
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=_env('LATENCY', '0'),
+        help='Delay of each response in milliseconds.',
+    )
+    parser.add_argument(
+        '--error-rate',
+        type=float,
+        default=_env('ERROR_RATE', '0'),
+        help='Share of 503 responses, from 0 to 1.',
+    )
+    parser.add_argument(
+        '--photos',
+        type=int,
+        default=_env('PHOTOS', '5000'),
+        help='How many photos are listed without `_limit`.',
+    )
+    args = parser.parse_args(argv)
+    server = create_server(
+        host=args.host,
+        port=args.port,
+        latency=args.latency / 1000,
+        error_rate=args.error_rate,
+        photos=args.photos,
+    )
+    logging.basicConfig(level=logging.INFO)
+    _logger.info('Serving on port %s', server.server_port)  # noqa: WPS323
+    server.serve_forever()
+
+
+def _env(name: str, default: str) -> str:
+    return os.environ.get('PLACEHOLDER_SIMULATOR_{0}'.format(name), default)
+
+
+def _photos(limit: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            'albumId': (index - 1) // _ALBUM_SIZE + 1,
+            'id': index,
+            'title': 'photo {0}'.format(index),
+            'url': 'https://via.placeholder.com/600/{0:06x}'.format(index),
+            'thumbnailUrl': 'https://via.placeholder.com/150/{0:06x}'.format(
+                index,
+            ),
+        }
+        for index in range(1, limit + 1)
+    ]
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,18 @@
+"""
+URL mapping of django-admin and its docs.
+
+They are rarely used, so in production they are only imported
+on the first request to them, see ``ADMIN_LAZY_LOAD`` setting.
+"""
+
+from django.contrib import admin
+from django.contrib.admindocs import urls as admindocs_urls
+from django.urls import include, path
+
+# `SimpleAdminConfig` does not do it on boot:
+admin.autodiscover()
+
+urlpatterns = [
+    path('doc/', include(admindocs_urls)),
+    path('', admin.site.urls),
+]
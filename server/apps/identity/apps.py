@@ -0,0 +1,48 @@
+from typing import final
+
+import punq
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+@final
+class IdentityConfig(AppConfig):
+    """Configuration of the identity app."""
+
+    name = 'server.apps.identity'
+
+    def ready(self) -> None:
+        """Connect signals and register dependencies of the app."""
+        from server.apps.identity.intrastructure.django import (  # noqa: WPS433
+            auth,
+        )
+        from server.apps.identity.models import User  # noqa: WPS433
+
+        # Cached users must be invalidated when they are changed:
+        post_save.connect(auth.invalidate_user_on_change, sender=User)
+        post_delete.connect(auth.invalidate_user_on_change, sender=User)
+        _register_dependencies()
+
+
+def _register_dependencies() -> None:
+    from server.apps.identity.container import container  # noqa: WPS433
+    from server.apps.identity.logic.usecases import (  # noqa: WPS433
+        lead_outbox_enqueue,
+        lead_outbox_process,
+        lead_reconcile,
+        user_create_new,
+        user_update,
+    )
+
+    # Use-cases are stateless, so each worker builds them only once:
+    usecases = (
+        lead_outbox_enqueue.LeadOutboxEnqueue,
+        lead_outbox_process.LeadOutboxProcess,
+        lead_reconcile.LeadReconcile,
+        user_create_new.UserCreateNew,
+        user_create_new.AsyncUserCreateNew,
+        user_update.UserUpdate,
+        user_update.AsyncUserUpdate,
+    )
+    for usecase in usecases:
+        container.register(usecase, scope=punq.Scope.singleton)
@@ -0,0 +1,55 @@
+import functools
+from typing import Any, Iterable, Optional, cast
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+
+from server.apps.identity.models import User
+from server.common.django.types import Settings
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Loads logged in users from cache, not from the database.
+
+    Cached users are invalidated on each save, see :func:`invalidate_users`.
+    Queryset updates do not send signals, call it manually after commit.
+    """
+
+    def get_user(self, user_id: Any) -> Optional[User]:
+        """Called by ``AuthenticationMiddleware`` on each request."""
+        cache = _cache()
+        user = cache.get(_cache_key(user_id))
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            cache.set(_cache_key(user_id), user)
+        return user if self.user_can_authenticate(user) else None
+
+
+def invalidate_users(user_ids: Iterable[Any]) -> None:
+    """Removes users from cache, so they are loaded again."""
+    _cache().delete_many([
+        _cache_key(user_id) for user_id in user_ids
+    ])
+
+
+def invalidate_user_on_change(instance: User, **kwargs: Any) -> None:
+    """
+    Signal handler for ``post_save`` and ``post_delete``.
+
+    Users are invalidated after the commit, otherwise other requests
+    can cache them again before the change is visible.
+    """
+    transaction.on_commit(functools.partial(invalidate_users, [instance.pk]))
+
+
+def _cache() -> BaseCache:
+    return caches[cast(Settings, settings).IDENTITY_USER_CACHE]
+
+
+def _cache_key(user_id: Any) -> str:
+    return 'identity:user:{0}'.format(user_id)
@@ -1,7 +1,12 @@
-from typing import Any, Callable, TypeVar
+import functools
+from http import HTTPStatus
+from typing import Any, Callable, TypeVar, cast
 
 from django.conf import settings
 from django.contrib.auth.decorators import user_passes_test
+from django.http import HttpRequest, HttpResponse
+
+from server.common.services import resilience
 
 _CallableT = TypeVar('_CallableT', bound=Callable[..., Any])
 
@@ -16,3 +21,14 @@ def redirect_logged_in_users(
         login_url=settings.LOGIN_REDIRECT_URL,
         redirect_field_name=redirect_field_name,
     )
+
+
+def reject_when_hashing_unavailable(view: _CallableT) -> _CallableT:
+    """Decorator for views that hash passwords, busy hashers return ``503``."""
+    @functools.wraps(view)
+    def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return view(request, *args, **kwargs)
+        except resilience.ServiceUnavailableError:
+            return HttpResponse(status=HTTPStatus.SERVICE_UNAVAILABLE)
+    return cast(_CallableT, wrapper)
@@ -0,0 +1,180 @@
+"""
+Password hashing that does not starve our workers.
+
+Hashing is slow on purpose, it takes most of the CPU time
+of login and registration requests. So, only a few passwords
+are hashed at the same time, bursts of logins wait for their turn
+and other requests still get the CPU.
+"""
+
+import contextlib
+import functools
+import multiprocessing
+import statistics
+import time
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import BoundedSemaphore
+from typing import Iterator, Optional, Sequence, cast, final
+
+import argon2
+import attr
+import structlog
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from server.common.django.types import Settings
+from server.common.services import resilience
+
+_logger = structlog.get_logger(__name__)
+
+#: Passwords are not used, only the time to hash them:
+_CALIBRATION_SECRET = b'calibration'
+_CALIBRATION_SALT = b'calibration-salt'
+
+
+@final
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """
+    Argon2 with the cost from our settings.
+
+    Pick it for your servers with ``manage.py calibrate_hashers``.
+    Passwords with the old cost are rehashed on the next login.
+    """
+
+    def encode(self, password: str, salt: str) -> str:
+        """Hash the password, when there's a free hashing slot."""
+        with _hashing_slot():
+            return super().encode(password, salt)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """Check the password, when there's a free hashing slot."""
+        with _hashing_slot():
+            return super().verify(password, encoded)
+
+    def params(self) -> argon2.Parameters:  # noqa: WPS110
+        """Parameters for new hashes."""
+        config = cast(Settings, settings)
+        return argon2.Parameters(
+            type=argon2.low_level.Type.ID,
+            version=argon2.low_level.ARGON2_VERSION,
+            salt_len=argon2.DEFAULT_RANDOM_SALT_LENGTH,
+            hash_len=argon2.DEFAULT_HASH_LENGTH,
+            time_cost=config.PASSWORD_ARGON2_TIME_COST,
+            memory_cost=config.PASSWORD_ARGON2_MEMORY_COST,
+            parallelism=config.PASSWORD_ARGON2_PARALLELISM,
+        )
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class Argon2Profile(object):
+    """Argon2 cost and the time (in seconds) to hash a password with it."""
+
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    duration: float
+
+
+def calibrate(
+    *,
+    target: float,
+    memory_costs: Sequence[int],
+    parallelism: int,
+    rounds: int,
+) -> Optional[Argon2Profile]:
+    """
+    Find the highest Argon2 cost that hashes faster than ``target`` seconds.
+
+    More memory is preferred over more time, it is harder to crack.
+    Returns ``None`` when even the cheapest cost is too slow.
+    """
+    for memory_cost in sorted(memory_costs, reverse=True):
+        profile = None
+        time_cost = 1
+        while True:
+            candidate = Argon2Profile(
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+                duration=_measure(time_cost, memory_cost, parallelism, rounds),
+            )
+            if candidate.duration > target:
+                break
+            profile = candidate
+            time_cost += 1
+        if profile is not None:
+            return profile
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def hashing_slots() -> BoundedSemaphore:
+    """
+    Slots for concurrent hashing, shared with processes forked after this.
+
+    ``gunicorn`` creates them before it starts workers,
+    so hashing is bounded on the whole host, not in a single worker.
+    """
+    return multiprocessing.BoundedSemaphore(
+        cast(Settings, settings).PASSWORD_HASHING_CONCURRENCY,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def held_slots() -> 'Synchronized[int]':
+    """
+    How many slots the current worker holds right now.
+
+    ``gunicorn`` creates it for each worker before it is forked,
+    so slots of killed workers are released, see ``gunicorn_config.py``.
+    """
+    return cast('Synchronized[int]', multiprocessing.Value('i', 0))
+
+
+@contextlib.contextmanager
+def _hashing_slot() -> Iterator[None]:
+    slots = hashing_slots()
+    # Lost slots must not block logins forever, so we don't wait forever:
+    acquired = slots.acquire(
+        timeout=cast(Settings, settings).PASSWORD_HASHING_TIMEOUT,
+    )
+    if not acquired:
+        _logger.warning(
+            'password_hashing_slots_exhausted',
+            slots=cast(Settings, settings).PASSWORD_HASHING_CONCURRENCY,
+        )
+        # Hashing without a slot would starve all workers on the host:
+        raise resilience.ServiceUnavailableError('No free hashing slots')
+
+    held = held_slots()
+    with held.get_lock():
+        held.value += 1
+    try:
+        yield
+    finally:
+        with held.get_lock():
+            held.value -= 1
+        slots.release()
+
+
+def _measure(
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+    rounds: int,
+) -> float:
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        argon2.low_level.hash_secret(
+            _CALIBRATION_SECRET,
+            _CALIBRATION_SALT,
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            hash_len=argon2.DEFAULT_HASH_LENGTH,
+            type=argon2.low_level.Type.ID,
+        )
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
@@ -1,14 +1,16 @@
 from typing import Dict, final
 
+import attr
+import orjson
 import requests
 
 from server.apps.identity.models import User
-from server.common import pydantic_model
 from server.common.services import http
 
 
 @final
-class UserResponse(pydantic_model.BaseModel):
+@attr.dataclass(frozen=True, slots=True)
+class UserResponse(object):
     """Schema for API response with :term:`lead_id`."""
 
     id: int
@@ -27,13 +29,12 @@ class LeadCreate(http.BaseFetcher):
         user: User,
     ) -> UserResponse:
         """Create remote user and return assigned ids."""
-        response = requests.post(
+        response = self.session().post(
             self.url_path(),
             json=_serialize_user(user),
             timeout=self._api_timeout,
         )
-        response.raise_for_status()
-        return UserResponse.parse_raw(response.text)
+        return _parse_user(response)
 
 
 @final
@@ -48,7 +49,7 @@ class LeadUpdate(http.BaseFetcher):
         user: User,
     ) -> None:
         """Update remote user."""
-        response = requests.patch(
+        response = self.session().patch(
             self.url_path().format(user.lead_id),
             json=_serialize_user(user),
             timeout=self._api_timeout,
@@ -56,6 +57,54 @@ class LeadUpdate(http.BaseFetcher):
         response.raise_for_status()
 
 
+@final
+class AsyncLeadCreate(http.AsyncBaseFetcher):
+    """Async version of :class:`LeadCreate`."""
+
+    _url_path = '/users'
+
+    async def __call__(
+        self,
+        *,
+        user: User,
+    ) -> UserResponse:
+        """Create remote user without blocking the event loop."""
+        response = await self.request(
+            'post',
+            self.url_path(),
+            json=_serialize_user(user),
+        )
+        return _parse_user(response)
+
+
+@final
+class AsyncLeadUpdate(http.AsyncBaseFetcher):
+    """Async version of :class:`LeadUpdate`."""
+
+    _url_path = '/users/{0}'
+
+    async def __call__(
+        self,
+        *,
+        user: User,
+    ) -> None:
+        """Update remote user without blocking the event loop."""
+        response = await self.request(
+            'patch',
+            self.url_path().format(user.lead_id),
+            json=_serialize_user(user),
+        )
+        response.raise_for_status()
+
+
+def _parse_user(response: requests.Response) -> UserResponse:
+    response.raise_for_status()
+    try:
+        return UserResponse(id=int(orjson.loads(response.content)['id']))
+    except (KeyError, TypeError) as exc:
+        raise ValueError('Invalid user response') from exc
+
+
 def _serialize_user(user: User) -> Dict[str, str]:
     if user.date_of_birth is not None:
         date_of_birth = user.date_of_birth.strftime('%d.%m.%Y')
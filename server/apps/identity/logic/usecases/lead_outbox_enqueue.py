@@ -0,0 +1,39 @@
+from typing import final
+
+import attr
+from django.db import models
+
+from server.apps.identity.models import LeadOutbox, User
+from server.common import metrics
+
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class LeadOutboxEnqueue(object):
+    """
+    Schedule sync of a :term:`user` with :term:`Placeholder API`.
+
+    New users are created there, existing ones are updated.
+    The actual request is sent later by :class:`LeadOutboxProcess`.
+    When the user is already pending, we only bump the entry's revision:
+    so several edits in a row result in a single request.
+
+    .. warning:
+        This use-case does not handle transactions!
+        Call it in the same transaction that saves the user.
+
+    """
+
+    def __call__(self, user: User) -> None:
+        """Put the user into the outbox."""
+        pending = LeadOutbox.objects.filter(user=user).update(
+            revision=models.F('revision') + 1,
+            attempts=0,
+        )
+        if not pending:
+            # Other request might have inserted the same user already:
+            LeadOutbox.objects.bulk_create(
+                [LeadOutbox(user=user)],
+                ignore_conflicts=True,
+            )
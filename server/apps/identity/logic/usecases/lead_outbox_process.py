@@ -0,0 +1,166 @@
+import datetime as dt
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, final
+
+import attr
+import structlog
+from django.db import models, transaction
+from django.utils import timezone
+
+from server.apps.identity.intrastructure.django.auth import invalidate_users
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.models import LeadOutbox, User
+from server.common import metrics
+from server.common.django.types import Settings
+from server.common.services import resilience
+
+_logger = structlog.get_logger(__name__)
+
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class LeadOutboxProcess(object):
+    """
+    Send one batch of :term:`user` items from the outbox to the API.
+
+    Users without :term:`lead_id` are created, others are updated.
+    Requests are sent concurrently, at most ``LEAD_OUTBOX_CONCURRENCY``
+    at a time. Claimed rows are leased, so several workers can run
+    in parallel. Sent rows are removed, unless they were changed meanwhile.
+    Failed ones are retried with exponential delay,
+    until ``LEAD_OUTBOX_MAX_ATTEMPTS`` is reached.
+    While the API's circuit breaker is open, nothing is sent
+    and rejected rows are deferred without spending their attempts.
+    Returns the number of claimed rows.
+    """
+
+    _settings: Settings
+
+    def __call__(self) -> int:
+        """Execute the usecase."""
+        api_url = self._settings.PLACEHOLDER_API_URL
+        if resilience.circuit_breaker(api_url).is_open():
+            _logger.info('lead_sync_deferred')
+            return 0
+
+        batch = self._claim()
+        with ThreadPoolExecutor(
+            max_workers=self._settings.LEAD_OUTBOX_CONCURRENCY,
+        ) as executor:
+            errors = list(executor.map(self._send, batch))
+
+        self._save(*_partition(batch, errors))
+        return len(batch)
+
+    def _claim(self) -> List[LeadOutbox]:
+        now = timezone.now()
+        with transaction.atomic():
+            batch = list(
+                LeadOutbox.objects.select_for_update(
+                    skip_locked=True,
+                    of=('self',),
+                ).select_related(
+                    'user',
+                ).filter(
+                    available_at__lte=now,
+                    attempts__lt=self._settings.LEAD_OUTBOX_MAX_ATTEMPTS,
+                ).order_by('available_at')[
+                    :self._settings.LEAD_OUTBOX_BATCH_SIZE
+                ],
+            )
+            LeadOutbox.objects.filter(
+                pk__in=[entry.pk for entry in batch],
+            ).update(
+                available_at=now + dt.timedelta(
+                    seconds=self._settings.LEAD_OUTBOX_LEASE,
+                ),
+            )
+        return batch
+
+    def _send(self, entry: LeadOutbox) -> Optional[Exception]:
+        """Runs in a thread, must not touch the database."""
+        try:
+            if entry.user.lead_id is None:
+                entry.user.lead_id = self._create_lead(entry.user).id
+            else:
+                self._update_lead(entry.user)
+        except resilience.ServiceUnavailableError as unavailable:
+            return unavailable
+        except Exception as exc:
+            _logger.exception('lead_sync_failed', user=entry.user_id)
+            return exc
+        return None
+
+    def _create_lead(self, user: User) -> placeholder.UserResponse:
+        return placeholder.LeadCreate(
+            api_url=self._settings.PLACEHOLDER_API_URL,
+            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+        )(user=user)
+
+    def _update_lead(self, user: User) -> None:
+        return placeholder.LeadUpdate(
+            api_url=self._settings.PLACEHOLDER_API_URL,
+            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+        )(user=user)
+
+    def _save(
+        self,
+        sent: List[LeadOutbox],
+        failed: List[LeadOutbox],
+        deferred: List[LeadOutbox],
+    ) -> None:
+        now = timezone.now()
+        unchanged = models.Q(pk__in=[])
+        for done in sent:
+            unchanged |= models.Q(pk=done.pk, revision=done.revision)
+        for retry in failed:
+            retry.attempts += 1
+            retry.available_at = now + dt.timedelta(
+                seconds=self._settings.LEAD_OUTBOX_RETRY_DELAY * (
+                    2 ** (retry.attempts - 1)
+                ),
+            )
+        for later in deferred:
+            later.available_at = now + dt.timedelta(
+                seconds=self._settings.PLACEHOLDER_API_BREAKER_RESET,
+            )
+
+        with transaction.atomic():
+            User.objects.bulk_update(
+                [entry.user for entry in sent],
+                ['lead_id'],
+            )
+            transaction.on_commit(functools.partial(
+                invalidate_users,
+                [entry.user_id for entry in sent],
+            ))
+            # Users that were changed during the request are synced again:
+            LeadOutbox.objects.filter(unchanged).delete()
+            LeadOutbox.objects.filter(
+                pk__in=[entry.pk for entry in sent],
+            ).update(available_at=now)
+            LeadOutbox.objects.bulk_update(
+                failed + deferred,
+                ['attempts', 'available_at', 'last_error'],
+            )
+
+
+def _partition(
+    batch: List[LeadOutbox],
+    errors: Sequence[Optional[Exception]],
+) -> Tuple[List[LeadOutbox], List[LeadOutbox], List[LeadOutbox]]:
+    """Splits the batch into sent, failed and deferred rows."""
+    sent: List[LeadOutbox] = []
+    failed: List[LeadOutbox] = []
+    deferred: List[LeadOutbox] = []
+    for entry, error in zip(batch, errors):
+        entry.last_error = repr(error) if error else ''
+        if error is None:
+            sent.append(entry)
+        elif isinstance(error, resilience.ServiceUnavailableError):
+            deferred.append(entry)
+        else:
+            failed.append(entry)
+    return sent, failed, deferred
@@ -0,0 +1,145 @@
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple, final
+
+import attr
+import structlog
+from django.db import models, transaction
+
+from server.apps.identity.intrastructure.django.auth import invalidate_users
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.models import LeadOutbox, User
+from server.common.django.types import Settings
+from server.common.services import resilience
+
+_logger = structlog.get_logger(__name__)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class LeadReconcile(object):
+    """
+    Create missing :term:`lead_id` of all :term:`user` items.
+
+    Users are read in chunks of ``LEAD_RECONCILE_CHUNK_SIZE``
+    with the partial index of users without :term:`lead_id`.
+    Users with pending outbox rows are skipped, they are synced by
+    the outbox worker. Requests are sent concurrently, at most
+    ``LEAD_RECONCILE_CONCURRENCY`` at a time and
+    ``LEAD_RECONCILE_RATE`` per second. Each chunk is saved at once,
+    users synced by the outbox worker meanwhile keep their :term:`lead_id`.
+    Failed users are left for the next run. When the API's circuit breaker
+    opens, we stop. Returns the numbers of reconciled and failed users.
+    """
+
+    _settings: Settings
+
+    def __call__(self) -> Tuple[int, int]:
+        """Execute the usecase."""
+        throttle = _Throttle(self._settings.LEAD_RECONCILE_RATE)
+        reconciled = 0
+        processed = 0
+        with ThreadPoolExecutor(
+            max_workers=self._settings.LEAD_RECONCILE_CONCURRENCY,
+        ) as executor:
+            for chunk in self._chunks():
+                if self._is_unavailable():
+                    break
+                reconciled += self._save(chunk, list(executor.map(
+                    functools.partial(self._create_lead, throttle),
+                    chunk,
+                )))
+                processed += len(chunk)
+        return reconciled, processed - reconciled
+
+    def _chunks(self) -> Iterator[List[User]]:
+        last_pk = 0
+        while True:
+            chunk = list(
+                User.objects.filter(
+                    lead_id__isnull=True,
+                    pk__gt=last_pk,
+                ).exclude(
+                    lead_outbox__attempts__lt=(
+                        self._settings.LEAD_OUTBOX_MAX_ATTEMPTS
+                    ),
+                ).order_by('pk')[:self._settings.LEAD_RECONCILE_CHUNK_SIZE],
+            )
+            if not chunk:
+                return
+            yield chunk
+            last_pk = chunk[-1].pk
+
+    def _is_unavailable(self) -> bool:
+        api_url = self._settings.PLACEHOLDER_API_URL
+        if resilience.circuit_breaker(api_url).is_open():
+            _logger.info('lead_reconcile_deferred')
+            return True
+        return False
+
+    def _create_lead(self, throttle: '_Throttle', user: User) -> Optional[int]:
+        """Runs in a thread, must not touch the database."""
+        throttle()
+        try:
+            return placeholder.LeadCreate(
+                api_url=self._settings.PLACEHOLDER_API_URL,
+                api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+            )(user=user).id
+        except resilience.ServiceUnavailableError:
+            return None
+        except Exception:
+            _logger.exception('lead_reconcile_failed', user=user.pk)
+            return None
+
+    def _save(
+        self,
+        chunk: List[User],
+        lead_ids: Sequence[Optional[int]],
+    ) -> int:
+        synced = {
+            user.pk: lead_id
+            for user, lead_id in zip(chunk, lead_ids)
+            if lead_id is not None
+        }
+        if not synced:
+            return 0
+
+        with transaction.atomic():
+            # The outbox worker could sync them meanwhile, its values win:
+            saved = User.objects.filter(
+                pk__in=synced,
+                lead_id__isnull=True,
+            ).update(lead_id=models.Case(*[
+                models.When(pk=user_id, then=models.Value(lead_id))
+                for user_id, lead_id in synced.items()
+            ]))
+            transaction.on_commit(functools.partial(
+                invalidate_users,
+                list(synced),
+            ))
+            # Rows that were given up on are resolved now:
+            LeadOutbox.objects.filter(
+                user__in=list(synced),
+                attempts__gte=self._settings.LEAD_OUTBOX_MAX_ATTEMPTS,
+            ).delete()
+        return saved
+
+
+@final
+class _Throttle(object):
+    """Spaces calls evenly, so there are at most ``rate`` per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next_call = time.monotonic()
+
+    def __call__(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(self._next_call, now) + self._interval
+        if delay > 0:
+            time.sleep(delay)
@@ -1,13 +1,16 @@
 from typing import final
 
 import attr
+from asgiref.sync import sync_to_async
 
 from server.apps.identity.intrastructure.services import placeholder
 from server.apps.identity.models import User
+from server.common import metrics
 from server.common.django.types import Settings
 
 
 @final
+@metrics.measured(metrics.USECASE_LATENCY)
 @attr.dataclass(slots=True, frozen=True)
 class UserCreateNew(object):
     """
@@ -30,7 +33,7 @@ class UserCreateNew(object):
         https://sobolevn.me/2019/02/engineering-guide-to-user-stories
         """
         new_ids = self._create_lead(user)
-        return self._update_user_ids(user, new_ids)
+        return _update_user_ids(user, new_ids)
 
     def _create_lead(self, user: User) -> placeholder.UserResponse:
         return placeholder.LeadCreate(
@@ -38,11 +41,34 @@ class UserCreateNew(object):
             api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
         )(user=user)
 
-    def _update_user_ids(
-        self,
-        user: User,
-        new_ids: placeholder.UserResponse,
-    ) -> None:
-        # This can be moved to some other place once this becomes too complex:
-        user.lead_id = new_ids.id
-        user.save(update_fields=['lead_id'])
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class AsyncUserCreateNew(object):
+    """
+    Async version of :class:`UserCreateNew`.
+
+    .. warning:
+        This use-case does not handle transactions!
+
+    """
+
+    _settings: Settings
+
+    async def __call__(self, user: User) -> None:
+        """Execute the usecase without blocking the event loop."""
+        new_ids = await self._create_lead(user)
+        return await sync_to_async(_update_user_ids)(user, new_ids)
+
+    async def _create_lead(self, user: User) -> placeholder.UserResponse:
+        return await placeholder.AsyncLeadCreate(
+            api_url=self._settings.PLACEHOLDER_API_URL,
+            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+        )(user=user)
+
+
+def _update_user_ids(user: User, new_ids: placeholder.UserResponse) -> None:
+    # This can be moved to some other place once this becomes too complex:
+    user.lead_id = new_ids.id
+    user.save(update_fields=['lead_id'])
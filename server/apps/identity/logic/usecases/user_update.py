@@ -4,10 +4,12 @@ import attr
 
 from server.apps.identity.intrastructure.services import placeholder
 from server.apps.identity.models import User
+from server.common import metrics
 from server.common.django.types import Settings
 
 
 @final
+@metrics.measured(metrics.USECASE_LATENCY)
 @attr.dataclass(slots=True, frozen=True)
 class UserUpdate(object):
     """
@@ -31,3 +33,28 @@ class UserUpdate(object):
             api_url=self._settings.PLACEHOLDER_API_URL,
             api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
         )(user=user)
+
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class AsyncUserUpdate(object):
+    """
+    Async version of :class:`UserUpdate`.
+
+    .. warning:
+        This use-case does not handle transactions!
+
+    """
+
+    _settings: Settings
+
+    async def __call__(self, user: User) -> None:
+        """Update existing user without blocking the event loop."""
+        return await self._update_lead(user)
+
+    async def _update_lead(self, user: User) -> None:
+        return await placeholder.AsyncLeadUpdate(
+            api_url=self._settings.PLACEHOLDER_API_URL,
+            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+        )(user=user)
@@ -0,0 +1,99 @@
+import os
+from typing import Any, final
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from server.apps.identity.container import container
+from server.apps.identity.intrastructure.django import hashers
+from server.common.django.types import Settings
+
+#: Memory costs (in KiB) we try, from the strongest to the smallest one
+#: recommended by OWASP:
+_MEMORY_COSTS = (262144, 102400, 65536, 19456)
+
+#: Default target latency (in ms) of a single hash:
+_TARGET = 250
+
+
+@final
+class Command(BaseCommand):
+    """Picks Argon2 cost for this host."""
+
+    help = 'Benchmarks Argon2 cost and prints settings for a target latency.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define command options."""
+        parser.add_argument(
+            '--target',
+            type=float,
+            default=_TARGET,
+            help='Max time to hash a password, in milliseconds.',
+        )
+        parser.add_argument(
+            '--memory-cost',
+            type=int,
+            action='append',
+            dest='memory_costs',
+            help='Memory cost to try, in KiB. Can be given several times.',
+        )
+        parser.add_argument(
+            '--parallelism',
+            type=int,
+            help='Threads per hash, current setting by default.',
+        )
+        parser.add_argument(
+            '--rounds',
+            type=int,
+            default=3,
+            help='How many times each cost is measured.',
+        )
+        parser.add_argument(
+            '--output',
+            help='File to write the profile to, it is printed by default.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Measure the cost and write the profile."""
+        parallelism = (
+            options['parallelism'] or
+            container.resolve(Settings).PASSWORD_ARGON2_PARALLELISM
+        )
+        profile = hashers.calibrate(
+            target=options['target'] / 1000,
+            memory_costs=options['memory_costs'] or _MEMORY_COSTS,
+            parallelism=parallelism,
+            rounds=options['rounds'],
+        )
+        if profile is None:
+            raise CommandError(
+                'Even the cheapest cost is slower than {0}ms'.format(
+                    options['target'],
+                ),
+            )
+
+        lines = _profile_lines(profile)
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                output.write(lines)
+        else:
+            self.stdout.write(lines, ending='')
+
+
+def _profile_lines(profile: hashers.Argon2Profile) -> str:
+    # Hashing gets at most half of CPUs, the rest serve other requests:
+    cpu_count = os.cpu_count() or 1
+    concurrency = max(1, cpu_count // 2 // profile.parallelism)
+    return '\n'.join((
+        '# One hash takes {0:.0f}ms on this host:'.format(
+            profile.duration * 1000,
+        ),
+        'DJANGO_PASSWORD_ARGON2_TIME_COST={0}'.format(profile.time_cost),
+        'DJANGO_PASSWORD_ARGON2_MEMORY_COST={0}'.format(profile.memory_cost),
+        'DJANGO_PASSWORD_ARGON2_PARALLELISM={0}'.format(profile.parallelism),
+        'DJANGO_PASSWORD_HASHING_CONCURRENCY={0}'.format(concurrency),
+        '',
+    ))
@@ -0,0 +1,36 @@
+import time
+from typing import Any, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.lead_outbox_process import (
+    LeadOutboxProcess,
+)
+from server.common.django.types import Settings
+
+
+@final
+class Command(BaseCommand):
+    """Worker that syncs users from the outbox with the API."""
+
+    help = 'Syncs users from the outbox with Placeholder API.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define command options."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the outbox and exit, instead of polling forever.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Process the outbox in batches."""
+        lead_outbox_process = container.resolve(LeadOutboxProcess)
+        poll_interval = container.resolve(Settings).LEAD_OUTBOX_POLL_INTERVAL
+        while True:
+            if lead_outbox_process():
+                continue
+            if options['once']:
+                return
+            time.sleep(poll_interval)
@@ -0,0 +1,20 @@
+from typing import Any, final
+
+from django.core.management.base import BaseCommand
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.lead_reconcile import LeadReconcile
+
+
+@final
+class Command(BaseCommand):
+    """Fixes users that were never synced with the API."""
+
+    help = 'Creates missing lead ids of users in Placeholder API.'
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Reconcile all users without lead ids."""
+        reconciled, failed = container.resolve(LeadReconcile)()
+        self.stdout.write(
+            'Reconciled {0} users, {1} failed.'.format(reconciled, failed),
+        )
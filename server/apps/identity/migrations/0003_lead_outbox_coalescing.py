@@ -0,0 +1,37 @@
+# Generated by Django 3.2.18 on 2026-10-18 20:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Keep a single outbox entry per user, so edits are coalesced."""
+
+    dependencies = [
+        ('identity', '0002_lead_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leadoutbox',
+            name='revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='leadoutbox',
+            name='user',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=models.CASCADE,
+                related_name='lead_outbox',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='leadoutbox',
+            constraint=models.UniqueConstraint(
+                fields=('user',),
+                name='identity_leadoutbox_user_unique',
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 3.2.18 on 2026-10-18 21:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Partial index of users that are not synced with the API yet."""
+
+    dependencies = [
+        ('identity', '0003_lead_outbox_coalescing'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(
+                condition=models.Q(lead_id__isnull=True),
+                fields=['id'],
+                name='identity_user_no_lead_idx',
+            ),
+        ),
+    ]
@@ -6,6 +6,7 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
+from django.utils import timezone
 
 from server.common.django.models import TimedMixin
 
@@ -86,7 +87,55 @@ class User(AbstractBaseUser, PermissionsMixin, TimedMixin):
         'phone',
     ]
 
+    class Meta(object):
+        indexes = [
+            # Only a few users are not synced, so this index is tiny:
+            models.Index(
+                fields=['id'],
+                name='identity_user_no_lead_idx',
+                condition=models.Q(lead_id__isnull=True),
+            ),
+        ]
+
     if TYPE_CHECKING:  # noqa: WPS604
         # Raw password that is stored in the instance before it is saved,
         # it is actually `str | None` in runtime, but `str` in most tests.
         _password: str
+
+
+@final
+class LeadOutbox(TimedMixin, models.Model):
+    """
+    Pending sync of a :term:`user` with :term:`Placeholder API`.
+
+    Rows are written in the same transaction as users are,
+    and are processed later by ``manage.py process_lead_outbox``.
+    There's at most one row per user: repeated edits are coalesced,
+    only the latest state is sent.
+    """
+
+    # Linking:
+    user = models.ForeignKey(
+        User,
+        related_name='lead_outbox',
+        on_delete=models.CASCADE,
+        db_index=False,  # unique constraint has its own index
+    )
+
+    # Processing:
+    revision = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta(object):
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user'],
+                name='identity_leadoutbox_user_unique',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Beatuful representation."""
+        return '<LeadOutbox {0} for {1}>'.format(self.pk, self.user_id)
@@ -12,34 +12,48 @@ from ratelimit.mixins import RatelimitMixin
 from server.apps.identity.container import container
 from server.apps.identity.intrastructure.django.decorators import (
     redirect_logged_in_users,
+    reject_when_hashing_unavailable,
 )
 from server.apps.identity.intrastructure.django.forms import (
     AuthenticationForm,
     RegistrationForm,
 )
-from server.apps.identity.logic.usecases.user_create_new import UserCreateNew
-from server.common.django.decorators import dispatch_decorator
+from server.apps.identity.logic.usecases.lead_outbox_enqueue import (
+    LeadOutboxEnqueue,
+)
+from server.common.django.decorators import dispatch_decorator, request_budget
 
 
 @final
+@request_budget('GET', db_queries=1)
+# `axes` logs each attempt:
+@request_budget('POST', db_queries=12)  # noqa: WPS432
 @dispatch_decorator(redirect_logged_in_users())
+@dispatch_decorator(reject_when_hashing_unavailable)
 @dispatch_decorator(axes_dispatch)
 @dispatch_decorator(sensitive_post_parameters())
-class LoginView(BaseLoginView):
+class LoginView(BaseLoginView):  # noqa: WPS216
     """More protected version of the login view."""
 
     form_class = AuthenticationForm
 
 
 @final
+@request_budget('GET', db_queries=1)
+@request_budget('POST', db_queries=6)
 @dispatch_decorator(redirect_logged_in_users())
+@dispatch_decorator(reject_when_hashing_unavailable)
 @dispatch_decorator(sensitive_post_parameters())
-class RegistrationView(RatelimitMixin, FormView[RegistrationForm]):
+class RegistrationView(  # noqa: WPS216
+    RatelimitMixin,
+    FormView[RegistrationForm],
+):
     """
     Registers users.
 
     After the registration we notify :term:`Placeholder API`
     about new users and get their ids back.
+    This is done by a separate worker, so we only write to the outbox.
     """
 
     form_class = RegistrationForm
@@ -54,8 +68,8 @@ class RegistrationView(RatelimitMixin, FormView[RegistrationForm]):
 
     def form_valid(self, form: RegistrationForm) -> HttpResponse:
         """Save user after successful validation."""
-        user_create_new = container.instantiate(UserCreateNew)
+        lead_outbox_enqueue = container.resolve(LeadOutboxEnqueue)
         with transaction.atomic():
             user = form.save()
-            user_create_new(user)  # does http request, can slow down db
+            lead_outbox_enqueue(user)
         return super().form_valid(form)
@@ -2,6 +2,7 @@ from typing import Optional, final
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpResponse
 from django.urls import reverse_lazy
@@ -11,12 +12,16 @@ from ratelimit.mixins import RatelimitMixin
 
 from server.apps.identity.container import container
 from server.apps.identity.intrastructure.django.forms import UserUpdateForm
-from server.apps.identity.logic.usecases.user_update import UserUpdate
+from server.apps.identity.logic.usecases.lead_outbox_enqueue import (
+    LeadOutboxEnqueue,
+)
 from server.apps.identity.models import User
-from server.common.django.decorators import dispatch_decorator
+from server.common.django.decorators import dispatch_decorator, request_budget
 
 
 @final
+@request_budget('GET', db_queries=1)
+@request_budget('POST', db_queries=6)  # API is called in background
 @dispatch_decorator(login_required)
 @dispatch_decorator(sensitive_post_parameters('email'))
 class UserUpdateView(RatelimitMixin, UpdateView[User, UserUpdateForm]):
@@ -44,13 +49,14 @@ class UserUpdateView(RatelimitMixin, UpdateView[User, UserUpdateForm]):
 
         In this case we need to:
         1. Show success message
-        2. Sync information with :term:`Placeholder API`
+        2. Schedule sync with :term:`Placeholder API`, it happens in background
         """
-        user_update = container.instantiate(UserUpdate)
+        lead_outbox_enqueue = container.resolve(LeadOutboxEnqueue)
 
         # Using Russian text without `gettext` is ugly, but we don't support
         # other languages at all in this demo.
         messages.success(self.request, 'Ваши данные сохранены')
-        response = super().form_valid(form)
-        user_update(self.object)
+        with transaction.atomic():
+            response = super().form_valid(form)
+            lead_outbox_enqueue(self.object)
         return response
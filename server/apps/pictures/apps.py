@@ -0,0 +1,33 @@
+from typing import final
+
+import punq
+from django.apps import AppConfig
+
+
+@final
+class PicturesConfig(AppConfig):
+    """Configuration of the pictures app."""
+
+    name = 'server.apps.pictures'
+
+    def ready(self) -> None:
+        """Register dependencies of the app."""
+        from server.apps.pictures.container import container  # noqa: WPS433
+        from server.apps.pictures.logic.usecases import (  # noqa: WPS433
+            favourites_export,
+            favourites_import,
+            favourites_list,
+            pictures_fetch,
+        )
+
+        # Use-cases are stateless, so each worker builds them only once:
+        usecases = (
+            favourites_export.FavouritesExport,
+            favourites_import.FavouritesImport,
+            favourites_list.FavouritesList,
+            pictures_fetch.PicturesFetch,
+            pictures_fetch.AsyncPicturesFetch,
+            pictures_fetch.PicturesWarmUp,
+        )
+        for usecase in usecases:
+            container.register(usecase, scope=punq.Scope.singleton)
@@ -5,8 +5,11 @@ from server.common.django.types import Settings
 
 container = punq.Container()
 
-# Custom dependencies go here:
-# TODO: add custom deps
+# Use-cases are registered in `apps.py`, they are on the higher layers.
+# Stateless ones are singletons, built once per worker. Ones with
+# per-request state must keep the default scope: new one on each resolve.
+# Use `container.resolve`, `container.instantiate` inspects
+# the signature and builds a new object on each call.
 
 # Django stuff:
 container.register(Settings, instance=settings)
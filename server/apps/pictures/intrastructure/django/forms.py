@@ -19,9 +19,17 @@ class FavouritesForm(forms.ModelForm[FavouritePicture]):
         super().__init__(*args, **kwargs)
 
     def save(self, commit: bool = True) -> FavouritePicture:
-        """Add user to the model instance."""
+        """
+        Add user to the model instance.
+
+        Adding the same picture twice is a no-op, it happens on double-clicks.
+        Primary key is not set on the returned instance.
+        """
         instance = super().save(commit=False)
         instance.user_id = self._user.id
         if commit:
-            instance.save()
+            FavouritePicture.objects.bulk_create(
+                [instance],
+                ignore_conflicts=True,
+            )
         return instance
@@ -1,21 +1,26 @@
-from typing import List, final
+from typing import Any, List, final
 
-import pydantic
+import attr
+import orjson
 import requests
 
-from server.common import pydantic_model
 from server.common.services import http
 
 
 @final
-class PictureResponse(pydantic_model.BaseModel):
-    """Schema for API response with :term:`picture` items."""
+@attr.dataclass(frozen=True, slots=True)
+class PictureResponse(object):
+    """
+    Schema for API response with :term:`picture` items.
+
+    It is a plain slotted record, not a ``pydantic`` model:
+    dashboard parses hundreds of them, validation is done by hand.
+    """
 
     id: int
     url: str
 
 
-# TODO: use redis-based caching
 @final
 class PicturesFetch(http.BaseFetcher):
     """Service around fetching pictures from :term:`Placeholder API`."""
@@ -28,10 +33,60 @@ class PicturesFetch(http.BaseFetcher):
         limit: int,
     ) -> List[PictureResponse]:
         """Create remote user and return assigned ids."""
-        response = requests.get(
+        response = self.session().get(
             self.url_path(),
             params={'_limit': limit},
             timeout=self._api_timeout,
         )
-        response.raise_for_status()
-        return pydantic.parse_raw_as(List[PictureResponse], response.text)
+        return _parse_pictures(response)
+
+    def cache_key(self, *, limit: int) -> str:
+        """Unique key to cache responses for the given arguments."""
+        return _cache_key(self.url_path(), limit)
+
+
+@final
+class AsyncPicturesFetch(http.AsyncBaseFetcher):
+    """Async version of :class:`PicturesFetch`."""
+
+    _url_path = '/photos'
+
+    async def __call__(
+        self,
+        *,
+        limit: int,
+    ) -> List[PictureResponse]:
+        """Fetch pictures without blocking the event loop."""
+        response = await self.request(
+            'get',
+            self.url_path(),
+            params={'_limit': limit},
+        )
+        return _parse_pictures(response)
+
+    def cache_key(self, *, limit: int) -> str:
+        """Same key as :class:`PicturesFetch` uses, so they share cache."""
+        return _cache_key(self.url_path(), limit)
+
+
+def _parse_pictures(response: requests.Response) -> List[PictureResponse]:
+    response.raise_for_status()
+    try:
+        return [
+            PictureResponse(id=int(picture['id']), url=_string(picture['url']))
+            for picture in orjson.loads(response.content)
+        ]
+    except (KeyError, TypeError) as exc:
+        raise ValueError('Invalid pictures response') from exc
+
+
+def _string(field_value: Any) -> str:
+    if not isinstance(field_value, str):
+        raise TypeError('String expected, got: {0!r}'.format(field_value))
+    return field_value
+
+
+def _cache_key(url: str, limit: int) -> str:
+    # Version must be changed each time `PictureResponse` is changed,
+    # so old workers and new ones do not read each other's pickles:
+    return 'placeholder:v2:{0}?_limit={1}'.format(url, limit)
@@ -1,9 +1,37 @@
-from django.db.models import QuerySet
+import datetime as dt
+from typing import Optional, Tuple
+
+from django.db import models
 
 from server.apps.pictures.models import FavouritePicture
 
+#: Position in the listing: `created_at` and `id` of the last seen item.
+Keyset = Tuple[dt.datetime, int]
+
+
+def by_user(
+    user_id: int,
+    *,
+    limit: int,
+    after: Optional[Keyset] = None,
+) -> models.QuerySet[FavouritePicture]:
+    """
+    Search :class:`FavouritePicture` by user id.
+
+    Uses keyset pagination: it is fast for any page, unlike offsets.
+    """
+    queryset = all_by_user(user_id)
+    if after is not None:
+        created_at, last_id = after
+        queryset = queryset.filter(
+            models.Q(created_at__gt=created_at) |
+            models.Q(created_at=created_at, id__gt=last_id),
+        )
+    return queryset[:limit]
+
 
-def by_user(user_id: int) -> QuerySet[FavouritePicture]:
-    """Search :class:`FavouritePicture` by user id."""
-    # TODO: this should be limited and probably paginated
-    return FavouritePicture.objects.filter(user_id=user_id)
+def all_by_user(user_id: int) -> models.QuerySet[FavouritePicture]:
+    """All :class:`FavouritePicture` items of a user, in the listing order."""
+    return FavouritePicture.objects.filter(
+        user_id=user_id,
+    ).order_by('created_at', 'id')
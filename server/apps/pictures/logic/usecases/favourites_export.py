@@ -0,0 +1,29 @@
+from typing import Any, Dict, Final, Iterator, final
+
+import attr
+
+from server.apps.pictures.logic.repo.queries import favourite_pictures
+from server.common import metrics
+
+#: Fields that are exported, they can be imported back:
+EXPORT_FIELDS: Final = ('foreign_id', 'url')
+
+#: How many rows are loaded from the database at once:
+_CHUNK_SIZE: Final = 2000
+
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesExport(object):
+    """
+    Export all :term:`favourites` pictures of a given user.
+
+    Rows are loaded lazily in chunks, oldest pictures first.
+    """
+
+    def __call__(self, user_id: int) -> Iterator[Dict[str, Any]]:
+        """Iterate over user's favourite pictures."""
+        return favourite_pictures.all_by_user(user_id).values(
+            *EXPORT_FIELDS,
+        ).iterator(chunk_size=_CHUNK_SIZE)
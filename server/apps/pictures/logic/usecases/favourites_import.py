@@ -0,0 +1,73 @@
+import itertools
+from typing import Any, Final, Iterable, List, Mapping, final
+
+import attr
+import pydantic
+
+from server.apps.pictures.models import FavouritePicture
+from server.common import metrics, pydantic_model
+
+#: How many items are validated and inserted at once:
+_CHUNK_SIZE: Final = 500
+
+
+@final
+class _PictureUrl(pydantic.AnyHttpUrl):
+    max_length = 200  # the same as in `FavouritePicture.url`
+
+
+@final
+class FavouriteItem(pydantic_model.BaseModel):
+    """Schema for a single imported :term:`picture`."""
+
+    foreign_id: int
+    url: _PictureUrl
+
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesImport(object):
+    """
+    Add many pictures to :term:`favourites` of a given user at once.
+
+    Items are validated and saved in chunks,
+    pictures that are already in favourites are skipped.
+    Raises :exc:`pydantic.ValidationError` on invalid items,
+    so previous chunks must be rolled back by the caller.
+
+    .. warning:
+        This use-case does not handle transactions!
+
+    """
+
+    def __call__(
+        self,
+        user_id: int,
+        rows: Iterable[Mapping[str, Any]],
+    ) -> int:
+        """Save all rows, returns how many were processed."""
+        rows = iter(rows)
+        processed = 0
+        while True:
+            chunk = list(itertools.islice(rows, _CHUNK_SIZE))
+            if not chunk:
+                return processed
+            self._save(user_id, pydantic.parse_obj_as(
+                List[FavouriteItem],
+                chunk,
+            ))
+            processed += len(chunk)
+
+    def _save(self, user_id: int, pictures: List[FavouriteItem]) -> None:
+        FavouritePicture.objects.bulk_create(
+            [
+                FavouritePicture(
+                    user_id=user_id,
+                    foreign_id=picture.foreign_id,
+                    url=picture.url,
+                )
+                for picture in pictures
+            ],
+            ignore_conflicts=True,
+        )
@@ -1,21 +1,91 @@
-from typing import final
+import base64
+import datetime as dt
+from typing import Final, List, Optional, final
 
 import attr
-from django.db.models import QuerySet
 
 # NOTE: this can be a dependency as well
 from server.apps.pictures.logic.repo.queries import favourite_pictures
 from server.apps.pictures.models import FavouritePicture
+from server.common import metrics
+
+#: Page size limits, we never load all favourites at once:
+DEFAULT_PAGE_SIZE: Final = 20
+MAX_PAGE_SIZE: Final = 100
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesPage(object):
+    """Single page of :term:`favourites` with the cursor to the next one."""
+
+    pictures: List[FavouritePicture]
+    next_cursor: Optional[str]
+    #: Next pages have the same size:
+    limit: int
+
+    def last_modified(self) -> Optional[dt.datetime]:
+        """When pictures of this page were changed, empty pages have none."""
+        return max(
+            (picture.updated_at for picture in self.pictures),
+            default=None,
+        )
 
 
 @final
+@metrics.measured(metrics.USECASE_LATENCY)
 @attr.dataclass(slots=True, frozen=True)
 class FavouritesList(object):
-    """List :term:`favourites` pictures for a given user."""
+    """
+    List :term:`favourites` pictures for a given user.
+
+    Raises :exc:`ValueError` on invalid cursors.
+    """
+
+    def __call__(
+        self,
+        user_id: int,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> FavouritesPage:
+        """List one page of user's favourite pictures."""
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        pictures = self._list_pictures(user_id, cursor, limit)
+        if len(pictures) <= limit:
+            return FavouritesPage(
+                pictures=pictures,
+                next_cursor=None,
+                limit=limit,
+            )
+        pictures = pictures[:limit]
+        return FavouritesPage(
+            pictures=pictures,
+            next_cursor=_encode_cursor(pictures[-1]),
+            limit=limit,
+        )
+
+    def _list_pictures(
+        self,
+        user_id: int,
+        cursor: Optional[str],
+        limit: int,
+    ) -> List[FavouritePicture]:
+        # We fetch one extra item to know whether the next page exists:
+        return list(favourite_pictures.by_user(
+            user_id,
+            limit=limit + 1,
+            after=None if cursor is None else _decode_cursor(cursor),
+        ))
+
+
+def _encode_cursor(picture: FavouritePicture) -> str:
+    keyset = '{0} {1}'.format(picture.created_at.isoformat(), picture.pk)
+    return base64.urlsafe_b64encode(keyset.encode()).decode()
 
-    def __call__(self, user_id: int) -> QuerySet[FavouritePicture]:
-        """Update existing user in the remote api."""
-        return self._list_pictures(user_id)
 
-    def _list_pictures(self, user_id: int) -> QuerySet[FavouritePicture]:
-        return favourite_pictures.by_user(user_id)
+def _decode_cursor(cursor: str) -> favourite_pictures.Keyset:
+    created_at, _, last_id = base64.urlsafe_b64decode(
+        cursor.encode(),
+    ).decode().partition(' ')
+    return dt.datetime.fromisoformat(created_at), int(last_id)
@@ -1,24 +1,167 @@
-from typing import List, final
+import hashlib
+from typing import List, Optional, Sequence, final
 
 import attr
+import structlog
+from django.core.cache import caches
 
 from server.apps.pictures.intrastructure.services import placeholder
+from server.common import metrics
 from server.common.django.types import Settings
+from server.common.services import caching, resilience, single_flight
+
+_logger = structlog.get_logger(__name__)
+
+#: Feed versions are short, they are only used in cache keys:
+_VERSION_SIZE = 16
 
 
 @final
+@metrics.measured(metrics.USECASE_LATENCY)
 @attr.dataclass(slots=True, frozen=True)
 class PicturesFetch(object):
-    """Fetch :term:`picture` items from :term:`Placeholder API`."""
+    """
+    Fetch :term:`picture` items from :term:`Placeholder API`.
+
+    Responses are cached, stale ones are refreshed in background.
+    When the API is unavailable, cached pictures are still served.
+    Without them, there are no pictures to show.
+    """
 
     _settings: Settings
 
-    def __call__(self, limit: int = 10) -> List[placeholder.PictureResponse]:
+    def __call__(
+        self,
+        limit: Optional[int] = None,
+    ) -> List[placeholder.PictureResponse]:
         """Update existing user in the remote api."""
-        return self._fetch_pictures(limit)
+        try:
+            return self._fetch_pictures(
+                limit or self._settings.PLACEHOLDER_API_PICTURES_LIMIT,
+            )
+        except resilience.ServiceUnavailableError:
+            _logger.warning('pictures_unavailable', exc_info=True)
+            return []
 
     def _fetch_pictures(self, limit: int) -> List[placeholder.PictureResponse]:
-        return placeholder.PicturesFetch(
+        fetcher = _fetcher(self._settings)
+        return _cached(self._settings)(
+            fetcher.cache_key(limit=limit),
+            lambda: self._request_once(fetcher, limit),
+        )
+
+    def _request_once(
+        self,
+        fetcher: placeholder.PicturesFetch,
+        limit: int,
+    ) -> List[placeholder.PictureResponse]:
+        # Concurrent cache misses are coalesced into a single request:
+        return single_flight.for_api()(
+            fetcher.cache_key(limit=limit),
+            lambda: fetcher(limit=limit),
+        )
+
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class AsyncPicturesFetch(object):
+    """Async version of :class:`PicturesFetch`, shares the same cache."""
+
+    _settings: Settings
+
+    async def __call__(
+        self,
+        limit: Optional[int] = None,
+    ) -> List[placeholder.PictureResponse]:
+        """Fetch pictures without blocking the event loop."""
+        try:
+            return await self._fetch_pictures(
+                limit or self._settings.PLACEHOLDER_API_PICTURES_LIMIT,
+            )
+        except resilience.ServiceUnavailableError:
+            _logger.warning('pictures_unavailable', exc_info=True)
+            return []
+
+    async def _fetch_pictures(
+        self,
+        limit: int,
+    ) -> List[placeholder.PictureResponse]:
+        fetcher = placeholder.AsyncPicturesFetch(
             api_url=self._settings.PLACEHOLDER_API_URL,
             api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
-        )(limit=limit)
+        )
+        return await _cached(self._settings).acall(
+            fetcher.cache_key(limit=limit),
+            lambda: self._request_once(fetcher, limit),
+        )
+
+    async def _request_once(
+        self,
+        fetcher: placeholder.AsyncPicturesFetch,
+        limit: int,
+    ) -> List[placeholder.PictureResponse]:
+        return await single_flight.for_api().acall(
+            fetcher.cache_key(limit=limit),
+            lambda: fetcher(limit=limit),
+        )
+
+
+@final
+@metrics.measured(metrics.USECASE_LATENCY)
+@attr.dataclass(slots=True, frozen=True)
+class PicturesWarmUp(object):
+    """
+    Store :term:`picture` feeds in cache before users ask for them.
+
+    Feeds are fetched for all ``PLACEHOLDER_API_WARM_LIMITS``.
+    With ``force`` cached feeds are refreshed too, otherwise
+    only missing ones are fetched. Returns the number of failed feeds.
+    """
+
+    _settings: Settings
+
+    def __call__(self, *, force: bool) -> int:
+        """Execute the usecase."""
+        failed = 0
+        for limit in self._settings.PLACEHOLDER_API_WARM_LIMITS:
+            try:
+                self._warm_up(limit, force=force)
+            except Exception:
+                _logger.exception('pictures_warm_up_failed', limit=limit)
+                failed += 1
+        return failed
+
+    def _warm_up(self, limit: int, *, force: bool) -> None:
+        fetcher = _fetcher(self._settings)
+        cache_key = fetcher.cache_key(limit=limit)
+        if force:
+            _cached(self._settings).refresh(
+                cache_key,
+                lambda: fetcher(limit=limit),
+            )
+        else:
+            _cached(self._settings)(cache_key, lambda: fetcher(limit=limit))
+
+
+def feed_version(pictures: Sequence[placeholder.PictureResponse]) -> str:
+    """Short digest of the feed, it changes only with its content."""
+    digest = hashlib.blake2b(digest_size=_VERSION_SIZE)
+    for picture in pictures:
+        digest.update('{0} {1}\n'.format(picture.id, picture.url).encode())
+    return digest.hexdigest()
+
+
+def _fetcher(settings: Settings) -> placeholder.PicturesFetch:
+    return placeholder.PicturesFetch(
+        api_url=settings.PLACEHOLDER_API_URL,
+        api_timeout=settings.PLACEHOLDER_API_TIMEOUT,
+    )
+
+
+def _cached(settings: Settings) -> caching.StaleWhileRevalidate:
+    return caching.StaleWhileRevalidate(
+        cache=caches[settings.PLACEHOLDER_API_CACHE],
+        ttl=settings.PLACEHOLDER_API_CACHE_TTL,
+        stale_ttl=settings.PLACEHOLDER_API_CACHE_STALE_TTL,
+    )
@@ -0,0 +1,47 @@
+import argparse
+from typing import Any, final
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.favourites_export import (
+    EXPORT_FIELDS,
+    FavouritesExport,
+)
+from server.common import formats
+
+
+@final
+class Command(BaseCommand):
+    """Writes all favourite pictures of a user to stdout."""
+
+    help = 'Exports favourite pictures to JSON lines or CSV.'
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Define command options."""
+        parser.add_argument('email', help='Email of the user.')
+        parser.add_argument(
+            '--format',
+            choices=sorted(formats.CONTENT_TYPES),
+            default='jsonl',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Stream pictures, so any number of them takes the same memory."""
+        user_model = get_user_model()
+        try:
+            user = user_model.objects.get_by_natural_key(options['email'])
+        except user_model.DoesNotExist:
+            raise CommandError(
+                'User {0} does not exist'.format(options['email']),
+            )
+
+        favourites_export = container.resolve(FavouritesExport)
+        lines = formats.dump(
+            options['format'],
+            favourites_export(user.pk),
+            fieldnames=EXPORT_FIELDS,
+        )
+        for line in lines:
+            self.stdout.write(line, ending='')
@@ -0,0 +1,61 @@
+import argparse
+import contextlib
+import sys
+from typing import Any, ContextManager, TextIO, final
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.favourites_import import (
+    FavouritesImport,
+)
+from server.common import formats
+
+
+@final
+class Command(BaseCommand):
+    """Adds many favourite pictures to a user from a file."""
+
+    help = 'Imports favourite pictures from JSON lines or CSV file.'
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Define command options."""
+        parser.add_argument('email', help='Email of the user.')
+        parser.add_argument(
+            'source',
+            help='Path to the file with pictures, use "-" for stdin.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=sorted(formats.CONTENT_TYPES),
+            default='jsonl',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Import all pictures or none of them."""
+        user_model = get_user_model()
+        try:
+            user = user_model.objects.get_by_natural_key(options['email'])
+        except user_model.DoesNotExist:
+            raise CommandError(
+                'User {0} does not exist'.format(options['email']),
+            )
+
+        favourites_import = container.resolve(FavouritesImport)
+        with self._open(options['source']) as source:
+            with transaction.atomic():
+                processed = favourites_import(
+                    user.pk,
+                    formats.load(options['format'], source),
+                )
+        self.stdout.write('Processed {0} pictures'.format(processed))
+
+    def _open(self, path: str) -> ContextManager[TextIO]:
+        if path == '-':
+            return contextlib.nullcontext(sys.stdin)
+        try:
+            return open(path)  # noqa: WPS515
+        except OSError as exc:
+            raise CommandError('Cannot read {0}: {1}'.format(path, exc))
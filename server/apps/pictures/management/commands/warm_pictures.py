@@ -0,0 +1,38 @@
+import time
+from typing import Any, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.pictures_fetch import PicturesWarmUp
+from server.common.django.types import Settings
+
+
+@final
+class Command(BaseCommand):
+    """Worker that keeps picture feeds in cache."""
+
+    help = 'Fetches picture feeds from Placeholder API into cache.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define command options."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Warm up feeds and exit, instead of refreshing forever.',
+        )
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='Only fetch feeds that are not cached yet.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Refresh feeds every ``PLACEHOLDER_API_WARM_INTERVAL`` seconds."""
+        pictures_warm_up = container.resolve(PicturesWarmUp)
+        interval = container.resolve(Settings).PLACEHOLDER_API_WARM_INTERVAL
+        while True:
+            pictures_warm_up(force=not options['missing_only'])
+            if options['once']:
+                return
+            time.sleep(interval)
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.18 on 2026-10-18 21:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Composite index for keyset pagination of favourites."""
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('pictures', '0001_initial'),
+    ]
+
+    operations = [
+        # New index is created first, so user lookups are never slow:
+        migrations.AddIndex(
+            model_name='favouritepicture',
+            index=models.Index(
+                fields=['user', 'created_at', 'id'],
+                name='pictures_favourite_keyset_idx',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='favouritepicture',
+            name='user',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=models.CASCADE,
+                related_name='pictures',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 3.2.18 on 2026-10-18 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def _remove_duplicates(
+    apps: StateApps,
+    schema_editor: BaseDatabaseSchemaEditor,
+) -> None:
+    FavouritePicture = apps.get_model(  # noqa: N806
+        'pictures',
+        'FavouritePicture',
+    )
+    first_ids = FavouritePicture.objects.values(
+        'user_id',
+        'foreign_id',
+    ).annotate(
+        first_id=models.Min('id'),
+    ).values('first_id')
+    FavouritePicture.objects.exclude(id__in=first_ids).delete()
+
+
+class Migration(migrations.Migration):
+    """Removes duplicate favourites and forbids new ones."""
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('pictures', '0002_favourites_keyset_index'),
+    ]
+
+    operations = [
+        # Removed duplicates cannot be restored, so reverse is a no-op:
+        migrations.RunPython(
+            _remove_duplicates,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='favouritepicture',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'foreign_id'),
+                name='pictures_favourite_unique',
+            ),
+        ),
+    ]
@@ -15,12 +15,29 @@ class FavouritePicture(TimedMixin, models.Model):
         settings.AUTH_USER_MODEL,
         related_name='pictures',
         on_delete=models.CASCADE,
+        db_index=False,  # covered by the keyset index below
     )
 
     # Data:
     foreign_id = models.IntegerField()
     url = models.URLField()
 
+    class Meta(object):
+        constraints = [
+            # The same picture can only be added once:
+            models.UniqueConstraint(
+                fields=['user', 'foreign_id'],
+                name='pictures_favourite_unique',
+            ),
+        ]
+        indexes = [
+            # Matches the keyset pagination order of user's favourites:
+            models.Index(
+                fields=['user', 'created_at', 'id'],
+                name='pictures_favourite_keyset_idx',
+            ),
+        ]
+
     def __str__(self) -> str:
         """Beatuful representation."""
         return '<Picture {0} by {1}>'.format(self.foreign_id, self.user_id)
@@ -1,10 +1,29 @@
 from django.urls import path
 
-from server.apps.pictures.views import DashboardView, FavouritePicturesView
+from server.apps.pictures.views.bulk import (
+    FavouritesExportView,
+    FavouritesImportView,
+)
+from server.apps.pictures.views.pages import (
+    DashboardView,
+    FavouritePicturesView,
+)
 
 app_name = 'pictures'
 
 urlpatterns = [
     path('dashboard', DashboardView.as_view(), name='dashboard'),
     path('favourites', FavouritePicturesView.as_view(), name='favourites'),
+
+    # Bulk operations:
+    path(
+        'favourites/import',
+        FavouritesImportView.as_view(),
+        name='favourites_import',
+    ),
+    path(
+        'favourites/export',
+        FavouritesExportView.as_view(),
+        name='favourites_export',
+    ),
 ]
@@ -0,0 +1,94 @@
+from http import HTTPStatus
+from typing import final
+
+from django.contrib.auth.decorators import login_required
+from django.db import transaction
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+from django.views.generic import View
+from pydantic import ValidationError
+from ratelimit.mixins import RatelimitMixin
+
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.favourites_export import (
+    EXPORT_FIELDS,
+    FavouritesExport,
+)
+from server.apps.pictures.logic.usecases.favourites_import import (
+    FavouritesImport,
+)
+from server.common import formats
+from server.common.django.decorators import dispatch_decorator, request_budget
+from server.common.django.views import streaming_content
+
+
+@final
+@request_budget('POST', db_queries=4)  # for any number of rows
+@dispatch_decorator(login_required)
+class FavouritesImportView(RatelimitMixin, View):
+    """
+    Add many :term:`favourites` at once.
+
+    Request body is in JSON lines or CSV with a header,
+    see ``format`` query parameter. Import is atomic.
+    """
+
+    # Rate-limiting:
+    ratelimit_key = 'ip'
+    ratelimit_rate = '10/h'
+    ratelimit_block = True
+    ratelimit_method = ['POST']
+
+    def post(self, request: HttpRequest) -> JsonResponse:
+        """Import all items or none of them."""
+        favourites_import = container.resolve(FavouritesImport)
+        try:
+            with transaction.atomic():
+                processed = favourites_import(
+                    request.user.id,
+                    formats.load(
+                        request.GET.get('format', 'jsonl'),
+                        request.body.decode().splitlines(),
+                    ),
+                )
+        except ValidationError as exc:
+            return JsonResponse(
+                {'errors': exc.errors()},
+                status=HTTPStatus.BAD_REQUEST,
+            )
+        except ValueError as exc:  # invalid format or encoding
+            return JsonResponse(
+                {'errors': [str(exc)]},
+                status=HTTPStatus.BAD_REQUEST,
+            )
+        return JsonResponse({'processed': processed})
+
+
+@final
+@request_budget('GET', db_queries=2)  # for any number of rows
+@dispatch_decorator(login_required)
+class FavouritesExportView(View):
+    """
+    Download all :term:`favourites` as a file.
+
+    It is streamed, so any number of pictures takes the same memory.
+    """
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse:
+        """Stream pictures in JSON lines or CSV."""
+        format_name = request.GET.get('format', 'jsonl')
+        if format_name not in formats.CONTENT_TYPES:
+            format_name = 'jsonl'
+
+        favourites_export = container.resolve(FavouritesExport)
+        response = StreamingHttpResponse(
+            streaming_content(request, formats.dump(
+                format_name,
+                favourites_export(request.user.id),
+                fieldnames=EXPORT_FIELDS,
+            )),
+            content_type=formats.CONTENT_TYPES[format_name],
+        )
+        response['Content-Disposition'] = (
+            'attachment; filename="favourites.{0}"'.format(format_name)
+        )
+        return response
@@ -0,0 +1,158 @@
+from typing import Any, Dict, final
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpRequest, HttpResponse
+from django.middleware.csrf import get_token
+from django.urls import reverse_lazy
+from django.views.generic import CreateView, ListView, TemplateView
+
+from server.apps.pictures.container import container
+from server.apps.pictures.intrastructure.django.forms import FavouritesForm
+from server.apps.pictures.logic.usecases.favourites_list import (
+    DEFAULT_PAGE_SIZE,
+    FavouritesList,
+    FavouritesPage,
+)
+from server.apps.pictures.logic.usecases.pictures_fetch import (
+    AsyncPicturesFetch,
+    PicturesFetch,
+    feed_version,
+)
+from server.apps.pictures.models import FavouritePicture
+from server.common.django.decorators import dispatch_decorator, request_budget
+from server.common.django.views import AsyncViewMixin
+
+
+@final
+@request_budget('GET', db_queries=0)
+class IndexView(TemplateView):
+    """
+    View the :term:`laning`.
+
+    It is a main page open for everyone.
+    """
+
+    template_name = 'pictures/pages/index.html'
+
+
+@final
+@request_budget('GET', 'POST', db_queries=2, upstream_calls=1)
+@dispatch_decorator(login_required)
+class DashboardView(
+    AsyncViewMixin,
+    CreateView[FavouritePicture, FavouritesForm],
+):
+    """
+    View the :term:`dashboard`.
+
+    It is a main page of the whole application.
+    This is where we show :term:`pictures` to be saved in :term:`favourites`.
+    """
+
+    form_class = FavouritesForm
+    template_name = 'pictures/pages/dashboard.html'
+    success_url = reverse_lazy('pictures:dashboard')
+
+    async def aget(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        """Fetch pictures without blocking the event loop in ASGI mode."""
+        fetch_pictures = container.resolve(AsyncPicturesFetch)
+
+        self.object = None
+        return self.render_to_response(
+            self.get_context_data(pictures=await fetch_pictures()),
+        )
+
+    async def apost(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        """Forms save data to the database, so we run them in a thread."""
+        return await sync_to_async(self.post)(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Innject extra context to template rendering.
+
+        Rendered pictures are cached for each feed version,
+        see ``pictures/pages/dashboard.html``. Their forms have CSRF tokens,
+        so the cache is also bound to the user's CSRF cookie.
+        It must be set before the template is rendered.
+        """
+        if 'pictures' not in kwargs:  # it is only fetched in `aget`
+            fetch_pictures = container.resolve(PicturesFetch)
+            kwargs['pictures'] = fetch_pictures()
+        get_token(self.request)
+        kwargs['pictures_version'] = feed_version(kwargs['pictures'])
+        kwargs['csrf_cookie'] = self.request.META['CSRF_COOKIE']
+        return super().get_context_data(**kwargs)
+
+    def get_form_kwargs(self) -> Dict[str, Any]:
+        """Add current user to the context."""
+        base_kwargs = super().get_form_kwargs()
+        base_kwargs['user'] = self.request.user
+        return base_kwargs
+
+    def form_valid(self, form: FavouritesForm) -> HttpResponse:
+        """Data is valid: show a message about it."""
+        messages.success(self.request, 'Добавлено')
+        return super().form_valid(form)
+
+
+@final
+@request_budget('GET', db_queries=2)
+@dispatch_decorator(login_required)
+class FavouritePicturesView(AsyncViewMixin, ListView[FavouritePicture]):
+    """View the :term:`favourites`."""
+
+    template_name = 'pictures/pages/favourites.html'
+
+    def get(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        """Load one page of pictures."""
+        return self._render_page(self._load_page(request))
+
+    async def aget(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        """Load one page of pictures without blocking the event loop."""
+        return self._render_page(
+            await sync_to_async(self._load_page)(request),
+        )
+
+    def _load_page(self, request: HttpRequest) -> FavouritesPage:
+        list_favourites = container.resolve(FavouritesList)
+        try:
+            return list_favourites(
+                request.user.id,
+                cursor=request.GET.get('cursor'),
+                limit=int(request.GET.get('limit', DEFAULT_PAGE_SIZE)),
+            )
+        except ValueError:
+            raise Http404('Invalid page')
+
+    def _render_page(self, page: FavouritesPage) -> HttpResponse:
+        self.object_list = page.pictures
+        return self.render_to_response(
+            self.get_context_data(
+                next_cursor=page.next_cursor,
+                limit=page.limit,
+                # Rendered pages are cached until they are changed:
+                last_modified=page.last_modified(),
+            ),
+        )
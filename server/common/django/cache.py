@@ -0,0 +1,121 @@
+from typing import Any, Dict, Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+class TieredCache(BaseCache):  # noqa: WPS214
+    """
+    Small in-process LRU cache in front of a shared one.
+
+    Reads hit the local tier first, so hot keys do not need network calls.
+    Writes go to both tiers. Other processes can still see old values
+    for ``LOCAL_TIMEOUT`` seconds after a write, keep it short.
+    Counters are never cached locally.
+
+    Configuration example:
+
+    .. code:: python
+
+        'pictures': {
+            'BACKEND': 'server.common.django.cache.TieredCache',
+            'LOCATION': 'pictures_shared',  # alias of the shared cache
+            'OPTIONS': {'MAX_ENTRIES': 256, 'LOCAL_TIMEOUT': 5},
+        }
+
+    Keys are prefixed and versioned by the shared cache only.
+    """
+
+    def __init__(
+        self,
+        location: str,
+        params: Dict[str, Any],  # noqa: WPS110
+    ) -> None:
+        """Create local tier, shared one is resolved lazily."""
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._shared_alias = location
+        self._local = LocMemCache(
+            'tiered-{0}'.format(location),
+            {
+                'TIMEOUT': options.get('LOCAL_TIMEOUT', 5),
+                'OPTIONS': {'MAX_ENTRIES': self._max_entries},
+            },
+        )
+
+    @property
+    def shared(self) -> BaseCache:
+        """Shared cache, there's a separate connection in each thread."""
+        return caches[self._shared_alias]
+
+    def add(
+        self,
+        key: Any,
+        value: Any,  # noqa: WPS110
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Add value to the shared cache, it is used for locks."""
+        added = self.shared.add(key, value, timeout, version)
+        if added:
+            self._local.set(key, value, version=version)
+        return added
+
+    def get(
+        self,
+        key: Any,
+        default: Optional[Any] = None,
+        version: Optional[int] = None,
+    ) -> Any:
+        """Get value from the local tier, or from the shared one."""
+        sentinel = object()
+        cached = self._local.get(key, sentinel, version)
+        if cached is not sentinel:
+            return cached
+
+        cached = self.shared.get(key, sentinel, version)
+        if cached is sentinel:
+            return default
+        self._local.set(key, cached, version=version)
+        return cached
+
+    def set(  # noqa: WPS125
+        self,
+        key: Any,
+        value: Any,  # noqa: WPS110
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Optional[int] = None,
+    ) -> None:
+        """Set value in both tiers."""
+        self.shared.set(key, value, timeout, version)
+        self._local.set(key, value, version=version)
+
+    def touch(
+        self,
+        key: Any,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Local tier has its own short timeout, so we only touch shared."""
+        return self.shared.touch(key, timeout, version)
+
+    def delete(self, key: Any, version: Optional[int] = None) -> bool:
+        """Delete value from both tiers."""
+        self._local.delete(key, version)
+        return self.shared.delete(key, version)
+
+    def incr(
+        self,
+        key: Any,
+        delta: int = 1,
+        version: Optional[int] = None,
+    ) -> int:
+        """Counters must be atomic, so they only live in the shared tier."""
+        self._local.delete(key, version)
+        return self.shared.incr(key, delta, version)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        self._local.clear()
+        self.shared.clear()
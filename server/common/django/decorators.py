@@ -2,9 +2,39 @@ from typing import Any, Callable, TypeVar
 
 from django.utils.decorators import method_decorator
 
+from server.common.instrumentation import RequestBudget
+
 _Type = TypeVar('_Type', bound=type)
+_ViewT = TypeVar('_ViewT', bound=Callable[..., Any])
 
 
 def dispatch_decorator(func: Callable[..., Any]) -> Callable[[_Type], _Type]:
     """Special helper to decorate class-based view's `dispatch` method."""
     return method_decorator(func, name='dispatch')
+
+
+def request_budget(
+    *methods: str,
+    db_queries: int,
+    upstream_calls: int = 0,
+) -> Callable[[_ViewT], _ViewT]:
+    """
+    Declares max database queries and API calls of a view per request.
+
+    Works with both function and class-based views,
+    can be applied several times with different HTTP ``methods``.
+    Budgets are asserted in tests for each request, see
+    ``tests/plugins/request_budget.py``. So, N+1 queries fail our CI.
+    """
+    budget = RequestBudget(
+        db_queries=db_queries,
+        upstream_calls=upstream_calls,
+    )
+
+    def decorator(view: _ViewT) -> _ViewT:
+        view.request_budgets = {  # type: ignore[attr-defined]
+            **getattr(view, 'request_budgets', {}),
+            **dict.fromkeys(methods, budget),
+        }
+        return view
+    return decorator
@@ -0,0 +1,109 @@
+import random
+import time
+from typing import Callable, Final, Optional, cast, final
+
+import structlog
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+from server.common import instrumentation, metrics
+from server.common.django.types import Settings
+
+_logger = structlog.get_logger(__name__)
+
+#: We log durations in milliseconds:
+_MS: Final = 1000
+
+
+@final
+class RequestStatsMiddleware(object):
+    """
+    Logs a single line with performance stats for each sampled request.
+
+    It has wall time, database and upstream API time, and response size.
+    Only ``REQUEST_STATS_SAMPLE_RATE`` of requests is instrumented,
+    others are only timed and logged when they are slow.
+    Must be placed after ``LoggingContextVarsMiddleware``.
+    """
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse],
+    ) -> None:
+        """Django's API-compatible constructor."""
+        self.get_response = get_response
+        config = cast(Settings, settings)
+        self._sample_rate = config.REQUEST_STATS_SAMPLE_RATE
+        self._slow_threshold = config.REQUEST_STATS_SLOW_THRESHOLD
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Measure the request."""
+        start_time = time.perf_counter()
+        if random.random() >= self._sample_rate:  # noqa: S311
+            response = self.get_response(request)
+            duration = time.perf_counter() - start_time
+            if duration >= self._slow_threshold:
+                _log(request, response, duration=duration, stats=None)
+            return response
+
+        # Exceptions are converted to responses by Django, no need for `try`:
+        token = instrumentation.start()
+        with connection.execute_wrapper(instrumentation.record_query):
+            response = self.get_response(request)
+        _log(
+            request,
+            response,
+            duration=time.perf_counter() - start_time,
+            stats=instrumentation.stop(token),
+        )
+        return response
+
+
+@final
+class MetricsMiddleware(object):
+    """Measures latency of each view, see :mod:`server.common.metrics`."""
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse],
+    ) -> None:
+        """Django's API-compatible constructor."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Observe the request, when it is resolved to some view."""
+        start_time = time.perf_counter()
+        response = self.get_response(request)
+        metrics.VIEW_LATENCY.labels(
+            request.resolver_match.view_name
+            if request.resolver_match else 'unresolved',
+            request.method,
+            response.status_code,
+        ).observe(time.perf_counter() - start_time)
+        return response
+
+
+def _log(
+    request: HttpRequest,
+    response: HttpResponse,
+    *,
+    duration: float,
+    stats: Optional[instrumentation.RequestStats],
+) -> None:
+    structlog.contextvars.bind_contextvars(
+        method=request.method,
+        path=request.path,
+        status=response.status_code,
+        duration_ms=round(duration * _MS, 1),
+        # Set by `CommonMiddleware`, streaming responses do not have it:
+        response_size=response.get('Content-Length'),
+    )
+    if stats is not None:
+        structlog.contextvars.bind_contextvars(
+            db_queries=stats.db_queries,
+            db_time_ms=round(stats.db_time * _MS, 1),
+            upstream_calls=stats.upstream_calls,
+            upstream_time_ms=round(stats.upstream_time * _MS, 1),
+        )
+    _logger.info('request_finished', sampled=stats is not None)
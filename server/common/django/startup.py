@@ -0,0 +1,121 @@
+"""
+Measures how long it takes to boot a worker.
+
+See ``manage.py startup_profile``. It runs this module in a fresh
+interpreter with ``python -X importtime``, which prints import times
+to stderr. ``AppConfig.ready`` times are printed to stdout as JSON.
+"""
+
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import time
+from typing import Callable, Dict, List, final
+
+import attr
+import django
+from django.apps import AppConfig
+from django.urls import get_resolver
+
+#: Lines of `-X importtime` look like: `import time: 12 | 345 | module`
+_IMPORT_TIME_PREFIX = 'import time:'
+_MICROSECONDS = 1000000
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class ImportTime(object):
+    """Time (in seconds) to import a module, without and with its imports."""
+
+    module: str
+    self_time: float
+    cumulative: float
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class StartupProfile(object):
+    """Where a worker spends its boot time, all times are in seconds."""
+
+    total: float
+    imports: List[ImportTime]
+    ready: Dict[str, float]
+
+
+def profile() -> StartupProfile:
+    """Boot Django in a fresh interpreter and measure it."""
+    booted = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-m', __name__],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=os.environ,
+    )
+    measured = json.loads(booted.stdout)
+    return StartupProfile(
+        total=measured['total'],
+        imports=parse_import_times(booted.stderr),
+        ready=measured['ready'],
+    )
+
+
+def parse_import_times(output: str) -> List[ImportTime]:
+    """Parse the output of ``python -X importtime``."""
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith(_IMPORT_TIME_PREFIX):
+            continue
+        self_time, cumulative, module = line[
+            len(_IMPORT_TIME_PREFIX):
+        ].split('|')
+        if not self_time.strip().isdigit():  # it is the header
+            continue
+        imports.append(ImportTime(
+            module=module.strip(),
+            self_time=int(self_time) / _MICROSECONDS,
+            cumulative=int(cumulative) / _MICROSECONDS,
+        ))
+    return imports
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class _TimedReady(object):
+    _ready: Callable[[], None]
+    _label: str
+    _times: Dict[str, float]
+
+    def __call__(self) -> None:
+        start = time.perf_counter()
+        self._ready()
+        self._times[self._label] = time.perf_counter() - start
+
+
+def _main() -> None:
+    ready_times: Dict[str, float] = {}
+    create_app_config = AppConfig.create
+
+    def timed_create(entry: str) -> AppConfig:  # noqa: WPS430
+        app_config = create_app_config(entry)
+        app_config.ready = _TimedReady(  # type: ignore[assignment]
+            app_config.ready,
+            app_config.label,
+            ready_times,
+        )
+        return app_config
+
+    AppConfig.create = timed_create  # type: ignore[assignment]
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+
+    start = time.perf_counter()
+    django.setup()
+    get_resolver().resolve('/')  # URLs are imported on the first request
+    sys.stdout.write(json.dumps({
+        'total': time.perf_counter() - start,
+        'ready': ready_times,
+    }))
+
+
+if __name__ == '__main__':
+    _main()
@@ -7,12 +7,46 @@ near each type, so we can easily track them and refactor
 our code when new versions are released.
 """
 
-from typing import Protocol
+from typing import List, Protocol
 
 
 # TODO: bug in django-stubs with settings
 class Settings(Protocol):
     """Our plugin cannot resolve some settings during type checking."""
 
+    ADMIN_LAZY_LOAD: bool
+    ASYNC_VIEWS: bool
     PLACEHOLDER_API_URL: str
     PLACEHOLDER_API_TIMEOUT: int
+    PLACEHOLDER_API_CACHE: str
+    PLACEHOLDER_API_CACHE_TTL: int
+    PLACEHOLDER_API_CACHE_STALE_TTL: int
+    PLACEHOLDER_API_SINGLE_FLIGHT_CACHE: str
+    PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT: float
+    PLACEHOLDER_API_PICTURES_LIMIT: int
+    PLACEHOLDER_API_WARM_LIMITS: List[int]
+    PLACEHOLDER_API_WARM_INTERVAL: float
+    PLACEHOLDER_API_POOL_SIZE: int
+    PLACEHOLDER_API_RETRIES: int
+    PLACEHOLDER_API_RETRY_BACKOFF: float
+    PLACEHOLDER_API_BREAKER_CACHE: str
+    PLACEHOLDER_API_BREAKER_FAILURES: int
+    PLACEHOLDER_API_BREAKER_RESET: int
+    PLACEHOLDER_API_BULKHEAD: int
+    LEAD_OUTBOX_BATCH_SIZE: int
+    LEAD_OUTBOX_CONCURRENCY: int
+    LEAD_OUTBOX_LEASE: int
+    LEAD_OUTBOX_MAX_ATTEMPTS: int
+    LEAD_OUTBOX_RETRY_DELAY: int
+    LEAD_OUTBOX_POLL_INTERVAL: float
+    LEAD_RECONCILE_CHUNK_SIZE: int
+    LEAD_RECONCILE_CONCURRENCY: int
+    LEAD_RECONCILE_RATE: float
+    IDENTITY_USER_CACHE: str
+    PASSWORD_ARGON2_TIME_COST: int
+    PASSWORD_ARGON2_MEMORY_COST: int
+    PASSWORD_ARGON2_PARALLELISM: int
+    PASSWORD_HASHING_CONCURRENCY: int
+    PASSWORD_HASHING_TIMEOUT: float
+    REQUEST_STATS_SAMPLE_RATE: float
+    REQUEST_STATS_SLOW_THRESHOLD: float
@@ -0,0 +1,38 @@
+from typing import Any, List, final
+
+from django.urls import ResolverMatch, URLResolver, clear_url_caches
+from django.urls.resolvers import RoutePattern
+
+
+def lazy_include(route: str, urlconf: str) -> URLResolver:
+    """
+    Like ``include()``, but ``urlconf`` is imported on the first request to it.
+
+    So, rarely used URLs do not slow down the boot of our workers.
+    Their names cannot be reversed until then.
+    """
+    return _LazyResolver(RoutePattern(route, is_endpoint=False), urlconf)
+
+
+@final
+class _LazyResolver(URLResolver):
+    def __init__(self, pattern: RoutePattern, urlconf_name: str) -> None:
+        super().__init__(pattern, urlconf_name)
+        self._loaded = False
+        self._patterns: List[Any] = []
+
+    @property
+    def url_patterns(self) -> List[Any]:
+        """There are no patterns, until the first request to them."""
+        return self._patterns
+
+    def resolve(self, path: str) -> ResolverMatch:
+        """Imports the URLconf, when ``path`` is in it."""
+        if not self._loaded and self.pattern.match(path):
+            # Caches were filled while it was empty, we start from scratch:
+            fresh = URLResolver(self.pattern, self.urlconf_name)
+            vars(self).update(vars(fresh))  # noqa: WPS421
+            self._patterns = fresh.url_patterns
+            self._loaded = True
+            clear_url_caches()
+        return super().resolve(path)
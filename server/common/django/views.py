@@ -0,0 +1,118 @@
+import functools
+import inspect
+import os
+from typing import Any, Callable, Iterable, TypeVar, cast
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from server.common.django.types import Settings
+
+_ContentType = TypeVar('_ContentType')
+
+
+class AsyncViewMixin(object):
+    """
+    Allows class-based views to have ``async`` handlers, like ``aget``.
+
+    They are only used when ``ASYNC_VIEWS`` is set, in ASGI mode.
+    Otherwise, views stay synchronous and use regular handlers, like ``get``.
+    Django 3.2 only runs function-based views asynchronously,
+    so we turn the result of ``as_view()`` into a coroutine function.
+    Handlers that touch the database must use ``sync_to_async``.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any) -> Callable[..., HttpResponseBase]:
+        """Wraps regular view into a coroutine function in ASGI mode."""
+        view = super().as_view(**initkwargs)  # type: ignore[misc]
+        if not _async_views():
+            return cast(Callable[..., HttpResponseBase], view)
+
+        async def wrapper(
+            request: HttpRequest,
+            *args: Any,
+            **kwargs: Any,
+        ) -> HttpResponseBase:
+            # Lazy session and user are loaded from the database,
+            # decorators like `login_required` cannot do it in event loop:
+            await sync_to_async(_load_user)(request)
+            response = view(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+
+        # Django checks whether the view is a coroutine function in runtime:
+        return cast(
+            Callable[..., HttpResponseBase],
+            functools.update_wrapper(wrapper, view),
+        )
+
+    def dispatch(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        """Calls ``async`` handler of the request method, when it is used."""
+        async_handler = getattr(
+            self,
+            'a{0}'.format(str(request.method).lower()),
+            None,
+        )
+        if async_handler is None or not _async_views():
+            return super().dispatch(  # type: ignore[misc]
+                request,
+                *args,
+                **kwargs,
+            )
+        return cast(HttpResponseBase, async_handler(request, *args, **kwargs))
+
+
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Exposes metrics in Prometheus format.
+
+    Must not be public: it is hidden by our proxy, see ``Caddyfile``.
+    """
+    registry = REGISTRY
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return HttpResponse(
+        generate_latest(registry),
+        content_type=CONTENT_TYPE_LATEST,
+    )
+
+
+def streaming_content(
+    request: HttpRequest,
+    chunks: Iterable[_ContentType],
+) -> Iterable[_ContentType]:
+    """
+    Content for ``StreamingHttpResponse`` that is safe in all server modes.
+
+    Django 3.2 iterates streaming responses inside the event loop in ASGI,
+    where database queries are forbidden. So, there we load it upfront.
+    """
+    if isinstance(request, ASGIRequest):
+        return list(chunks)
+    return chunks
+
+
+def _async_views() -> bool:
+    return cast(Settings, settings).ASYNC_VIEWS
+
+
+def _load_user(request: HttpRequest) -> bool:
+    return request.user.is_authenticated
@@ -0,0 +1,53 @@
+import csv
+import json
+from typing import Any, Dict, Final, Iterable, Iterator, Mapping, Sequence
+
+#: Content types of the supported formats:
+CONTENT_TYPES: Final = {  # noqa: WPS407
+    'jsonl': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def load(
+    format_name: str,
+    lines: Iterable[str],
+) -> Iterator[Dict[str, Any]]:
+    """Lazily parse rows in JSON lines or CSV with a header."""
+    if format_name == 'csv':
+        return iter(csv.DictReader(lines))
+    if format_name == 'jsonl':
+        return (json.loads(line) for line in lines if line.strip())
+    raise ValueError('Unknown format: {0}'.format(format_name))
+
+
+def dump(
+    format_name: str,
+    rows: Iterable[Mapping[str, Any]],
+    fieldnames: Sequence[str],
+) -> Iterator[str]:
+    """Lazily serialize rows to JSON lines or CSV with a header."""
+    if format_name == 'csv':
+        return _dump_csv(rows, fieldnames)
+    if format_name == 'jsonl':
+        return (
+            '{0}\n'.format(json.dumps(row, ensure_ascii=False))
+            for row in rows
+        )
+    raise ValueError('Unknown format: {0}'.format(format_name))
+
+
+class _Echo(object):
+    """File-like object that returns written lines instead of storing."""
+
+    def write(self, line: str) -> str:
+        return line
+
+
+def _dump_csv(
+    rows: Iterable[Mapping[str, Any]],
+    fieldnames: Sequence[str],
+) -> Iterator[str]:
+    writer = csv.DictWriter(_Echo(), fieldnames=fieldnames)
+    yield writer.writeheader()
+    yield from (writer.writerow(row) for row in rows)
@@ -0,0 +1,92 @@
+import contextlib
+import contextvars
+import time
+from typing import Any, Callable, Iterator, Optional, final
+
+import attr
+
+
+@final
+@attr.dataclass(slots=True)
+class RequestStats(object):
+    """What the current request has spent its time on, in seconds."""
+
+    db_queries: int = 0
+    db_time: float = 0
+    upstream_calls: int = 0
+    upstream_time: float = 0
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class RequestBudget(object):
+    """
+    How much a single request to some view may spend.
+
+    Declared with ``request_budget`` view decorator, enforced in tests.
+    """
+
+    db_queries: int
+    upstream_calls: int = 0
+
+
+#: Set only for sampled requests, it is also copied to `sync_to_async` calls:
+_current: contextvars.ContextVar[Optional[RequestStats]] = (
+    contextvars.ContextVar('request_stats', default=None)
+)
+
+
+def start() -> 'contextvars.Token[Optional[RequestStats]]':
+    """Start collecting stats in the current context."""
+    return _current.set(RequestStats())
+
+
+def stop(token: 'contextvars.Token[Optional[RequestStats]]') -> RequestStats:
+    """Stop collecting stats and return them, they are added to outer ones."""
+    stats = _current.get()
+    _current.reset(token)
+    assert stats is not None  # noqa: S101
+    outer = _current.get()
+    if outer is not None:
+        outer.db_queries += stats.db_queries
+        outer.db_time += stats.db_time
+        outer.upstream_calls += stats.upstream_calls
+        outer.upstream_time += stats.upstream_time
+    return stats
+
+
+def record_upstream(duration: float) -> None:
+    """Record a finished call to some external API."""
+    stats = _current.get()
+    if stats is not None:
+        stats.upstream_calls += 1
+        stats.upstream_time += duration
+
+
+@contextlib.contextmanager
+def upstream_call() -> Iterator[None]:
+    """Record a call to some external API, even when it fails."""
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_upstream(time.perf_counter() - start_time)
+
+
+def record_query(
+    execute: Callable[..., Any],
+    sql: str,
+    params: Any,  # noqa: WPS110
+    many: bool,
+    context: Any,
+) -> Any:
+    """Database execute wrapper, see ``connection.execute_wrapper``."""
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    start_time = time.perf_counter()
+    query_result = execute(sql, params, many, context)
+    stats.db_queries += 1
+    stats.db_time += time.perf_counter() - start_time
+    return query_result
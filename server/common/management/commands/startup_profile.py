@@ -0,0 +1,51 @@
+import operator
+from typing import Any, List, Tuple, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.common.django import startup
+
+#: How many slowest imports we show by default:
+_LIMIT = 20
+
+
+@final
+class Command(BaseCommand):
+    """Shows where a worker spends its boot time."""
+
+    help = 'Measures imports and `AppConfig.ready` of a fresh worker.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Define command options."""
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=_LIMIT,
+            help='How many slowest imports to show.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Boot a worker in a fresh interpreter and report its times."""
+        boot = startup.profile()
+        self.stdout.write('Django setup and URLs: {0:.0f}ms'.format(
+            boot.total * 1000,
+        ))
+
+        slowest = sorted(
+            boot.imports,
+            key=operator.attrgetter('cumulative'),
+            reverse=True,
+        )[:options['limit']]
+        self._write_times('Slowest imports, with their own imports:', [
+            (imported.module, imported.cumulative) for imported in slowest
+        ])
+        self._write_times('AppConfig.ready:', sorted(
+            boot.ready.items(),
+            key=operator.itemgetter(1),
+            reverse=True,
+        ))
+
+    def _write_times(self, title: str, times: List[Tuple[str, float]]) -> None:
+        self.stdout.write('\n{0}'.format(title))
+        for name, seconds in times:
+            self.stdout.write('{0:>8.1f}ms {1}'.format(seconds * 1000, name))
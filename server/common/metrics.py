@@ -0,0 +1,101 @@
+"""
+Prometheus metrics.
+
+In production each `gunicorn` worker writes its metrics to files
+in ``PROMETHEUS_MULTIPROC_DIR``, which is set in ``gunicorn.sh``.
+Then ``/metrics`` aggregates them from all the workers.
+"""
+
+import contextlib
+import functools
+import inspect
+import time
+from typing import Any, Callable, Iterator, TypeVar
+
+from prometheus_client import Histogram
+
+_ClassT = TypeVar('_ClassT', bound=type)
+
+VIEW_LATENCY = Histogram(
+    'view_latency_seconds',
+    'Time spent in Django views, including middleware.',
+    ['view', 'method', 'status'],
+)
+
+USECASE_LATENCY = Histogram(
+    'usecase_latency_seconds',
+    'Time spent in use-cases.',
+    ['usecase', 'status'],
+)
+
+FETCHER_LATENCY = Histogram(
+    'fetcher_latency_seconds',
+    'Time spent in HTTP calls to external APIs.',
+    ['fetcher', 'status'],
+)
+
+
+def measured(histogram: Histogram) -> Callable[[_ClassT], _ClassT]:
+    """
+    Class decorator that measures ``__call__`` of use-cases and services.
+
+    Status label is ``ok``, HTTP status code from the exception's response,
+    or the exception's class name.
+    """
+    def decorator(cls: _ClassT) -> _ClassT:
+        call = cls.__call__
+        if inspect.iscoroutinefunction(call):
+            measured_call = _async_call(call, histogram, cls.__name__)
+        else:
+            measured_call = _sync_call(call, histogram, cls.__name__)
+        cls.__call__ = measured_call  # type: ignore[assignment]
+        return cls
+    return decorator
+
+
+@contextlib.contextmanager
+def measure(histogram: Histogram, name: str) -> Iterator[None]:
+    """Observe time spent in the block."""
+    start_time = time.perf_counter()
+    status = 'ok'
+    try:
+        yield
+    except Exception as exc:
+        status = _status(exc)
+        raise
+    finally:
+        histogram.labels(name, status).observe(
+            time.perf_counter() - start_time,
+        )
+
+
+def _sync_call(
+    call: Callable[..., Any],
+    histogram: Histogram,
+    name: str,
+) -> Callable[..., Any]:
+    @functools.wraps(call)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with measure(histogram, name):
+            return call(*args, **kwargs)
+    return wrapper
+
+
+def _async_call(
+    call: Callable[..., Any],
+    histogram: Histogram,
+    name: str,
+) -> Callable[..., Any]:
+    @functools.wraps(call)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with measure(histogram, name):
+            return await call(*args, **kwargs)
+    return wrapper
+
+
+def _status(exc: Exception) -> str:
+    response = getattr(exc, 'response', None)
+    status_code = getattr(response, 'status_code', None)
+    if status_code is not None:
+        return str(status_code)
+    return type(exc).__name__
@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import Awaitable, Callable, Optional, Tuple, TypeVar, final
+
+import attr
+import structlog
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.cache import BaseCache
+
+_ValueT = TypeVar('_ValueT')
+
+_logger = structlog.get_logger(__name__)
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class StaleWhileRevalidate(object):
+    """
+    Cache for slow computations, like HTTP requests.
+
+    Values are fresh for ``ttl`` seconds. Then they are served stale
+    for ``stale_ttl`` more seconds, while a single caller
+    (across all processes sharing the cache) refreshes them in background.
+    """
+
+    #: Dependencies:
+    _cache: BaseCache
+    _ttl: int
+    _stale_ttl: int
+
+    def __call__(self, key: str, compute: Callable[[], _ValueT]) -> _ValueT:
+        """Return cached value for the ``key`` or ``compute`` it."""
+        entry: Optional[Tuple[float, _ValueT]] = self._cache.get(key)
+        if entry is None:
+            return self._store(key, compute())
+
+        fresh_until, cached_value = entry
+        if fresh_until < time.time() and self._acquire(key):
+            _in_background(lambda: self._refresh(key, compute))
+        return cached_value
+
+    async def acall(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[_ValueT]],
+    ) -> _ValueT:
+        """Async version of ``__call__`` for awaitable computations."""
+        entry: Optional[Tuple[float, _ValueT]] = await _in_thread(
+            self._cache.get,
+        )(key)
+        if entry is None:
+            computed = await compute()
+            await _in_thread(self._store)(key, computed)
+            return computed
+
+        fresh_until, cached_value = entry
+        if fresh_until < time.time() and await _in_thread(self._acquire)(key):
+            _in_background(lambda: self._refresh(
+                key,
+                # Created inside the new thread, so it runs its own loop:
+                async_to_sync(compute),  # type: ignore[no-untyped-call]
+            ))
+        return cached_value
+
+    def refresh(self, key: str, compute: Callable[[], _ValueT]) -> _ValueT:
+        """Store fresh value for the ``key``, even if it is still cached."""
+        return self._store(key, compute())
+
+    def _store(self, key: str, cached_value: _ValueT) -> _ValueT:
+        entry = (time.time() + self._ttl, cached_value)
+        self._cache.set(key, entry, timeout=self._ttl + self._stale_ttl)
+        return cached_value
+
+    def _refresh(self, key: str, compute: Callable[[], _ValueT]) -> None:
+        try:
+            self._store(key, compute())
+        except Exception:
+            # Stale value is still there, we will try again later:
+            _logger.exception('cache_refresh_failed', key=key)
+        finally:
+            self._cache.delete(_lock_key(key))
+
+    def _acquire(self, key: str) -> bool:
+        # `add` is atomic: only one caller can set a missing key.
+        return self._cache.add(_lock_key(key), value=1, timeout=self._ttl)
+
+
+def _lock_key(key: str) -> str:
+    return '{0}:lock'.format(key)
+
+
+def _in_thread(
+    function: Callable[..., _ValueT],
+) -> Callable[..., Awaitable[_ValueT]]:
+    # Cache backends can do network calls, we don't want to block on them:
+    return sync_to_async(function, thread_sensitive=False)
+
+
+def _in_background(callback: Callable[[], None]) -> None:
+    threading.Thread(target=callback, daemon=True).start()
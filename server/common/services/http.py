@@ -1,7 +1,23 @@
-from typing import ClassVar
+import functools
+import inspect
+import os
+from http import HTTPStatus
+from typing import Any, Callable, ClassVar, ContextManager, cast, final
 from urllib.parse import urljoin
 
+import requests
+from asgiref.sync import sync_to_async
 from attr import dataclass
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from server.common import instrumentation, metrics
+from server.common.django.types import Settings
+from server.common.services import resilience
+
+#: We only retry responses that are likely to be temporary:
+_RETRY_STATUSES = frozenset((502, 503, 504))
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,6 +31,125 @@ class BaseFetcher(object):
     #: This must be defined in all subclasses:
     _url_path: ClassVar[str]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """All calls of our services are guarded and measured."""
+        super().__init_subclass__(**kwargs)
+        call = cls.__dict__.get('__call__')
+        if call is None:
+            return
+        # Async ones are guarded in `AsyncBaseFetcher.request`:
+        if not inspect.iscoroutinefunction(call):
+            cls.__call__ = _guarded(call)  # type: ignore[assignment]
+        metrics.measured(metrics.FETCHER_LATENCY)(cls)
+
     def url_path(self) -> str:
         """Full URL for the request."""
         return urljoin(self._api_url, self._url_path)
+
+    def session(self) -> requests.Session:
+        """
+        HTTP session shared by all fetchers in the current process.
+
+        It keeps connections alive in a pool, so we don't pay
+        for TCP and TLS handshakes on each request.
+        """
+        return _shared_session()
+
+    def guard(self) -> ContextManager[None]:
+        """
+        Protects our workers from a slow or failing API.
+
+        Raises :class:`resilience.ServiceUnavailableError`
+        when the API's circuit breaker is open, or when too many calls
+        to this endpoint are already in progress in this process.
+        """
+        return resilience.guard(self._api_url, self._url_path)
+
+
+@dataclass(frozen=True, slots=True)
+class AsyncBaseFetcher(BaseFetcher):
+    """
+    Base class for our HTTP actions that are awaited in async code.
+
+    We reuse the same pooled session, but send requests from a thread pool.
+    So, slow responses do not block the event loop.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send HTTP request without blocking the event loop."""
+        send = sync_to_async(self._send, thread_sensitive=False)
+        return await send(method, url, **kwargs)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        with self.guard():
+            response = self.session().request(
+                method,
+                url,
+                timeout=self._api_timeout,
+                **kwargs,
+            )
+            # Server errors are raised here, so the breaker can see them:
+            if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                response.raise_for_status()
+        return response
+
+
+def _guarded(call: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(call)
+    def wrapper(self: BaseFetcher, *args: Any, **kwargs: Any) -> Any:
+        with self.guard():
+            return call(self, *args, **kwargs)
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_session() -> requests.Session:
+    config = cast(Settings, settings)
+    adapter = HTTPAdapter(
+        pool_connections=config.PLACEHOLDER_API_POOL_SIZE,
+        pool_maxsize=config.PLACEHOLDER_API_POOL_SIZE,
+        # `POST` and `PATCH` are only retried when nothing was sent yet:
+        max_retries=_MeasuredRetry(
+            total=config.PLACEHOLDER_API_RETRIES,
+            backoff_factor=config.PLACEHOLDER_API_RETRY_BACKOFF,
+            status_forcelist=_RETRY_STATUSES,
+            raise_on_status=False,
+        ),
+    )
+    session = _MeasuredSession()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+@final
+class _MeasuredSession(requests.Session):
+    """Records all calls, failed ones are often the slowest."""
+
+    def request(self, *args: Any, **kwargs: Any) -> requests.Response:
+        with instrumentation.upstream_call():
+            return super().request(*args, **kwargs)
+
+
+@final
+class _MeasuredRetry(Retry):
+    """Each retried attempt is an upstream call too, it is timed above."""
+
+    def increment(self, *args: Any, **kwargs: Any) -> Retry:
+        retry = super().increment(*args, **kwargs)  # raises when it is the last
+        instrumentation.record_upstream(0)
+        return retry
+
+
+# Sockets must not be shared between `gunicorn` workers after `fork`:
+os.register_at_fork(after_in_child=_shared_session.cache_clear)
@@ -0,0 +1,185 @@
+"""
+Protection of our workers from slow and failing APIs.
+
+All our fetchers are guarded, see ``BaseFetcher.guard``.
+"""
+
+import contextlib
+import functools
+import os
+import threading
+from http import HTTPStatus
+from types import TracebackType
+from typing import Iterator, Optional, Type, cast, final
+
+import attr
+import requests
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+from server.common.django.types import Settings
+
+_OPEN = 'open'
+_HALF_OPEN = 'half_open'
+_PROBE = 'probe'
+_FAILURES = 'failures'
+
+
+@final
+class ServiceUnavailableError(Exception):
+    """
+    API is not called at all, callers must degrade gracefully.
+
+    Raised when its circuit breaker is open,
+    or when its endpoint's bulkhead is full.
+    Password hashers raise it too, when all hashing slots are busy.
+    """
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class CircuitBreaker(object):
+    """
+    Stops calling an API that keeps failing.
+
+    State lives in the shared cache, so all workers see it.
+    After ``failures`` connection errors, timeouts or server errors
+    within ``reset`` seconds the breaker opens and calls are rejected.
+    After ``reset`` seconds a single trial call is allowed:
+    its success closes the breaker, its failure opens it again.
+    """
+
+    #: Dependencies:
+    _cache: BaseCache
+    _name: str
+    _failures: int
+    _reset: int
+
+    @contextlib.contextmanager
+    def __call__(self) -> Iterator[None]:
+        """Guards the block, raises :class:`ServiceUnavailableError`."""
+        probing = self._enter()
+        try:
+            yield
+        except Exception as exc:
+            if self._is_failure(exc):
+                self._fail(probing=probing)
+            raise
+        finally:
+            # Trial calls that end with client errors must not block others:
+            if probing:
+                self._cache.delete(self._key(_PROBE))
+        if probing:
+            self._cache.delete_many([
+                self._key(_HALF_OPEN),
+                self._key(_FAILURES),
+            ])
+
+    def is_open(self) -> bool:
+        """Tells whether calls are rejected right now."""
+        return bool(self._cache.get(self._key(_OPEN)))
+
+    def _enter(self) -> bool:
+        state = self._cache.get_many([
+            self._key(_OPEN),
+            self._key(_HALF_OPEN),
+        ])
+        if state.get(self._key(_OPEN)):
+            raise self._rejected()
+        if not state.get(self._key(_HALF_OPEN)):
+            return False
+        # Only one trial call is allowed at a time in half-open state:
+        if not self._cache.add(self._key(_PROBE), 1, timeout=self._reset):
+            raise self._rejected()
+        return True
+
+    def _fail(self, *, probing: bool) -> None:
+        failures_key = self._key(_FAILURES)
+        self._cache.add(failures_key, 0, timeout=self._reset)
+        try:
+            failures = self._cache.incr(failures_key)
+        except ValueError:  # it has just expired
+            failures = 1
+        if probing or failures >= self._failures:
+            self._cache.set(self._key(_OPEN), 1, timeout=self._reset)
+            self._cache.set(self._key(_HALF_OPEN), 1, timeout=None)
+            self._cache.delete_many([failures_key, self._key(_PROBE)])
+
+    def _rejected(self) -> ServiceUnavailableError:
+        return ServiceUnavailableError(
+            'Circuit is open: {0}'.format(self._name),
+        )
+
+    def _key(self, suffix: str) -> str:
+        return 'breaker:{0}:{1}'.format(self._name, suffix)
+
+    def _is_failure(self, exc: Exception) -> bool:
+        # Client errors like `404` do not tell anything about API health:
+        if isinstance(exc, requests.HTTPError):
+            return (
+                exc.response is not None and
+                exc.response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+            )
+        return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+@final
+class Bulkhead(object):
+    """
+    Limits concurrent calls to one endpoint in the current process.
+
+    Calls over the limit are rejected right away, instead of waiting
+    for a slow API and taking all the threads with them.
+    """
+
+    def __init__(self, name: str, size: int) -> None:
+        """Create a semaphore with ``size`` slots."""
+        self._name = name
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    def __enter__(self) -> None:
+        """Takes a slot or raises :class:`ServiceUnavailableError`."""
+        if not self._semaphore.acquire(blocking=False):
+            raise ServiceUnavailableError(
+                'Bulkhead is full: {0}'.format(self._name),
+            )
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Frees the slot."""
+        self._semaphore.release()
+
+
+def circuit_breaker(api_url: str) -> CircuitBreaker:
+    """Circuit breaker of the API, it is shared by all workers."""
+    config = cast(Settings, settings)
+    return CircuitBreaker(
+        cache=caches[config.PLACEHOLDER_API_BREAKER_CACHE],
+        name=api_url,
+        failures=config.PLACEHOLDER_API_BREAKER_FAILURES,
+        reset=config.PLACEHOLDER_API_BREAKER_RESET,
+    )
+
+
+@contextlib.contextmanager
+def guard(api_url: str, url_path: str) -> Iterator[None]:
+    """Guards a call to ``url_path`` with its bulkhead and API's breaker."""
+    with _bulkhead(url_path):
+        with circuit_breaker(api_url)():
+            yield
+
+
+@functools.lru_cache(maxsize=None)
+def _bulkhead(url_path: str) -> Bulkhead:
+    return Bulkhead(
+        url_path,
+        size=cast(Settings, settings).PLACEHOLDER_API_BULKHEAD,
+    )
+
+
+# Semaphores must not be shared between `gunicorn` workers after `fork`:
+os.register_at_fork(after_in_child=_bulkhead.cache_clear)
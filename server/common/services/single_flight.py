@@ -0,0 +1,200 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import (  # noqa: WPS235
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+    final,
+)
+
+import attr
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+from server.common.django.types import Settings
+
+_ValueT = TypeVar('_ValueT')
+
+#: How often (in seconds) we check whether other process has finished:
+_POLL_INTERVAL = 0.05
+
+#: Computations in progress in this process, by their keys:
+_flights: Dict[str, 'Future[Any]'] = {}
+_flights_lock = threading.Lock()
+
+_missing = object()
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical computations, like HTTP requests.
+
+    Only one caller computes a ``key`` at a time: in this process,
+    and across all processes sharing the cache. Others wait for it
+    and share its result, its errors are shared in this process too.
+    When it takes longer than ``timeout`` seconds,
+    waiting callers stop waiting and compute the ``key`` themselves.
+    """
+
+    #: Dependencies:
+    _cache: BaseCache
+    _timeout: float
+
+    def __call__(self, key: str, compute: Callable[[], _ValueT]) -> _ValueT:
+        """Return the result of ``compute``, it is called once at a time."""
+        flight, leading = _join(key)
+        if not leading:
+            try:
+                return flight.result(timeout=self._timeout)
+            except FutureTimeoutError:
+                return compute()
+
+        try:
+            flight.set_result(self._lead(key, compute))
+        except Exception as exc:
+            flight.set_exception(exc)
+        finally:
+            _leave(key)
+        return flight.result()
+
+    async def acall(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[_ValueT]],
+    ) -> _ValueT:
+        """Async version of ``__call__`` for awaitable computations."""
+        flight, leading = _join(key)
+        if not leading:
+            try:
+                return await asyncio.wait_for(
+                    # Timeout must not cancel the flight for other callers:
+                    asyncio.shield(asyncio.wrap_future(flight)),
+                    timeout=self._timeout,
+                )
+            except asyncio.TimeoutError:
+                return await compute()
+
+        try:
+            flight.set_result(await self._alead(key, compute))
+        except Exception as exc:
+            flight.set_exception(exc)
+        finally:
+            _leave(key)
+        return flight.result()
+
+    def _lead(self, key: str, compute: Callable[[], _ValueT]) -> _ValueT:
+        shared = self._acquire_or_wait(key)
+        if shared is None:
+            try:
+                computed = compute()
+            except Exception:
+                self._cache.delete(_keys(key)[0])
+                raise
+            return self._publish(key, computed)
+
+        cached_value = shared.get(_keys(key)[1], _missing)
+        if cached_value is _missing:
+            return compute()
+        return cached_value
+
+    async def _alead(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[_ValueT]],
+    ) -> _ValueT:
+        shared = await _in_thread(self._acquire_or_wait)(key)
+        if shared is None:
+            try:
+                computed = await compute()
+            except Exception:
+                await _in_thread(self._cache.delete)(_keys(key)[0])
+                raise
+            await _in_thread(self._publish)(key, computed)
+            return computed
+
+        cached_value = shared.get(_keys(key)[1], _missing)
+        if cached_value is _missing:
+            return await compute()
+        return cached_value
+
+    def _acquire_or_wait(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Takes the lock of the ``key`` for this process.
+
+        When another process has it, we wait for it to finish,
+        and return what it has left in the cache.
+        """
+        flight_key, result_key = _keys(key)
+        if self._cache.add(flight_key, 1, timeout=self._timeout):
+            # Result of the previous flight must not be taken for this one:
+            self._cache.delete(result_key)
+            return None
+
+        shared: Dict[str, Any] = {}
+        deadline = time.monotonic() + self._timeout
+        while time.monotonic() < deadline:
+            time.sleep(_POLL_INTERVAL)
+            shared = self._cache.get_many([flight_key, result_key])
+            if result_key in shared or flight_key not in shared:
+                break
+        return shared
+
+    def _publish(self, key: str, computed: _ValueT) -> _ValueT:
+        flight_key, result_key = _keys(key)
+        # Waiting processes read it, it is not needed for longer than that:
+        self._cache.set(result_key, computed, timeout=self._timeout)
+        self._cache.delete(flight_key)
+        return computed
+
+
+def for_api() -> SingleFlight:
+    """
+    Coalesces concurrent identical API calls, keyed by their cache keys.
+
+    When a cached response expires, only one caller across all workers
+    calls the API, others wait for its response and share it.
+    Use it outside of the fetcher call, so waiting callers
+    do not take slots of the bulkhead.
+    """
+    config = cast(Settings, settings)
+    return SingleFlight(
+        cache=caches[config.PLACEHOLDER_API_SINGLE_FLIGHT_CACHE],
+        timeout=config.PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT,
+    )
+
+
+def _join(key: str) -> Tuple['Future[Any]', bool]:
+    with _flights_lock:
+        flight = _flights.get(key)
+        if flight is None:
+            flight = Future()
+            _flights[key] = flight
+            return flight, True
+        return flight, False
+
+
+def _leave(key: str) -> None:
+    with _flights_lock:
+        _flights.pop(key, None)
+
+
+def _keys(key: str) -> Tuple[str, str]:
+    return '{0}:flight'.format(key), '{0}:flight:result'.format(key)
+
+
+def _in_thread(
+    function: Callable[..., _ValueT],
+) -> Callable[..., Awaitable[_ValueT]]:
+    # Cache backends can do network calls, we don't want to block on them:
+    return sync_to_async(function, thread_sensitive=False)
@@ -1,16 +1,101 @@
 # Caching
 # https://docs.djangoproject.com/en/3.2/topics/cache/
 
-CACHES = {
-    'default': {
-        # TODO: use some other cache in production,
-        # like https://github.com/jazzband/django-redis
+from typing import Any, Dict
+
+from server.settings.components import config
+
+# Shared cache for all workers, like `redis://localhost:6379/0`.
+# When it is not set, each process has its own in-memory cache:
+CACHE_URL = config('DJANGO_CACHE_URL', default='')
+
+
+def _shared_cache(
+    namespace: str,
+    timeout: int,
+    max_entries: int,
+) -> Dict[str, Any]:
+    if CACHE_URL:
+        # `MAX_ENTRIES` is not supported here, configure `maxmemory` instead:
+        return {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': CACHE_URL,
+            'KEY_PREFIX': namespace,
+            'TIMEOUT': timeout,
+        }
+    return {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': namespace,
+        'TIMEOUT': timeout,
+        'OPTIONS': {'MAX_ENTRIES': max_entries},
+    }
+
+
+CACHES = {
+    'default': _shared_cache('default', timeout=300, max_entries=1000),
+
+    # Placeholder API responses are read on each request, so we keep
+    # a small local copy of them for a few seconds:
+    'pictures': {
+        'BACKEND': 'server.common.django.cache.TieredCache',
+        'LOCATION': 'pictures_shared',
+        'OPTIONS': {
+            'MAX_ENTRIES': config(
+                'DJANGO_CACHE_PICTURES_LOCAL_SIZE', cast=int, default=256,
+            ),
+            'LOCAL_TIMEOUT': config(
+                'DJANGO_CACHE_PICTURES_LOCAL_TIMEOUT', cast=int, default=5,
+            ),
+        },
     },
+    'pictures_shared': _shared_cache(
+        'pictures', timeout=60 * 60, max_entries=1000,
+    ),
+
+    # These must be consistent between workers, so there's no local tier:
+    'sessions': _shared_cache(
+        'sessions', timeout=60 * 60 * 24 * 14, max_entries=10000,
+    ),
+    'ratelimit': _shared_cache(
+        'ratelimit', timeout=60 * 60, max_entries=10000,
+    ),
+    'axes': _shared_cache(
+        'axes', timeout=60 * 60 * 24, max_entries=10000,
+    ),
+    'users': _shared_cache(
+        'users', timeout=60 * 15, max_entries=10000,
+    ),
+    'breakers': _shared_cache(
+        'breakers', timeout=60, max_entries=100,
+    ),
+
+    # Used by `{% cache %}` tag, keys have versions of the cached content:
+    'template_fragments': _shared_cache(
+        'fragments', timeout=60 * 10, max_entries=10000,
+    ),
 }
 
 
 # django-axes
 # https://django-axes.readthedocs.io/en/latest/4_configuration.html#configuring-caches
 
-AXES_CACHE = 'default'
+AXES_CACHE = 'axes'
+
+
+# django-ratelimit
+# https://django-ratelimit.readthedocs.io/en/stable/settings.html
+
+RATELIMIT_USE_CACHE = 'ratelimit'
+
+
+# Sessions
+# https://docs.djangoproject.com/en/3.2/topics/http/sessions/
+
+# Sessions are read from cache and written to both cache and database.
+# Use `django.contrib.sessions.backends.signed_cookies`
+# to skip the storage completely:
+SESSION_ENGINE = config(
+    'DJANGO_SESSION_ENGINE',
+    default='django.contrib.sessions.backends.cached_db',
+)
+SESSION_CACHE_ALIAS = 'sessions'
@@ -26,6 +26,9 @@ INSTALLED_APPS: Tuple[str, ...] = (
     'server.apps.pictures',
     'server.apps.identity',
 
+    # Management commands of the whole project, like `startup_profile`:
+    'server.common',
+
     # Default django apps:
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -49,9 +52,20 @@ INSTALLED_APPS: Tuple[str, ...] = (
     'health_check.storage',
 )
 
+# Admin and its docs are loaded on the first request to them,
+# not when a worker boots. It is turned on in production, see `production.py`:
+ADMIN_LAZY_LOAD = False
+
+# Async handlers of class-based views (see `AsyncViewMixin`) are only used
+# in ASGI mode, it is set by `server/asgi.py`. In WSGI mode each of them
+# would start a new event loop, so regular handlers are used there:
+ASYNC_VIEWS = config('DJANGO_SERVER_MODE', default='wsgi') == 'asgi'
+
 MIDDLEWARE: Tuple[str, ...] = (
     # Logging:
     'server.settings.components.logging.LoggingContextVarsMiddleware',
+    'server.common.django.middleware.RequestStatsMiddleware',
+    'server.common.django.middleware.MetricsMiddleware',
 
     # Content Security Policy:
     'csp.middleware.CSPMiddleware',
@@ -1,5 +1,7 @@
 from django.urls import reverse_lazy
 
+from server.settings.components import config
+
 # Django authentication system
 # https://docs.djangoproject.com/en/3.2/topics/auth/
 
@@ -7,16 +9,44 @@ AUTH_USER_MODEL = 'identity.User'
 
 AUTHENTICATION_BACKENDS = (
     'axes.backends.AxesBackend',
-    'django.contrib.auth.backends.ModelBackend',
+    # Same as `ModelBackend`, but logged in users are loaded from cache:
+    'server.apps.identity.intrastructure.django.auth.CachedModelBackend',
 )
 
+# Cache alias (see `caches.py`) for logged in users:
+IDENTITY_USER_CACHE = 'users'
+
 PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'server.apps.identity.intrastructure.django.hashers.Argon2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
     'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
 ]
 
+# Argon2 cost, memory is in KiB. Defaults are the same as Django's ones,
+# pick them for your servers with `manage.py calibrate_hashers`:
+PASSWORD_ARGON2_TIME_COST = config(
+    'DJANGO_PASSWORD_ARGON2_TIME_COST', cast=int, default=2,
+)
+PASSWORD_ARGON2_MEMORY_COST = config(
+    'DJANGO_PASSWORD_ARGON2_MEMORY_COST', cast=int, default=102400,
+)
+PASSWORD_ARGON2_PARALLELISM = config(
+    'DJANGO_PASSWORD_ARGON2_PARALLELISM', cast=int, default=8,
+)
+
+# How many passwords are hashed at the same time by all workers on the host,
+# and for how long (in seconds) others wait for their turn.
+# Slots of killed workers are released by `gunicorn` in `child_exit`.
+# When none is freed in time, `password_hashing_slots_exhausted` is logged
+# and login or registration responds with `503`:
+PASSWORD_HASHING_CONCURRENCY = config(
+    'DJANGO_PASSWORD_HASHING_CONCURRENCY', cast=int, default=2,
+)
+PASSWORD_HASHING_TIMEOUT = config(
+    'DJANGO_PASSWORD_HASHING_TIMEOUT', cast=float, default=5,
+)
+
 
 # Login settings
 # https://docs.djangoproject.com/en/3.2/ref/settings/
@@ -29,7 +59,8 @@ LOGOUT_REDIRECT_URL = reverse_lazy('index')
 # django-ratelimit
 # https://django-ratelimit.readthedocs.io/en/stable/
 
-RATELIMIT_ENABLE = True
+# Disable it only for load tests, all their users come from a single ip:
+RATELIMIT_ENABLE = config('DJANGO_RATELIMIT_ENABLE', cast=bool, default=True)
 
 
 # django-axes
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, Callable, final
 
 import structlog
 
+from server.settings.components import config
+
 if TYPE_CHECKING:
     from django.http import HttpRequest, HttpResponse
 
@@ -59,9 +61,25 @@ LOGGING = {
             'level': 'ERROR',
             'propagate': False,
         },
+        'server': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
+# Part of requests (from 0 to 1) that is logged with performance stats,
+# see `RequestStatsMiddleware`:
+REQUEST_STATS_SAMPLE_RATE = config(
+    'DJANGO_REQUEST_STATS_SAMPLE_RATE', cast=float, default=0.1,
+)
+
+# Requests slower than this (in seconds) are always logged:
+REQUEST_STATS_SLOW_THRESHOLD = config(
+    'DJANGO_REQUEST_STATS_SLOW_THRESHOLD', cast=float, default=1,
+)
+
 
 @final
 class LoggingContextVarsMiddleware(object):
@@ -1,6 +1,8 @@
 # Custom settings for Placeholder API integration.
 # All settings must be documented!
 
+from decouple import Csv
+
 from server.settings.components import config
 
 # API url we use to fetch data, can be switched from real Placeholder API
@@ -9,3 +11,116 @@ PLACEHOLDER_API_URL = config('DJANGO_PLACEHOLDER_API_URL')
 
 # API default timeout in seconds:
 PLACEHOLDER_API_TIMEOUT = config('DJANGO_PLACEHOLDER_API_TIMEOUT', cast=int)
+
+# Cache alias (see `caches.py`) to store API responses in:
+PLACEHOLDER_API_CACHE = 'pictures'
+
+# For how long (in seconds) API responses are considered fresh:
+PLACEHOLDER_API_CACHE_TTL = config(
+    'DJANGO_PLACEHOLDER_API_CACHE_TTL', cast=int, default=60,
+)
+
+# For how long (in seconds) stale API responses are still served,
+# while a single worker refreshes them in background:
+PLACEHOLDER_API_CACHE_STALE_TTL = config(
+    'DJANGO_PLACEHOLDER_API_CACHE_STALE_TTL', cast=int, default=600,
+)
+
+# Concurrent requests for the same expired response are coalesced:
+# only one of them, across all workers, calls the API. Others wait for it
+# at most this many seconds, then they call the API themselves.
+# Locks must be seen by all workers at once, so there's no local tier:
+PLACEHOLDER_API_SINGLE_FLIGHT_CACHE = 'pictures_shared'
+PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT = config(
+    'DJANGO_PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT', cast=float, default=10,
+)
+
+# How many pictures the dashboard shows:
+PLACEHOLDER_API_PICTURES_LIMIT = config(
+    'DJANGO_PLACEHOLDER_API_PICTURES_LIMIT', cast=int, default=10,
+)
+
+# Picture feeds for these limits are fetched before users ask for them,
+# see `manage.py warm_pictures`. It runs on each worker boot
+# and refreshes feeds every `INTERVAL` seconds, keep it below `CACHE_TTL`:
+PLACEHOLDER_API_WARM_LIMITS = config(
+    'DJANGO_PLACEHOLDER_API_WARM_LIMITS',
+    cast=Csv(int),
+    default=str(PLACEHOLDER_API_PICTURES_LIMIT),
+)
+PLACEHOLDER_API_WARM_INTERVAL = config(
+    'DJANGO_PLACEHOLDER_API_WARM_INTERVAL', cast=float, default=30,
+)
+
+# How many keep-alive connections each worker process holds to the API:
+PLACEHOLDER_API_POOL_SIZE = config(
+    'DJANGO_PLACEHOLDER_API_POOL_SIZE', cast=int, default=10,
+)
+
+# How many times we retry idempotent requests on connection errors
+# and temporary server errors, with exponential backoff factor in seconds:
+PLACEHOLDER_API_RETRIES = config(
+    'DJANGO_PLACEHOLDER_API_RETRIES', cast=int, default=2,
+)
+PLACEHOLDER_API_RETRY_BACKOFF = config(
+    'DJANGO_PLACEHOLDER_API_RETRY_BACKOFF', cast=float, default=0.1,
+)
+
+# Cache alias (see `caches.py`) to share circuit breaker state between workers.
+# After this many failures within `RESET` seconds we stop calling the API
+# for `RESET` seconds, then a single trial call decides whether to resume:
+PLACEHOLDER_API_BREAKER_CACHE = 'breakers'
+PLACEHOLDER_API_BREAKER_FAILURES = config(
+    'DJANGO_PLACEHOLDER_API_BREAKER_FAILURES', cast=int, default=5,
+)
+PLACEHOLDER_API_BREAKER_RESET = config(
+    'DJANGO_PLACEHOLDER_API_BREAKER_RESET', cast=int, default=30,
+)
+
+# How many calls to the same endpoint each worker process makes at once,
+# extra calls are rejected instead of waiting:
+PLACEHOLDER_API_BULKHEAD = config(
+    'DJANGO_PLACEHOLDER_API_BULKHEAD', cast=int, default=8,
+)
+
+# Users are synced with the API from the outbox by a separate worker,
+# see `manage.py process_lead_outbox`. How many rows one batch has:
+LEAD_OUTBOX_BATCH_SIZE = config(
+    'DJANGO_LEAD_OUTBOX_BATCH_SIZE', cast=int, default=100,
+)
+
+# How many requests one worker sends at the same time:
+LEAD_OUTBOX_CONCURRENCY = config(
+    'DJANGO_LEAD_OUTBOX_CONCURRENCY', cast=int, default=4,
+)
+
+# For how long (in seconds) claimed rows are hidden from other workers:
+LEAD_OUTBOX_LEASE = config('DJANGO_LEAD_OUTBOX_LEASE', cast=int, default=600)
+
+# How many times we try to send a row, delay (in seconds) doubles each time:
+LEAD_OUTBOX_MAX_ATTEMPTS = config(
+    'DJANGO_LEAD_OUTBOX_MAX_ATTEMPTS', cast=int, default=10,
+)
+LEAD_OUTBOX_RETRY_DELAY = config(
+    'DJANGO_LEAD_OUTBOX_RETRY_DELAY', cast=int, default=10,
+)
+
+# How long (in seconds) the worker sleeps when the outbox is empty:
+LEAD_OUTBOX_POLL_INTERVAL = config(
+    'DJANGO_LEAD_OUTBOX_POLL_INTERVAL', cast=float, default=1,
+)
+
+# Users left without `lead_id` are fixed by `manage.py reconcile_leads`.
+# How many users are read at once, and how many requests are sent
+# at the same time (keep it under `PLACEHOLDER_API_BULKHEAD`):
+LEAD_RECONCILE_CHUNK_SIZE = config(
+    'DJANGO_LEAD_RECONCILE_CHUNK_SIZE', cast=int, default=500,
+)
+LEAD_RECONCILE_CONCURRENCY = config(
+    'DJANGO_LEAD_RECONCILE_CONCURRENCY', cast=int, default=4,
+)
+
+# Max requests per second sent by reconciliation, `0` disables the limit:
+LEAD_RECONCILE_RATE = config(
+    'DJANGO_LEAD_RECONCILE_RATE', cast=float, default=10,
+)
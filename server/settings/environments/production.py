@@ -6,6 +6,7 @@ values are overridden.
 """
 
 from server.settings.components import config
+from server.settings.components.common import INSTALLED_APPS, TEMPLATES
 
 # Production flags:
 # https://docs.djangoproject.com/en/3.2/howto/deployment/
@@ -21,6 +22,21 @@ ALLOWED_HOSTS = [
 ]
 
 
+# Startup
+# https://docs.djangoproject.com/en/3.2/ref/contrib/admin/#discovery-of-admin-files
+
+# Workers are restarted often (see `max_requests` in `gunicorn_config.py`),
+# while admin is rarely used. So, it is not loaded until it is requested:
+ADMIN_LAZY_LOAD = config('DJANGO_ADMIN_LAZY_LOAD', cast=bool, default=True)
+if ADMIN_LAZY_LOAD:
+    # Unlike the default one, it does not import `admin.py` modules on boot:
+    INSTALLED_APPS = tuple(
+        'django.contrib.admin.apps.SimpleAdminConfig'
+        if app == 'django.contrib.admin' else app
+        for app in INSTALLED_APPS
+    )
+
+
 # Staticfiles
 # https://docs.djangoproject.com/en/3.2/ref/contrib/staticfiles/
 
@@ -45,6 +61,20 @@ STATICFILES_STORAGE = (
 MEDIA_ROOT = '/var/www/django/media'
 
 
+# Templates
+# https://docs.djangoproject.com/en/3.2/ref/templates/api/#django.template.loaders.cached.Loader
+
+# Templates are compiled once per process, not on each render.
+# Django does it implicitly without `debug`, we make sure it is always on:
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [  # type: ignore[index]
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -9,30 +9,34 @@ This examples uses Django's default media
 files serving technique in development.
 """
 
+from typing import cast
+
 from django.conf import settings
-from django.contrib import admin
-from django.contrib.admindocs import urls as admindocs_urls
 from django.urls import include, path
 from django.views.generic import TemplateView
 from health_check import urls as health_urls
 
 from server.apps.identity import urls as identity_urls
 from server.apps.pictures import urls as pictures_urls
-from server.apps.pictures.views import IndexView
+from server.apps.pictures.views.pages import IndexView
+from server.common.django import views
+from server.common.django.types import Settings
+from server.common.django.urls import lazy_include
 
-admin.autodiscover()
+_LAZY_ADMIN = cast(Settings, settings).ADMIN_LAZY_LOAD
 
 urlpatterns = [
     # Apps:
     path('pictures/', include(pictures_urls, namespace='pictures')),
     path('identity/', include(identity_urls, namespace='identity')),
 
-    # Health checks:
+    # Health checks and monitoring:
     path('health/', include(health_urls)),
+    path('metrics', views.metrics, name='metrics'),
 
     # django-admin:
-    path('admin/doc/', include(admindocs_urls)),
-    path('admin/', admin.site.urls),
+    lazy_include('admin/', 'server.admin_urls') if _LAZY_ADMIN
+    else path('admin/', include('server.admin_urls')),
 
     # Text and xml static files:
     path('robots.txt', TemplateView.as_view(
@@ -9,5 +9,8 @@ It may be also used for extending doctest's context:
 pytest_plugins = [
     # Should be the first custom one:
     'tests.plugins.django_settings',
+    'tests.plugins.identity.users',
+    'tests.plugins.placeholder',
+    'tests.plugins.request_budget',
     # TODO: add your own plugins here!
 ]
@@ -0,0 +1,101 @@
+"""
+Load test of the main user journey.
+
+Run it against a running server, see ``docs/pages/template/testing.rst``:
+
+.. code:: bash
+
+  locust -f tests/load/locustfile.py --host http://localhost:8000
+
+Server must have ``DJANGO_RATELIMIT_ENABLE=False``,
+since all simulated users come from a single ip.
+"""
+
+import uuid
+from typing import Dict
+
+from locust import HttpUser, SequentialTaskSet, between, task
+from locust.clients import HttpSession
+
+_PASSWORD = 'load-test-Pa55word'  # noqa: S105
+
+
+class UserJourney(SequentialTaskSet):
+    """Register, browse pictures, change profile and leave."""
+
+    @task
+    def register(self) -> None:
+        """Create a new account, each loop is made by a new user."""
+        self.email = '{0}@load.test'.format(uuid.uuid4().hex)
+        _post(self.client, '/identity/registration', {
+            'email': self.email,
+            'password1': _PASSWORD,
+            'password2': _PASSWORD,
+            **_profile('Load'),
+        })
+
+    @task
+    def login(self) -> None:
+        """Log into the new account."""
+        _post(self.client, '/identity/login', {
+            'username': self.email,
+            'password': _PASSWORD,
+        })
+
+    @task
+    def dashboard(self) -> None:
+        """Pictures from Placeholder API."""
+        self.client.get('/pictures/dashboard')
+
+    @task
+    def add_favourite(self) -> None:
+        """Save one picture from the dashboard."""
+        _post(self.client, '/pictures/dashboard', {
+            'foreign_id': '1',
+            'url': 'https://via.placeholder.com/600/000001',
+        })
+
+    @task
+    def favourites(self) -> None:
+        """List of saved pictures."""
+        self.client.get('/pictures/favourites')
+
+    @task
+    def update_profile(self) -> None:
+        """Change profile, it is synced to Placeholder API."""
+        _post(self.client, '/identity/update', _profile('Updated'))
+
+    @task
+    def logout(self) -> None:
+        """Finish the journey, the next one starts from scratch."""
+        self.client.get('/identity/logout')
+        self.client.cookies.clear()
+
+
+class WebsiteUser(HttpUser):
+    """Simulated user, think time is between 1 and 3 seconds."""
+
+    tasks = [UserJourney]
+    wait_time = between(1, 3)  # type: ignore[no-untyped-call]
+
+
+def _profile(name: str) -> Dict[str, str]:
+    return {
+        'first_name': name,
+        'last_name': 'User',
+        'date_of_birth': '2000-01-01',
+        'address': 'City',
+        'job_title': 'Tester',
+        'phone': '+7 900 000 00 00',
+    }
+
+
+def _post(client: HttpSession, url: str, form: Dict[str, str]) -> None:
+    # Form pages set the cookie, the token is sent back in the form:
+    client.request(  # type: ignore[no-untyped-call]
+        'GET', url, name='{0} [form]'.format(url),
+    )
+    client.post(url, data={
+        **form,
+        'csrfmiddlewaretoken': client.cookies['csrftoken'],
+    })
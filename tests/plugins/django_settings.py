@@ -20,7 +20,7 @@ def _password_hashers(settings) -> None:
 def _auth_backends(settings) -> None:
     """Deactivates security backend from Axes app."""
     settings.AUTHENTICATION_BACKENDS = (
-        'django.contrib.auth.backends.ModelBackend',
+        'server.apps.identity.intrastructure.django.auth.CachedModelBackend',
     )
 
 
@@ -37,13 +37,28 @@ def cache(settings) -> BaseCache:
     """Modifies how cache is used in Django tests."""
     test_cache = 'test'
 
-    # Patching cache settings:
-    settings.CACHES[test_cache] = {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    fragments_cache = 'template_fragments'
+
+    # Patching cache settings, `{% cache %}` tag always uses its own alias:
+    settings.CACHES = {
+        **settings.CACHES,
+        test_cache: {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        fragments_cache: {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': fragments_cache,
+        },
     }
     settings.RATELIMIT_USE_CACHE = test_cache
     settings.AXES_CACHE = test_cache
+    settings.SESSION_CACHE_ALIAS = test_cache
+    settings.PLACEHOLDER_API_CACHE = test_cache
+    settings.PLACEHOLDER_API_SINGLE_FLIGHT_CACHE = test_cache
+    settings.IDENTITY_USER_CACHE = test_cache
+    settings.PLACEHOLDER_API_BREAKER_CACHE = test_cache
 
     # Clearing cache:
     caches[test_cache].clear()
+    caches[fragments_cache].clear()
     return caches[test_cache]
@@ -0,0 +1,43 @@
+"""
+Local stub of :term:`Placeholder API`, see ``docker/placeholder``.
+
+Benchmarks run against it, so they do not depend on the real API.
+Its latency is set with ``--placeholder-latency`` option in milliseconds.
+"""
+
+import threading
+from typing import Iterator
+
+import pytest
+
+from docker.placeholder import simulator
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Adds options to configure the stub."""
+    parser.addoption(
+        '--placeholder-latency',
+        type=float,
+        default=0,
+        help='Latency of the Placeholder API stub in milliseconds.',
+    )
+
+
+@pytest.fixture(scope='session')
+def placeholder_server(pytestconfig: pytest.Config) -> Iterator[str]:
+    """Starts the stub in a background thread, returns its url."""
+    server = simulator.create_server(
+        port=0,
+        latency=pytestconfig.getoption('placeholder_latency') / 1000,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield 'http://127.0.0.1:{0}/'.format(server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def placeholder_api(settings, placeholder_server: str) -> str:
+    """Switches our fetchers to the stub."""
+    settings.PLACEHOLDER_API_URL = placeholder_server
+    return placeholder_server
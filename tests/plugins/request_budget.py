@@ -0,0 +1,79 @@
+"""
+Asserts request budgets of our views.
+
+Views declare them with ``request_budget`` decorator.
+Each request made by Django's test client is measured,
+the test fails when the view spends more than declared.
+Streaming responses are read inside the measurement, so it is complete.
+"""
+
+from typing import Any, Callable, Dict, List
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.urls import Resolver404, resolve
+
+from server.common import instrumentation
+
+
+@pytest.fixture(autouse=True)
+def _request_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Measures all requests of the test client."""
+    send_request = Client.request
+
+    def measured_request(client: Client, **request: Any) -> Any:  # noqa: WPS430
+        queries: List[str] = []
+        token = instrumentation.start()
+        with connection.execute_wrapper(_QueriesLog(queries)):
+            response: Any = send_request(client, **request)
+            if response.streaming:  # its queries are made while reading it
+                response.streaming_content = list(response.streaming_content)
+        _assert_budget(
+            request,
+            queries,
+            upstream_calls=instrumentation.stop(token).upstream_calls,
+        )
+        return response
+
+    monkeypatch.setattr(Client, 'request', measured_request)
+
+
+class _QueriesLog(object):
+    def __init__(self, queries: List[str]) -> None:
+        self._queries = queries
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        *args: Any,
+    ) -> Any:
+        self._queries.append(sql)
+        return execute(sql, *args)
+
+
+def _assert_budget(
+    request: Dict[str, Any],
+    queries: List[str],
+    *,
+    upstream_calls: int,
+) -> None:
+    try:
+        view = resolve(request['PATH_INFO']).func
+    except Resolver404:
+        return
+    budgets = getattr(getattr(view, 'view_class', view), 'request_budgets', {})
+    budget = budgets.get(request['REQUEST_METHOD'])
+    if budget is None:
+        return
+
+    where = '{0} {1}'.format(request['REQUEST_METHOD'], request['PATH_INFO'])
+    if len(queries) > budget.db_queries:
+        pytest.fail('{0} made {1} queries, budget is {2}:\n{3}'.format(
+            where, len(queries), budget.db_queries, '\n'.join(queries),
+        ))
+    if upstream_calls > budget.upstream_calls:
+        pytest.fail('{0} made {1} API calls, budget is {2}'.format(
+            where, upstream_calls, budget.upstream_calls,
+        ))
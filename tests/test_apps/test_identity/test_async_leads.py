@@ -0,0 +1,30 @@
+import asyncio
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.models import User
+
+_LEAD_ID = 11
+
+
+def test_async_lead_create(placeholder_api: str) -> None:
+    """Ensures that leads are created in the API in event loop."""
+    lead_create = placeholder.AsyncLeadCreate(
+        api_url=placeholder_api,
+        api_timeout=1,
+    )
+
+    response = asyncio.run(lead_create(user=User(email='some@example.com')))
+
+    assert response.id > 0
+
+
+def test_async_lead_update(placeholder_api: str) -> None:
+    """Ensures that leads are updated in the API in event loop."""
+    lead_update = placeholder.AsyncLeadUpdate(
+        api_url=placeholder_api,
+        api_timeout=1,
+    )
+    user = User(email='some@example.com', lead_id=_LEAD_ID)
+
+    # API errors are raised:
+    asyncio.run(lead_update(user=user))
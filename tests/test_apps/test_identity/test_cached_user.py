@@ -0,0 +1,39 @@
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.models import User
+
+
+@pytest.mark.django_db()
+def test_cached_user(
+    client: Client,
+    login: User,
+    django_assert_num_queries,
+) -> None:
+    """Ensures that logged in pages do not query users and sessions."""
+    client.get(reverse('identity:user_update'))  # warm up the cache
+
+    with django_assert_num_queries(0):
+        response = client.get(reverse('identity:user_update'))
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db()
+def test_cached_user_invalidated(
+    client: Client,
+    login: User,
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Ensures that cached users are updated after commit."""
+    client.get(reverse('identity:user_update'))  # warm up the cache
+    with django_capture_on_commit_callbacks(execute=True):
+        login.first_name = 'Changed'
+        login.save(update_fields=['first_name'])
+
+    response = client.get(reverse('identity:user_update'))
+
+    assert 'Changed' in response.content.decode()
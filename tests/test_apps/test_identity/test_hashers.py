@@ -0,0 +1,107 @@
+import logging
+import threading
+from http import HTTPStatus
+from io import StringIO
+from typing import List
+
+import pytest
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management import CommandError, call_command
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.intrastructure.django import hashers
+from server.common.services.resilience import ServiceUnavailableError
+
+_PASSWORD = 'secret'  # noqa: S105
+
+
+@pytest.fixture(autouse=True)
+def _argon2(settings) -> None:
+    """Cheap Argon2 cost, so tests are fast."""
+    settings.PASSWORD_HASHERS = [
+        'server.apps.identity.intrastructure.django.hashers.Argon2PasswordHasher',  # noqa: E501
+    ]
+    settings.PASSWORD_ARGON2_TIME_COST = 1
+    settings.PASSWORD_ARGON2_MEMORY_COST = 64
+    settings.PASSWORD_ARGON2_PARALLELISM = 1
+
+
+def test_cost_from_settings(settings) -> None:
+    """Ensures that passwords are rehashed when the cost changes."""
+    encoded = make_password(_PASSWORD)
+    rehashed: List[str] = []
+
+    settings.PASSWORD_ARGON2_TIME_COST = 2
+
+    assert 'm=64,t=1,p=1' in encoded
+    assert check_password(_PASSWORD, encoded, setter=rehashed.append)
+    assert rehashed == [_PASSWORD]
+
+
+@pytest.fixture()
+def _slots_exhausted(settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    """No hashing slot is ever freed."""
+    settings.PASSWORD_HASHING_TIMEOUT = 0
+    monkeypatch.setattr(
+        hashers,
+        'hashing_slots',
+        lambda: threading.Semaphore(0),
+    )
+
+
+@pytest.mark.usefixtures('_slots_exhausted')
+def test_hashing_slots_exhausted(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensures that passwords are not hashed without a slot."""
+    monkeypatch.setattr(logging.getLogger('server'), 'propagate', value=True)
+
+    with pytest.raises(ServiceUnavailableError, match='hashing slots'):
+        make_password(_PASSWORD)
+    assert 'password_hashing_slots_exhausted' in caplog.text
+    assert hashers.held_slots().value == 0
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('_slots_exhausted')
+def test_login_hashing_unavailable(client: Client) -> None:
+    """Ensures that logins are rejected when hashing slots are exhausted."""
+    response = client.post(
+        reverse('identity:login'),
+        data={'username': 'some@example.com', 'password': _PASSWORD},
+    )
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+
+def test_hashing_slots_held() -> None:
+    """Ensures that held slots are counted, so killed workers free them."""
+    hashers.hashing_slots.cache_clear()
+    encoded = make_password(_PASSWORD)
+
+    assert check_password(_PASSWORD, encoded)
+    assert hashers.held_slots().value == 0
+
+
+def test_calibration() -> None:
+    """Ensures that the profile fits the target latency."""
+    stdout = StringIO()
+
+    call_command(
+        'calibrate_hashers',
+        target=5,
+        memory_costs=[64],
+        parallelism=1,
+        rounds=1,
+        stdout=stdout,
+    )
+
+    assert 'DJANGO_PASSWORD_ARGON2_MEMORY_COST=64\n' in stdout.getvalue()
+
+
+def test_calibration_failed() -> None:
+    """Ensures that impossible targets are reported."""
+    with pytest.raises(CommandError, match='cheapest cost'):
+        call_command('calibrate_hashers', target=0, memory_costs=[64])
@@ -0,0 +1,124 @@
+from http import HTTPStatus
+from typing import List
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from requests import ConnectionError
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.usecases.lead_outbox_enqueue import (
+    LeadOutboxEnqueue,
+)
+from server.apps.identity.models import LeadOutbox, User
+from server.common.services.resilience import ServiceUnavailableError
+from tests.plugins.identity.users import RegistrationData
+
+_LEAD_ID = 11
+
+
+@pytest.fixture()
+def registered_user(
+    client: Client,
+    registration_data: RegistrationData,
+) -> User:
+    """Registers new user with the outbox entry."""
+    response = client.post(
+        reverse('identity:registration'),
+        data=registration_data,
+    )
+
+    assert response.status_code == HTTPStatus.FOUND
+    return User.objects.get(email=registration_data['email'])
+
+
+@pytest.mark.django_db()
+def test_registration_enqueues(registered_user: User) -> None:
+    """Ensures that registration does not call the API itself."""
+    assert registered_user.lead_id is None
+    assert registered_user.lead_outbox.count() == 1
+
+
+@pytest.mark.django_db()
+def test_outbox_processed(
+    registered_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that the worker saves `lead_id` and cleans the outbox."""
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda _, user: placeholder.UserResponse(id=_LEAD_ID),
+    )
+
+    call_command('process_lead_outbox', once=True)
+
+    registered_user.refresh_from_db()
+    assert registered_user.lead_id == _LEAD_ID
+    assert not LeadOutbox.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_outbox_failed(
+    registered_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that failed entries are kept for later retries."""
+    monkeypatch.setattr(placeholder.LeadCreate, '__call__', _broken)
+
+    call_command('process_lead_outbox', once=True)
+
+    registered_user.refresh_from_db()
+    entry = registered_user.lead_outbox.get()
+    assert registered_user.lead_id is None
+    assert entry.attempts == 1
+    assert entry.last_error
+
+
+@pytest.mark.django_db()
+def test_updates_coalesced(
+    create_new_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that several edits in a row are sent once."""
+    updated: List[User] = []
+    monkeypatch.setattr(
+        placeholder.LeadUpdate,
+        '__call__',
+        lambda _, user: updated.append(user),
+    )
+    create_new_user.lead_id = _LEAD_ID
+    create_new_user.save(update_fields=['lead_id'])
+
+    LeadOutboxEnqueue()(create_new_user)
+    LeadOutboxEnqueue()(create_new_user)
+    call_command('process_lead_outbox', once=True)
+
+    assert updated == [create_new_user]
+    assert not LeadOutbox.objects.exists()
+
+
+def _broken(*args: object, **kwargs: object) -> placeholder.UserResponse:
+    raise ConnectionError('Upstream is down')
+
+
+@pytest.mark.django_db()
+def test_outbox_deferred(
+    registered_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that unavailable API does not spend attempts."""
+    monkeypatch.setattr(placeholder.LeadCreate, '__call__', _unavailable)
+
+    call_command('process_lead_outbox', once=True)
+
+    entry = registered_user.lead_outbox.get()
+    assert entry.attempts == 0
+    assert entry.available_at > timezone.now()
+    assert entry.last_error
+
+
+def _unavailable(*args: object, **kwargs: object) -> placeholder.UserResponse:
+    raise ServiceUnavailableError('Circuit is open')
@@ -0,0 +1,106 @@
+import itertools
+from io import StringIO
+from typing import Iterator, List
+
+import pytest
+from django.core.management import call_command
+from requests import ConnectionError
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.usecases.lead_reconcile import LeadReconcile
+from server.apps.identity.models import LeadOutbox, User
+
+_USERS = 3
+_LEAD_ID = 100
+
+
+@pytest.fixture()
+def unsynced_users(user_factory, faker_seed: int) -> List[User]:
+    """Users that were never sent to the API."""
+    return [
+        User.objects.create(**user_factory(faker_seed + index))
+        for index in range(_USERS)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _reconcile_settings(settings) -> None:
+    """Small chunks and no rate limit, so tests are fast."""
+    settings.LEAD_RECONCILE_CHUNK_SIZE = 2
+    settings.LEAD_RECONCILE_RATE = 0
+
+
+@pytest.mark.django_db()
+def test_users_reconciled(
+    unsynced_users: List[User],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that all users get their `lead_id` in chunks."""
+    lead_ids = itertools.count(1)
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda _, user: placeholder.UserResponse(id=next(lead_ids)),
+    )
+    stdout = StringIO()
+
+    call_command('reconcile_leads', stdout=stdout)
+
+    assert 'Reconciled 3 users, 0 failed.' in stdout.getvalue()
+    assert set(
+        User.objects.values_list('lead_id', flat=True),
+    ) == set(range(1, _USERS + 1))
+
+
+@pytest.mark.django_db()
+def test_users_synced_meanwhile(
+    unsynced_users: List[User],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that `lead_id` saved by the outbox worker is not overwritten."""
+    synced_user = unsynced_users[0]
+    chunks = LeadReconcile._chunks  # noqa: WPS437
+
+    def chunks_synced_meanwhile(  # noqa: WPS430
+        self: LeadReconcile,
+    ) -> Iterator[List[User]]:
+        for chunk in chunks(self):
+            # The outbox worker syncs the user while we call the API:
+            User.objects.filter(pk=synced_user.pk).update(lead_id=_LEAD_ID)
+            yield chunk
+
+    lead_ids = itertools.count(1)
+    monkeypatch.setattr(LeadReconcile, '_chunks', chunks_synced_meanwhile)
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda _, user: placeholder.UserResponse(id=next(lead_ids)),
+    )
+    stdout = StringIO()
+
+    call_command('reconcile_leads', stdout=stdout)
+
+    assert 'Reconciled 2 users' in stdout.getvalue()
+    synced_user.refresh_from_db()
+    assert synced_user.lead_id == _LEAD_ID
+
+
+@pytest.mark.django_db()
+def test_users_skipped(
+    unsynced_users: List[User],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that failed and pending users are left as they are."""
+    pending, *failed = unsynced_users
+    LeadOutbox.objects.create(user=pending)
+    monkeypatch.setattr(placeholder.LeadCreate, '__call__', _broken)
+    stdout = StringIO()
+
+    call_command('reconcile_leads', stdout=stdout)
+
+    assert 'Reconciled 0 users, 2 failed.' in stdout.getvalue()
+    assert not User.objects.filter(lead_id__isnull=False).exists()
+
+
+def _broken(*args: object, **kwargs: object) -> placeholder.UserResponse:
+    raise ConnectionError('Upstream is down')
@@ -5,7 +5,11 @@ from django.test import Client
 from django.urls import reverse
 
 from server.apps.identity.models import User
-from tests.test_apps.conftest import LoginData, RegistrationData, UserAssertion
+from tests.plugins.identity.users import (
+    LoginData,
+    RegistrationData,
+    UserAssertion,
+)
 
 
 @pytest.mark.django_db()
@@ -5,7 +5,7 @@ from django.test import Client
 from django.urls import reverse
 
 from server.apps.identity.models import User
-from tests.test_apps.conftest import RegistrationData, UserAssertion
+from tests.plugins.identity.users import RegistrationData, UserAssertion
 
 
 @pytest.mark.django_db()
@@ -53,7 +53,7 @@ def assert_correct_favourite_pictures() -> FavAssertion:
     """Check that user has correct favourite pictures."""
 
     def factory(email: str, expected: list[PictureData]) -> None:
-        favourite = FavouritesList()(User.objects.get(email=email).id).all()
+        favourite = FavouritesList()(User.objects.get(email=email).id).pictures
         assert len(favourite) == len(expected)
         for idx, _ in enumerate(expected):
             assert favourite[idx].url == expected[idx]['url']
@@ -0,0 +1,16 @@
+import asyncio
+
+from server.apps.pictures.intrastructure.services.placeholder import (
+    AsyncPicturesFetch,
+)
+
+_LIMIT = 3
+
+
+def test_async_pictures_fetch(placeholder_api: str) -> None:
+    """Ensures that pictures are fetched from the API in event loop."""
+    pictures_fetch = AsyncPicturesFetch(api_url=placeholder_api, api_timeout=1)
+
+    pictures = asyncio.run(pictures_fetch(limit=_LIMIT))
+
+    assert [picture.id for picture in pictures] == [1, 2, 3]
@@ -0,0 +1,82 @@
+import json
+from http import HTTPStatus
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.models import User
+from tests.test_apps.test_pictures.conftest import FavAssertion, PictureData
+
+
+@pytest.mark.django_db()
+def test_import_favourites(
+    client: Client,
+    login: User,
+    picture_data_list: list[PictureData],
+    assert_correct_favourite_pictures: FavAssertion,
+) -> None:
+    """This test checks that many favourites are added at once."""
+    response = client.post(
+        reverse('pictures:favourites_import'),
+        data=''.join(_dump_jsonl(picture_data_list * 2)),
+        content_type='application/x-ndjson',
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'processed': len(picture_data_list) * 2}
+    assert_correct_favourite_pictures(login.email, picture_data_list)
+
+
+@pytest.mark.django_db()
+def test_import_invalid_favourites(
+    client: Client,
+    login: User,
+    picture_data_list: list[PictureData],
+    assert_correct_favourite_pictures: FavAssertion,
+) -> None:
+    """This test checks that nothing is added when some items are invalid."""
+    invalid_picture = {'foreign_id': 'abc', 'url': 'not-an-url'}
+    response = client.post(
+        reverse('pictures:favourites_import'),
+        data=''.join(_dump_jsonl([*picture_data_list, invalid_picture])),
+        content_type='application/x-ndjson',
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert_correct_favourite_pictures(login.email, [])
+
+
+@pytest.mark.django_db()
+def test_export_favourites(
+    client: Client,
+    login: User,
+    picture_data_list: list[PictureData],
+    tmp_path: Path,
+) -> None:
+    """This test checks that imported favourites are exported."""
+    source = tmp_path / 'favourites.jsonl'
+    source.write_text(''.join(_dump_jsonl(picture_data_list)))
+
+    call_command('favourites_import', login.email, str(source))
+    response = client.get(
+        reverse('pictures:favourites_export'),
+        data={'format': 'csv'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response['Content-Type'] == 'text/csv'
+    assert response.getvalue().decode().splitlines() == [
+        'foreign_id,url',
+        *[
+            '{0},{1}'.format(picture['foreign_id'], picture['url'])
+            for picture in picture_data_list
+        ],
+    ]
+
+
+def _dump_jsonl(pictures: Sequence[Mapping[str, object]]) -> list[str]:
+    return ['{0}\n'.format(json.dumps(picture)) for picture in pictures]
@@ -0,0 +1,40 @@
+import pytest
+from django_test_migrations.migrator import Migrator
+
+_PICTURE_URL = 'https://via.placeholder.com/600/92c952'
+
+
+@pytest.mark.django_db()
+def test_favourites_deduplicated(migrator: Migrator) -> None:
+    """This test checks that duplicate favourites are removed."""
+    old_state = migrator.apply_initial_migration(
+        ('pictures', '0002_favourites_keyset_index'),
+    )
+    user = old_state.apps.get_model('identity', 'User').objects.create(
+        email='first@example.com',
+    )
+    favourite_picture = old_state.apps.get_model(
+        'pictures',
+        'FavouritePicture',
+    )
+    for foreign_id in (1, 1, 2):
+        favourite_picture.objects.create(
+            user=user,
+            foreign_id=foreign_id,
+            url=_PICTURE_URL,
+        )
+
+    new_state = migrator.apply_tested_migration(
+        ('pictures', '0003_favourites_unique'),
+    )
+    favourite_picture = new_state.apps.get_model(
+        'pictures',
+        'FavouritePicture',
+    )
+
+    assert list(
+        favourite_picture.objects.order_by('id').values_list(
+            'foreign_id',
+            flat=True,
+        ),
+    ) == [1, 2]
@@ -0,0 +1,75 @@
+import re
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.models import User
+from server.apps.pictures.intrastructure.services.placeholder import (
+    PictureResponse,
+)
+from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
+from tests.plugins.identity.users import RegistrationData
+from tests.test_apps.test_pictures.conftest import PictureData
+
+_CSRF_TOKEN = re.compile('name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+@pytest.fixture()
+def _pictures(
+    monkeypatch: pytest.MonkeyPatch,
+    picture_data: PictureData,
+) -> None:
+    """The same feed for all users."""
+    def fake_fetch(  # noqa: WPS430
+        *args,
+        **kwargs,
+    ) -> list[PictureResponse]:
+        return [PictureResponse(
+            id=picture_data['foreign_id'],
+            url=picture_data['url'],
+        )]
+
+    monkeypatch.setattr(PicturesFetch, '__call__', fake_fetch)
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('_pictures')
+def test_dashboard_csrf_tokens(
+    create_new_user: User,
+    user_factory,
+    faker_seed: int,
+    picture_data: PictureData,
+) -> None:
+    """This test ensures that cached pictures have valid CSRF tokens."""
+    other_data: RegistrationData = user_factory(faker_seed + 1)
+    other_user = User.objects.create(**other_data)
+
+    for user in (create_new_user, other_user):
+        assert _add_favourite(user, picture_data) == HTTPStatus.FOUND
+        assert user.pictures.count() == 1
+
+
+@pytest.mark.django_db()
+def test_favourites_page_changes(
+    client: Client,
+    login: User,
+    picture_data: PictureData,
+) -> None:
+    """This test ensures that cached favourites are updated."""
+    client.get(reverse('pictures:favourites'))
+    client.post(reverse('pictures:dashboard'), data=picture_data)
+    response = client.get(reverse('pictures:favourites'))
+
+    assert picture_data['url'] in response.content.decode()
+
+
+def _add_favourite(user: User, picture_data: PictureData) -> int:
+    client = Client(enforce_csrf_checks=True)
+    client.force_login(user)
+    page = client.get(reverse('pictures:dashboard')).content.decode()
+    return client.post(reverse('pictures:dashboard'), data={
+        **picture_data,
+        'csrfmiddlewaretoken': _CSRF_TOKEN.findall(page)[-1],
+    }).status_code
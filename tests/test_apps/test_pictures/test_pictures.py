@@ -1,10 +1,28 @@
+import asyncio
 from http import HTTPStatus
+from typing import Any, Callable
+from urllib.parse import quote
 
 import pytest
-from django.test import Client
+import requests
+from django.http import HttpRequest
+from django.template.response import SimpleTemplateResponse
+from django.test import Client, RequestFactory
 from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
 
 from server.apps.identity.models import User
+from server.apps.pictures.intrastructure.services.placeholder import (
+    PictureResponse,
+)
+from server.apps.pictures.logic.usecases.favourites_list import FavouritesList
+from server.apps.pictures.logic.usecases.pictures_fetch import (
+    AsyncPicturesFetch,
+    PicturesFetch,
+)
+from server.apps.pictures.models import FavouritePicture
+from server.apps.pictures.views.pages import DashboardView
+from server.common.services.resilience import CircuitBreaker, circuit_breaker
 from tests.test_apps.test_pictures.conftest import FavAssertion, PictureData
 
 
@@ -27,3 +45,175 @@ def test_add_favourite_pictures(
         assert response.get('Location') == reverse('pictures:dashboard')
 
     assert_correct_favourite_pictures(login.email, picture_data_list)
+
+
+@pytest.mark.django_db()
+def test_add_favourite_picture_twice(
+    client: Client,
+    login: User,
+    picture_data: PictureData,
+) -> None:
+    """This test checks that repeated posts do not create duplicates."""
+    for _ in range(2):
+        response = client.post(reverse('pictures:dashboard'), data=picture_data)
+        assert response.status_code == HTTPStatus.FOUND
+
+    assert login.pictures.count() == 1
+
+
+@pytest.mark.django_db()
+def test_dashboard_pictures(
+    client: Client,
+    login: User,
+    picture_data: PictureData,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test checks that fetched pictures are shown on the dashboard."""
+    def fake_fetch(  # noqa: WPS430
+        *args,
+        **kwargs,
+    ) -> list[PictureResponse]:
+        return [PictureResponse(
+            id=picture_data['foreign_id'],
+            url=picture_data['url'],
+        )]
+
+    monkeypatch.setattr(PicturesFetch, '__call__', fake_fetch)
+    response = client.get(reverse('pictures:dashboard'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert picture_data['url'] in response.content.decode()
+
+
+@pytest.mark.django_db()
+def test_dashboard_pictures_asgi(
+    rf: RequestFactory,
+    login: User,
+    picture_data: PictureData,
+    settings: SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test checks that pictures are awaited in ASGI mode."""
+    async def fake_fetch(  # noqa: WPS430
+        *args,
+        **kwargs,
+    ) -> list[PictureResponse]:
+        return [PictureResponse(
+            id=picture_data['foreign_id'],
+            url=picture_data['url'],
+        )]
+
+    monkeypatch.setattr(AsyncPicturesFetch, '__call__', fake_fetch)
+    settings.ASYNC_VIEWS = True
+    dashboard = DashboardView.as_view()
+    request = rf.get(reverse('pictures:dashboard'))
+    request.user = login
+
+    response = asyncio.run(_render(dashboard, request))
+
+    assert asyncio.iscoroutinefunction(dashboard)
+    assert picture_data['url'] in response.content.decode()
+
+
+@pytest.mark.django_db()
+def test_favourite_pictures_page(
+    client: Client,
+    login: User,
+    picture_data: PictureData,
+) -> None:
+    """This test checks that favourite pictures are listed."""
+    client.post(reverse('pictures:dashboard'), data=picture_data)
+    response = client.get(reverse('pictures:favourites'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert picture_data['url'] in response.content.decode()
+
+
+@pytest.mark.django_db()
+def test_favourites_pagination(
+    create_new_user: User,
+    picture_data_list: list[PictureData],
+) -> None:
+    """This test checks that all favourites are listed page by page."""
+    FavouritePicture.objects.bulk_create([
+        FavouritePicture(user=create_new_user, **picture)
+        for picture in picture_data_list
+    ])
+
+    page = FavouritesList()(create_new_user.id, limit=2)
+    pictures = page.pictures
+    while page.next_cursor:
+        page = FavouritesList()(
+            create_new_user.id,
+            cursor=page.next_cursor,
+            limit=2,
+        )
+        pictures.extend(page.pictures)
+
+    assert [picture.foreign_id for picture in pictures] == [
+        picture['foreign_id'] for picture in picture_data_list
+    ]
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize('picture_data_list', [5], indirect=True)
+def test_favourites_next_page_limit(
+    client: Client,
+    login: User,
+    picture_data_list: list[PictureData],
+) -> None:
+    """This test checks that next pages keep the requested size."""
+    FavouritePicture.objects.bulk_create([
+        FavouritePicture(user=login, **picture)
+        for picture in picture_data_list
+    ])
+    page = FavouritesList()(login.id, limit=2)
+
+    response = client.get(reverse('pictures:favourites'), data={'limit': 2})
+
+    assert response.status_code == HTTPStatus.OK
+    assert page.next_cursor
+    assert '?cursor={0}&amp;limit=2"'.format(
+        quote(page.next_cursor),
+    ) in response.content.decode()
+
+
+@pytest.mark.django_db()
+def test_favourites_invalid_cursor(client: Client, login: User) -> None:
+    """This test checks that broken cursors are not found."""
+    response = client.get(
+        reverse('pictures:favourites'),
+        data={'cursor': 'broken'},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.django_db()
+def test_dashboard_api_unavailable(
+    client: Client,
+    login: User,
+    settings: SettingsWrapper,
+) -> None:
+    """This test checks that the dashboard works when the API is down."""
+    settings.PLACEHOLDER_API_BREAKER_FAILURES = 1
+    with pytest.raises(requests.ConnectionError):
+        _fail(circuit_breaker(settings.PLACEHOLDER_API_URL))
+
+    response = client.get(reverse('pictures:dashboard'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert 'picture-fecthed-item' not in response.content.decode()
+
+
+async def _render(
+    view: Callable[..., Any],
+    request: HttpRequest,
+) -> SimpleTemplateResponse:
+    response = await view(request)
+    return response.render()
+
+
+def _fail(breaker: CircuitBreaker) -> None:
+    with breaker():
+        raise requests.ConnectionError()
@@ -0,0 +1,50 @@
+from typing import List
+
+import pytest
+from django.core.management import call_command
+from pytest_django.fixtures import SettingsWrapper
+
+from server.apps.pictures.container import container
+from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
+
+_PICTURE = placeholder.PictureResponse(id=1, url='https://picture.com/1')
+
+
+@pytest.fixture()
+def fetched(
+    settings: SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+) -> List[int]:
+    """Limits that were fetched from the API."""
+    settings.PLACEHOLDER_API_WARM_LIMITS = [5, 10]
+    limits: List[int] = []
+
+    def fake_fetch(  # noqa: WPS430
+        _,
+        limit: int,
+    ) -> List[placeholder.PictureResponse]:
+        limits.append(limit)
+        return [_PICTURE]
+
+    monkeypatch.setattr(placeholder.PicturesFetch, '__call__', fake_fetch)
+    return limits
+
+
+def test_warm_up(fetched: List[int]) -> None:
+    """Ensures that users get warmed up feeds without API calls."""
+    call_command('warm_pictures', once=True)
+
+    pictures_fetch = container.instantiate(PicturesFetch)
+
+    assert pictures_fetch(limit=10) == [_PICTURE]
+    assert fetched == [5, 10]
+
+
+def test_warm_up_missing_only(fetched: List[int]) -> None:
+    """Ensures that booting workers do not refresh cached feeds."""
+    call_command('warm_pictures', once=True)
+    call_command('warm_pictures', once=True, missing_only=True)
+    call_command('warm_pictures', once=True)
+
+    assert fetched == [5, 10, 5, 10]
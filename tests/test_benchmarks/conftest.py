@@ -0,0 +1,11 @@
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+#: How many times each slow benchmark is repeated:
+ROUNDS = 20
+
+
+@pytest.fixture(autouse=True)
+def _ratelimit(settings: SettingsWrapper) -> None:
+    """Benchmarks send the same forms again and again."""
+    settings.RATELIMIT_ENABLE = False
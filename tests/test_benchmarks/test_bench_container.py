@@ -0,0 +1,28 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from server.apps.identity.container import container as identity_container
+from server.apps.identity.logic.usecases.lead_outbox_enqueue import (
+    LeadOutboxEnqueue,
+)
+from server.apps.pictures.container import container as pictures_container
+from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
+
+
+@pytest.mark.benchmark(group='container')
+def test_container_instantiate(benchmark: BenchmarkFixture) -> None:
+    """Baseline: inspecting and building a use-case on each request."""
+    pictures_fetch = benchmark(pictures_container.instantiate, PicturesFetch)
+
+    assert pictures_fetch is not pictures_container.instantiate(PicturesFetch)
+
+
+@pytest.mark.benchmark(group='container')
+def test_container_resolve(benchmark: BenchmarkFixture) -> None:
+    """Resolving a singleton use-case that is built once per worker."""
+    pictures_fetch = benchmark(pictures_container.resolve, PicturesFetch)
+
+    assert pictures_fetch is pictures_container.resolve(PicturesFetch)
+    assert identity_container.resolve(
+        LeadOutboxEnqueue,
+    ) is identity_container.resolve(LeadOutboxEnqueue)
@@ -0,0 +1,85 @@
+import io
+from http import HTTPStatus
+from typing import List, final
+
+import orjson
+import pydantic
+import pytest
+import requests
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from server.apps.pictures.intrastructure.services import placeholder
+from server.common import pydantic_model
+
+#: Big `_limit`, like the ones we see in production:
+_PICTURES_COUNT = 5000
+
+
+@final
+class _PydanticPicture(pydantic_model.BaseModel):
+    """How pictures were parsed before, kept to compare with."""
+
+    id: int
+    url: str
+
+
+@final
+class _Session(object):
+    def __init__(self, response: requests.Response) -> None:
+        self._response = response
+
+    def get(self, *args: object, **kwargs: object) -> requests.Response:
+        return self._response
+
+
+@pytest.fixture()
+def pictures_response() -> requests.Response:
+    """Response of Placeholder API with a lot of pictures."""
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response.raw = io.BytesIO(orjson.dumps([
+        {'id': index, 'url': 'https://via.placeholder.com/{0}'.format(index)}
+        for index in range(_PICTURES_COUNT)
+    ]))
+    return response
+
+
+@pytest.mark.benchmark(group='pictures')
+def test_pictures_pydantic(
+    benchmark: BenchmarkFixture,
+    pictures_response: requests.Response,
+) -> None:
+    """Baseline: decoding to `str` and building `pydantic` models."""
+    pictures = benchmark(
+        pydantic.parse_raw_as,
+        List[_PydanticPicture],
+        pictures_response.text,
+    )
+
+    assert len(pictures) == _PICTURES_COUNT
+
+
+@pytest.mark.benchmark(group='pictures')
+def test_pictures_fetch(
+    benchmark: BenchmarkFixture,
+    pictures_response: requests.Response,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Parsing raw bytes with `orjson` into slotted records."""
+    monkeypatch.setattr(
+        placeholder.PicturesFetch,
+        'session',
+        lambda _: _Session(pictures_response),
+    )
+    fetcher = placeholder.PicturesFetch(
+        api_url='https://placeholder.com',
+        api_timeout=1,
+    )
+
+    pictures = benchmark(fetcher, limit=_PICTURES_COUNT)
+
+    assert len(pictures) == _PICTURES_COUNT
+    assert pictures[1] == placeholder.PictureResponse(
+        id=1,
+        url='https://via.placeholder.com/1',
+    )
@@ -0,0 +1,69 @@
+import pytest
+from django.core.cache import BaseCache
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from server.apps.identity.container import container as identity_container
+from server.apps.identity.logic.usecases.lead_outbox_enqueue import (
+    LeadOutboxEnqueue,
+)
+from server.apps.identity.logic.usecases.lead_outbox_process import (
+    LeadOutboxProcess,
+)
+from server.apps.identity.models import LeadOutbox, User
+from server.apps.pictures.container import container as pictures_container
+from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
+from tests.test_benchmarks.conftest import ROUNDS
+
+pytestmark = pytest.mark.usefixtures('placeholder_api')
+
+_PICTURES_LIMIT = 500
+_OUTBOX_SIZE = 20
+
+
+@pytest.mark.benchmark(group='usecases')
+def test_pictures_fetch(
+    benchmark: BenchmarkFixture,
+    cache: BaseCache,
+) -> None:
+    """Fetching a big feed from the API, without cache."""
+    pictures_fetch = pictures_container.resolve(PicturesFetch)
+
+    pictures = benchmark.pedantic(
+        pictures_fetch,
+        args=(_PICTURES_LIMIT,),
+        setup=cache.clear,
+        rounds=ROUNDS,
+    )
+
+    assert len(pictures) == _PICTURES_LIMIT
+
+
+@pytest.mark.django_db()
+@pytest.mark.benchmark(group='usecases')
+def test_lead_outbox_process(
+    benchmark: BenchmarkFixture,
+    user_factory,
+    faker_seed: int,
+) -> None:
+    """Syncing a batch of new users with the API."""
+    users = [
+        User.objects.create(**user_factory(faker_seed + index))
+        for index in range(_OUTBOX_SIZE)
+    ]
+
+    lead_outbox_enqueue = identity_container.resolve(LeadOutboxEnqueue)
+    lead_outbox_process = identity_container.resolve(LeadOutboxProcess)
+
+    def reset_outbox() -> None:  # noqa: WPS430
+        User.objects.update(lead_id=None)
+        for user in users:
+            lead_outbox_enqueue(user)
+
+    processed = benchmark.pedantic(
+        lead_outbox_process,
+        setup=reset_outbox,
+        rounds=ROUNDS,
+    )
+
+    assert processed == _OUTBOX_SIZE
+    assert not LeadOutbox.objects.exists()
@@ -0,0 +1,111 @@
+import itertools
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import BaseCache
+from django.test import Client
+from django.urls import reverse
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from server.apps.identity.models import User
+from server.apps.pictures.models import FavouritePicture
+from tests.plugins.identity.users import RegistrationData
+from tests.test_benchmarks.conftest import ROUNDS
+
+_FAVOURITES_COUNT = 500
+
+pytestmark = [
+    pytest.mark.django_db(),
+    pytest.mark.usefixtures('placeholder_api'),
+]
+
+
+@pytest.mark.benchmark(group='views')
+@pytest.mark.usefixtures('login')
+def test_dashboard_cold(
+    benchmark: BenchmarkFixture,
+    client: Client,
+    cache: BaseCache,
+) -> None:
+    """Dashboard after cache misses: pictures are fetched from the API."""
+    response = benchmark.pedantic(
+        client.get,
+        args=(reverse('pictures:dashboard'),),
+        setup=cache.clear,
+        rounds=ROUNDS,
+    )
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.benchmark(group='views')
+@pytest.mark.usefixtures('login')
+def test_dashboard_warm(
+    benchmark: BenchmarkFixture,
+    client: Client,
+) -> None:
+    """Dashboard with everything cached."""
+    response = benchmark(client.get, reverse('pictures:dashboard'))
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.benchmark(group='views')
+def test_favourites(
+    benchmark: BenchmarkFixture,
+    client: Client,
+    login: User,
+) -> None:
+    """One page of favourites of a user that has a lot of them."""
+    FavouritePicture.objects.bulk_create([
+        FavouritePicture(
+            user=login,
+            foreign_id=index,
+            url='https://via.placeholder.com/{0}'.format(index),
+        )
+        for index in range(_FAVOURITES_COUNT)
+    ])
+
+    response = benchmark(client.get, reverse('pictures:favourites'))
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.benchmark(group='views')
+def test_registration(
+    benchmark: BenchmarkFixture,
+    client: Client,
+    user_factory,
+    faker_seed: int,
+) -> None:
+    """Registration of new users, the API is called later."""
+    seeds = itertools.count(faker_seed)
+
+    def register() -> int:  # noqa: WPS430
+        user_data = user_factory(next(seeds))
+        response = client.post(reverse('identity:registration'), data={
+            **user_data,
+            'password1': user_data['password'],
+            'password2': user_data['password'],
+        })
+        return response.status_code
+
+    assert benchmark.pedantic(register, rounds=ROUNDS) == HTTPStatus.FOUND
+
+
+@pytest.mark.benchmark(group='views')
+def test_user_update(
+    benchmark: BenchmarkFixture,
+    client: Client,
+    login: User,
+    new_user_data: RegistrationData,
+) -> None:
+    """Profile updates, the API is called later."""
+    response = benchmark.pedantic(
+        client.post,
+        args=(reverse('identity:user_update'),),
+        kwargs={'data': new_user_data},
+        rounds=ROUNDS,
+    )
+
+    assert response.status_code == HTTPStatus.FOUND
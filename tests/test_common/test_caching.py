@@ -0,0 +1,114 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Awaitable, Callable, List
+
+import pytest
+from django.core.cache import BaseCache
+
+from server.common.services import caching
+
+_KEY = 'some:key'
+
+# Only affects freshness checks, not the cache expiration itself:
+_far_future = SimpleNamespace(time=lambda: 10 ** 10)
+
+
+@pytest.fixture()
+def cached(cache: BaseCache) -> caching.StaleWhileRevalidate:
+    """Cache with short fresh and long stale periods."""
+    return caching.StaleWhileRevalidate(cache=cache, ttl=10, stale_ttl=100)
+
+
+@pytest.fixture()
+def calls() -> List[int]:
+    """Records all computations."""
+    return []
+
+
+@pytest.fixture()
+def compute(calls: List[int]) -> Callable[[], int]:
+    """Computation that returns the number of its call."""
+
+    def count_call() -> int:  # noqa: WPS430
+        calls.append(len(calls) + 1)
+        return len(calls)
+
+    return count_call
+
+
+@pytest.fixture()
+def acompute(compute: Callable[[], int]) -> Callable[[], Awaitable[int]]:
+    """Async version of the same computation."""
+
+    async def count_call_async() -> int:  # noqa: WPS430
+        return compute()
+
+    return count_call_async
+
+
+@pytest.fixture(autouse=True)
+def _blocking_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Waits for background refreshes to finish."""
+    monkeypatch.setattr(caching, '_in_background', _run_and_wait)
+
+
+def test_cache_miss(
+    cached: caching.StaleWhileRevalidate,
+    compute: Callable[[], int],
+    calls: List[int],
+) -> None:
+    """Ensures that missing values are computed and then reused."""
+    assert cached(_KEY, compute) == 1
+    assert cached(_KEY, compute) == 1
+    assert calls == [1]
+
+
+def test_stale_value(
+    cached: caching.StaleWhileRevalidate,
+    compute: Callable[[], int],
+    calls: List[int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that stale values are served and refreshed."""
+    cached(_KEY, compute)
+    monkeypatch.setattr(caching, 'time', _far_future)
+
+    assert cached(_KEY, compute) == 1  # stale one
+    assert calls == [1, 2]
+    assert cached(_KEY, compute) == 2
+
+
+def test_failed_refresh(
+    cached: caching.StaleWhileRevalidate,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that stale values survive failed refreshes."""
+    cached(_KEY, lambda: 1)
+    monkeypatch.setattr(caching, 'time', _far_future)
+
+    assert cached(_KEY, _broken) == 1
+    assert cached(_KEY, _broken) == 1
+
+
+def test_async_stale_value(
+    cached: caching.StaleWhileRevalidate,
+    acompute: Callable[[], Awaitable[int]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that async computations are cached and refreshed."""
+    assert asyncio.run(cached.acall(_KEY, acompute)) == 1
+    monkeypatch.setattr(caching, 'time', _far_future)
+
+    assert asyncio.run(cached.acall(_KEY, acompute)) == 1  # stale one
+    assert asyncio.run(cached.acall(_KEY, acompute)) == 2
+
+
+def _broken() -> int:
+    raise ConnectionError('Upstream is down')
+
+
+def _run_and_wait(callback: Callable[[], None]) -> None:
+    thread = threading.Thread(target=callback)
+    thread.start()
+    thread.join()
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from server.common import instrumentation
+from server.common.services import http
+
+
+class _Fetcher(http.BaseFetcher):
+    _url_path = '/some'
+
+
+_fetcher = _Fetcher(api_url='https://first.com', api_timeout=1)
+
+
+def test_shared_session() -> None:
+    """Ensures that all fetchers reuse the same pooled session."""
+    second = _Fetcher(api_url='https://second.com', api_timeout=2)
+    adapter = _fetcher.session().get_adapter(_fetcher.url_path())
+
+    assert _fetcher.session() is second.session()
+    assert isinstance(adapter, HTTPAdapter)
+
+
+def test_session_after_fork() -> None:
+    """Ensures that forked processes do not share sockets with parents."""
+    read_end, write_end = os.pipe()
+
+    parent_session = _fetcher.session()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        is_shared = _fetcher.session() is parent_session
+        os.write(write_end, b'1' if is_shared else b'0')
+        os._exit(0)  # noqa: WPS437
+
+    os.waitpid(pid, 0)
+    assert os.read(read_end, 1) == b'0'
+
+
+def test_failed_calls_recorded(settings) -> None:
+    """Ensures that calls without responses are recorded with retries."""
+    token = instrumentation.start()
+
+    with pytest.raises(requests.ConnectionError):
+        _fetcher.session().get('http://127.0.0.1:1/', timeout=1)
+    stats = instrumentation.stop(token)
+
+    assert stats.upstream_calls == settings.PLACEHOLDER_API_RETRIES + 1
+    assert stats.upstream_time > 0
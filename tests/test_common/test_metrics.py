@@ -0,0 +1,45 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from server.common import metrics
+
+
+@metrics.measured(metrics.USECASE_LATENCY)
+class _Failing(object):
+    def __call__(self) -> None:
+        raise ValueError('failed')
+
+
+def _count(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_usecase_failure() -> None:
+    """Ensures that failed calls are labeled with the exception."""
+    before = _count(
+        'usecase_latency_seconds_count',
+        usecase='_Failing',
+        status='ValueError',
+    )
+
+    with pytest.raises(ValueError, match='failed'):
+        _Failing()()
+
+    assert _count(
+        'usecase_latency_seconds_count',
+        usecase='_Failing',
+        status='ValueError',
+    ) == before + 1
+
+
+@pytest.mark.django_db()
+def test_metrics_endpoint(client: Client) -> None:
+    """Ensures that views are measured and exposed."""
+    client.get(reverse('index'))
+
+    response = client.get(reverse('metrics'))
+
+    assert b'view_latency_seconds_bucket{' in response.content
+    assert b'view="index"' in response.content
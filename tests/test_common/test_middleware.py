@@ -0,0 +1,65 @@
+import pytest
+import structlog
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from pytest_django.fixtures import SettingsWrapper
+
+from server.common import instrumentation
+from server.common.django.middleware import RequestStatsMiddleware
+
+_UPSTREAM_TIME_MS = 500
+
+
+@pytest.fixture(autouse=True)
+def _clear_contextvars() -> None:
+    """Stats are bound to the logging context."""
+    structlog.contextvars.clear_contextvars()
+
+
+def _view(request: HttpRequest) -> HttpResponse:
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    instrumentation.record_upstream(_UPSTREAM_TIME_MS / 1000)
+    return HttpResponse(b'content', headers={'Content-Length': '7'})
+
+
+@pytest.mark.django_db()
+def test_sampled_request(
+    settings: SettingsWrapper,
+    rf: RequestFactory,
+) -> None:
+    """Ensures that sampled requests have all the stats."""
+    settings.REQUEST_STATS_SAMPLE_RATE = 1
+
+    RequestStatsMiddleware(_view)(rf.get('/some'))
+
+    stats = structlog.contextvars.get_contextvars()
+    assert stats['path'] == '/some'
+    assert stats['response_size'] == '7'
+    assert stats['db_queries'] == 1
+    assert stats['upstream_calls'] == 1
+    assert stats['upstream_time_ms'] == _UPSTREAM_TIME_MS
+
+
+@pytest.mark.django_db()
+def test_not_sampled_request(
+    settings: SettingsWrapper,
+    rf: RequestFactory,
+) -> None:
+    """Ensures that fast requests are not logged without sampling."""
+    settings.REQUEST_STATS_SAMPLE_RATE = 0
+
+    RequestStatsMiddleware(_view)(rf.get('/some'))
+
+    assert not structlog.contextvars.get_contextvars()
+
+
+def test_nested_stats() -> None:
+    """This test ensures that nested stats are added to the outer ones."""
+    outer = instrumentation.start()
+    inner = instrumentation.start()
+    instrumentation.record_upstream(_UPSTREAM_TIME_MS / 1000)
+
+    assert instrumentation.stop(inner).upstream_calls == 1
+    assert instrumentation.stop(outer).upstream_calls == 1
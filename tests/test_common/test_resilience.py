@@ -0,0 +1,91 @@
+from typing import Optional
+
+import pytest
+import requests
+from django.core.cache import BaseCache
+from pytest_django.fixtures import SettingsWrapper
+
+from server.common.services import http, resilience
+
+
+class _Fetcher(http.BaseFetcher):
+    _url_path = '/some'
+
+    def __call__(self, error: Optional[Exception] = None) -> None:
+        if error is not None:
+            raise error
+
+
+_fetcher = _Fetcher(api_url='https://breaker.com', api_timeout=1)
+
+
+@pytest.fixture(autouse=True)
+def _breaker(settings: SettingsWrapper) -> None:
+    settings.PLACEHOLDER_API_BREAKER_FAILURES = 2
+
+
+def test_breaker_opens() -> None:
+    """Ensures that failing API is not called for a while."""
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            _fetcher(requests.ConnectionError())
+
+    with pytest.raises(resilience.ServiceUnavailableError, match='Circuit'):
+        _fetcher()
+    assert resilience.circuit_breaker('https://breaker.com').is_open()
+
+
+def test_breaker_closes(cache: BaseCache) -> None:
+    """Ensures that successful trial call closes the breaker."""
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            _fetcher(requests.ConnectionError())
+    cache.delete('breaker:https://breaker.com:open')  # reset timeout passed
+
+    _fetcher()
+
+    assert not resilience.circuit_breaker('https://breaker.com').is_open()
+    assert cache.get('breaker:https://breaker.com:half_open') is None
+    assert cache.get('breaker:https://breaker.com:failures') is None
+
+
+def test_breaker_probe_released(cache: BaseCache) -> None:
+    """Ensures that trial call with a client error allows the next one."""
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            _fetcher(requests.ConnectionError())
+    cache.delete('breaker:https://breaker.com:open')  # reset timeout passed
+    response = requests.Response()
+    response.status_code = 404
+
+    with pytest.raises(requests.HTTPError):
+        _fetcher(requests.HTTPError(response=response))
+    _fetcher()
+
+    assert cache.get('breaker:https://breaker.com:half_open') is None
+
+
+def test_client_errors_ignored() -> None:
+    """Ensures that client errors do not open the breaker."""
+    response = requests.Response()
+    response.status_code = 404
+
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            _fetcher(requests.HTTPError(response=response))
+
+    assert not resilience.circuit_breaker('https://breaker.com').is_open()
+
+
+def test_bulkhead_full() -> None:
+    """Ensures that extra concurrent calls are rejected."""
+    bulkhead = resilience.Bulkhead('/some', size=1)
+
+    with bulkhead:
+        with pytest.raises(resilience.ServiceUnavailableError, match='full'):
+            _use(bulkhead)
+
+
+def _use(bulkhead: resilience.Bulkhead) -> None:
+    with bulkhead:
+        raise AssertionError('Must not be called')
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Sequence
+
+import pytest
+from django.core.cache import BaseCache, caches
+
+from server.common.services.single_flight import SingleFlight, for_api
+
+_KEY = 'some:key'
+_CALLERS = 5
+
+#: Enough for all callers to start waiting:
+_DELAY = 0.2
+
+
+@pytest.fixture()
+def flight(cache: BaseCache) -> SingleFlight:
+    """Coalesces computations in the test cache."""
+    return SingleFlight(cache=cache, timeout=1)
+
+
+@pytest.fixture()
+def calls() -> List[int]:
+    """Records all computations."""
+    return []
+
+
+@pytest.fixture()
+def release() -> threading.Event:
+    """Computations wait for it."""
+    return threading.Event()
+
+
+@pytest.fixture()
+def compute(
+    calls: List[int],
+    release: threading.Event,
+) -> Callable[[], int]:
+    """Slow computation that returns the number of its call."""
+
+    def count_call_slowly() -> int:  # noqa: WPS430
+        calls.append(len(calls) + 1)
+        release.wait(timeout=1)
+        return len(calls)
+
+    return count_call_slowly
+
+
+def test_concurrent_calls(
+    flight: SingleFlight,
+    compute: Callable[[], int],
+    calls: List[int],
+    release: threading.Event,
+) -> None:
+    """Ensures that concurrent callers share a single computation."""
+    with ThreadPoolExecutor(max_workers=_CALLERS) as executor:
+        futures = [
+            executor.submit(_fly, flight, compute) for _ in range(_CALLERS)
+        ]
+        threading.Timer(_DELAY, release.set).start()
+
+    assert {future.result() for future in futures} == {1}
+    assert calls == [1]
+
+
+def test_sequential_calls(
+    flight: SingleFlight,
+    compute: Callable[[], int],
+    release: threading.Event,
+) -> None:
+    """Ensures that finished flights are not reused."""
+    release.set()
+
+    assert flight(_KEY, compute) == 1
+    assert flight(_KEY, compute) == 2
+
+
+def test_shared_errors(
+    flight: SingleFlight,
+    calls: List[int],
+    release: threading.Event,
+) -> None:
+    """Ensures that waiting callers get the error of the computation."""
+    def fail_slowly() -> int:  # noqa: WPS430
+        calls.append(1)
+        release.wait(timeout=1)
+        raise ValueError('failed')
+
+    with ThreadPoolExecutor(max_workers=_CALLERS) as executor:
+        futures = [
+            executor.submit(_fly, flight, fail_slowly) for _ in range(_CALLERS)
+        ]
+        threading.Timer(_DELAY, release.set).start()
+
+    for future in futures:
+        with pytest.raises(ValueError, match='failed'):
+            future.result()
+    assert calls == [1]
+
+
+def test_other_process(
+    flight: SingleFlight,
+    cache: BaseCache,
+    compute: Callable[[], int],
+    calls: List[int],
+) -> None:
+    """Ensures that results of other processes are shared."""
+    cache.add('{0}:flight'.format(_KEY), 1)
+    threading.Timer(_DELAY, lambda: cache.set_many({
+        '{0}:flight:result'.format(_KEY): 0,
+    })).start()
+
+    assert flight(_KEY, compute) == 0
+    assert not calls
+
+
+def test_other_process_failed(
+    flight: SingleFlight,
+    cache: BaseCache,
+    compute: Callable[[], int],
+    release: threading.Event,
+) -> None:
+    """Ensures that callers compute themselves when other process fails."""
+    cache.add('{0}:flight'.format(_KEY), 1)
+    threading.Timer(_DELAY, cache.delete, ['{0}:flight'.format(_KEY)]).start()
+    release.set()
+
+    assert flight(_KEY, compute) == 1
+
+
+def test_timeout(
+    cache: BaseCache,
+    compute: Callable[[], int],
+    calls: List[int],
+    release: threading.Event,
+) -> None:
+    """Ensures that callers stop waiting for slow computations."""
+    flight = SingleFlight(cache=cache, timeout=_DELAY / 2)
+    threading.Timer(_DELAY, release.set).start()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        slow = executor.submit(_fly, flight, compute)
+        fallback = executor.submit(_fly, flight, compute)
+
+        assert fallback.result() == 2
+        assert slow.result() == 2
+    assert calls == [1, 2]
+
+
+def test_tiered_cache(
+    settings,
+    cache: BaseCache,
+    compute: Callable[[], int],
+    release: threading.Event,
+) -> None:
+    """Ensures that locks are never cached by the local tier of responses."""
+    settings.CACHES = {
+        **settings.CACHES,
+        'tiered': {
+            'BACKEND': 'server.common.django.cache.TieredCache',
+            'LOCATION': 'test',
+        },
+    }
+    settings.PLACEHOLDER_API_CACHE = 'tiered'
+    flight = for_api()
+    caches['tiered'].clear()  # local tier is shared by the whole process
+    cache.add('{0}:flight'.format(_KEY), 1)
+    threading.Timer(_DELAY, cache.delete, ['{0}:flight'.format(_KEY)]).start()
+    release.set()
+
+    assert flight(_KEY, compute) == 1
+    assert caches['tiered'].get('{0}:flight'.format(_KEY)) is None
+
+
+def test_async_concurrent_calls(
+    flight: SingleFlight,
+    compute: Callable[[], int],
+    calls: List[int],
+    release: threading.Event,
+) -> None:
+    """Ensures that concurrent coroutines share a single computation."""
+    async def count_call_async() -> int:  # noqa: WPS430
+        release.set()
+        return compute()
+
+    coroutines = [flight.acall(_KEY, count_call_async) for _ in range(_CALLERS)]
+
+    assert set(asyncio.run(_gather(coroutines))) == {1}
+    assert calls == [1]
+
+
+def _fly(flight: SingleFlight, compute: Callable[[], int]) -> int:
+    return flight(_KEY, compute)
+
+
+async def _gather(coroutines: Sequence[Awaitable[int]]) -> List[int]:
+    return await asyncio.gather(*coroutines)
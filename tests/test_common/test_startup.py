@@ -0,0 +1,35 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from server.common.django import startup
+
+_IMPORT_TIMES = """
+import time: self [us] | cumulative | imported package
+import time:       150 |        150 |     django.utils.version
+import time:      1200 |       1350 |   django
+"""
+
+
+def test_import_times() -> None:
+    """Ensures that the output of `-X importtime` is parsed."""
+    nested, top_level = startup.parse_import_times(_IMPORT_TIMES)
+
+    assert nested.module == 'django.utils.version'
+    assert nested.self_time == nested.cumulative
+    assert top_level.module == 'django'
+    assert top_level.self_time + nested.cumulative == pytest.approx(
+        top_level.cumulative,
+    )
+
+
+def test_startup_profile() -> None:
+    """Ensures that a fresh worker is measured."""
+    stdout = StringIO()
+
+    call_command('startup_profile', limit=1, stdout=stdout)
+
+    report = stdout.getvalue()
+    assert 'Slowest imports' in report
+    assert 'ms identity' in report
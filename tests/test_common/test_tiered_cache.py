@@ -0,0 +1,42 @@
+import pytest
+from django.core.cache import BaseCache
+
+from server.common.django.cache import TieredCache
+
+_KEY = 'some:key'
+
+
+@pytest.fixture()
+def tiered(cache: BaseCache) -> TieredCache:
+    """Local tier in front of the test cache."""
+    tiered_cache = TieredCache('test', {'OPTIONS': {'MAX_ENTRIES': 2}})
+    tiered_cache.clear()  # local tier is shared by the whole process
+    return tiered_cache
+
+
+def test_local_tier(tiered: TieredCache, cache: BaseCache) -> None:
+    """Ensures that values are served locally after the first read."""
+    cache.set(_KEY, 1)
+
+    assert tiered.get(_KEY) == 1
+    cache.set(_KEY, 2)  # other worker changed the shared value
+    assert tiered.get(_KEY) == 1
+
+
+def test_local_tier_writes(tiered: TieredCache, cache: BaseCache) -> None:
+    """Ensures that writes and deletes go to both tiers."""
+    tiered.set(_KEY, 1)
+    assert cache.get(_KEY) == 1
+
+    tiered.delete(_KEY)
+    assert tiered.get(_KEY) is None
+    assert cache.get(_KEY) is None
+
+
+def test_counters(tiered: TieredCache, cache: BaseCache) -> None:
+    """Ensures that counters are always shared."""
+    tiered.set(_KEY, 1)
+    cache.incr(_KEY)  # other worker
+
+    assert tiered.incr(_KEY) == 3
+    assert tiered.get(_KEY) == 3
@@ -0,0 +1,49 @@
+from http import HTTPStatus
+from urllib.parse import urljoin
+
+import requests
+
+_LIMIT = 3
+
+
+def test_photos_limit(placeholder_server: str) -> None:
+    """Ensures that photos are listed up to `_limit`."""
+    response = requests.get(
+        urljoin(placeholder_server, 'photos'),
+        params={'_limit': _LIMIT},
+        timeout=1,
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [photo['id'] for photo in response.json()] == [1, 2, 3]
+
+
+def test_user_create(placeholder_server: str) -> None:
+    """Ensures that created users get new ids."""
+    responses = [
+        requests.post(
+            urljoin(placeholder_server, 'users'),
+            json={'email': 'some@example.com'},
+            timeout=1,
+        )
+        for _ in range(2)
+    ]
+    users = [response.json() for response in responses]
+
+    assert {response.status_code for response in responses} == {
+        HTTPStatus.CREATED,
+    }
+    assert users[0]['id'] != users[1]['id']
+    assert users[0]['email'] == 'some@example.com'
+
+
+def test_user_update(placeholder_server: str) -> None:
+    """Ensures that users are updated by their ids."""
+    response = requests.patch(
+        urljoin(placeholder_server, 'users/11'),
+        json={'email': 'some@example.com'},
+        timeout=1,
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'email': 'some@example.com', 'id': 11}
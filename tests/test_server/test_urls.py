@@ -1,7 +1,11 @@
 from http import HTTPStatus
+from typing import Any, Iterable, Iterator
 
 import pytest
 from django.test import Client
+from django.urls import URLResolver, get_resolver
+
+from server.common.django.urls import lazy_include
 
 
 @pytest.mark.django_db()
@@ -53,3 +57,32 @@ def test_specials_txt(client: Client, page: str) -> None:
 
     assert response.status_code == HTTPStatus.OK
     assert response.get('Content-Type') == 'text/plain'
+
+
+def _app_views(patterns: Iterable[Any]) -> Iterator[Any]:
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _app_views(pattern.url_patterns)
+        elif pattern.callback.__module__.startswith('server.apps.'):
+            yield getattr(pattern.callback, 'view_class', pattern.callback)
+
+
+@pytest.mark.parametrize(
+    'view',
+    list(_app_views(get_resolver().url_patterns)),
+    ids=lambda view: view.__name__,
+)
+def test_request_budgets(view: Any) -> None:
+    """This test ensures that all our views declare request budgets."""
+    assert getattr(view, 'request_budgets', None)
+
+
+def test_lazy_admin() -> None:
+    """This test ensures that lazy admin is imported on the first request."""
+    resolver = lazy_include('admin/', 'server.admin_urls')
+
+    assert not resolver.url_patterns
+    assert resolver.resolve('admin/doc/').url_name == (
+        'django-admindocs-docroot'
+    )
+    assert resolver.url_patterns